@@ -0,0 +1,54 @@
+"""
+Numeric kernels for GitHub Productivity Dashboard visualizations.
+
+This module contains the array routines used when building charts. They
+are compiled with Numba when it is installed and fall back to pandas'
+built-in window operations otherwise.
+"""
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _moving_average_pandas(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing moving average using pandas' rolling window mean."""
+    return pd.Series(values, dtype=np.float64).rolling(window, min_periods=1).mean().to_numpy()
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _moving_average_numba(values, window):
+        """Trailing moving average as a single running-sum loop."""
+        n = values.shape[0]
+        out = np.empty(n, dtype=np.float64)
+        running = 0.0
+        for i in range(n):
+            running += values[i]
+            if i >= window:
+                running -= values[i - window]
+            out[i] = running / min(i + 1, window)
+        return out
+
+
+def moving_average(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Calculate a trailing moving average with partial windows at the start.
+    
+    Args:
+        values: 1-D array of values ordered by time
+        window: Window size in points
+    
+    Returns:
+        Array of averages, one per input value
+    """
+    if NUMBA_AVAILABLE:
+        # Own kernel rather than rolling(engine='numba'): pandas recompiles
+        # that engine in every new process, while this one is cached on disk
+        return _moving_average_numba(np.ascontiguousarray(values), window)
+    return _moving_average_pandas(values, window)
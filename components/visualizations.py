@@ -5,16 +5,268 @@ This module contains Plotly-based interactive charts and visualizations
 for displaying productivity metrics and trends.
 """
 
+import hashlib
+import weakref
+from types import SimpleNamespace
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
 from models.metrics import ProductivityMetrics, VelocityPoint
+from components._fastmath import moving_average
 
 
+# Fingerprints of live metrics objects keyed by id(); each entry is
+# dropped when its object is garbage collected, before the id can be reused
+_fingerprints: Dict[int, str] = {}
+
+
+def _metrics_fingerprint(metrics: ProductivityMetrics) -> str:
+    """
+    Create a content hash of a metrics object for use as a cache key.
+    
+    The hash is computed once per metrics object and reused by every cached
+    chart builder, so metrics must not be mutated after they are rendered.
+    
+    Args:
+        metrics: ProductivityMetrics to fingerprint
+    
+    Returns:
+        str: Hex digest covering the period, all sub-metrics and velocity points
+    """
+    key = id(metrics)
+    fingerprint = _fingerprints.get(key)
+    if fingerprint is None:
+        # The dataclass repr includes every field, including each VelocityPoint
+        fingerprint = hashlib.blake2b(repr(metrics).encode(), digest_size=16).hexdigest()
+        _fingerprints[key] = fingerprint
+        weakref.finalize(metrics, _fingerprints.pop, key, None)
+    return fingerprint
+
+
+def _build_empty_figure(message: str, title: str, xaxis_title: Optional[str] = None,
+                        yaxis_title: Optional[str] = None) -> go.Figure:
+    """
+    Create a placeholder chart showing a "no data" message.
+    
+    Args:
+        message: Text displayed in the middle of the chart
+        title: Chart title
+        xaxis_title: Optional x-axis title
+        yaxis_title: Optional y-axis title
+    
+    Returns:
+        Plotly figure object
+    """
+    fig = go.Figure()
+    fig.add_annotation(
+        text=message,
+        xref="paper", yref="paper",
+        x=0.5, y=0.5, xanchor='center', yanchor='middle',
+        showarrow=False, font=dict(size=16, color="gray")
+    )
+    
+    layout = {'title': title}
+    if xaxis_title:
+        layout['xaxis_title'] = xaxis_title
+    if yaxis_title:
+        layout['yaxis_title'] = yaxis_title
+    fig.update_layout(**layout)
+    
+    return fig
+
+
+# Empty-state figures keyed by chart title. Figures are serialized before being
+# sent to the browser, so the same instance can be returned on every call.
+_EMPTY_FIGURES = {
+    title: _build_empty_figure(message, title, xaxis_title, yaxis_title)
+    for message, title, xaxis_title, yaxis_title in [
+        ("No velocity data available", "Commit Frequency Trends", "Date", "Commits per Day"),
+        ("No velocity data available", "Code Volume Trends", "Date", "Lines of Code"),
+        ("No velocity data available", "Velocity Overview", None, None),
+        ("No pull request data available", "Pull Request Status Distribution", None, None),
+        ("No issue data available", "Issue Resolution Status", None, None),
+    ]
+}
+
+
+# Series longer than this are drawn with WebGL traces instead of SVG
+_WEBGL_POINT_THRESHOLD = 2000
+
+
+def _scatter_trace_class(n_points: int) -> type:
+    """
+    Choose the scatter trace class for a time series of the given length.
+    
+    Args:
+        n_points: Number of points in the series
+    
+    Returns:
+        go.Scattergl for long series (rendered with WebGL), otherwise go.Scatter
+    """
+    return go.Scattergl if n_points > _WEBGL_POINT_THRESHOLD else go.Scatter
+
+
+# Bar labels for the issue performance chart: three counts, then hours
+_ISSUE_PERFORMANCE_TEXT_TEMPLATES = ('%{y:.0f}', '%{y:.0f}', '%{y:.0f}', '%{y:.1f}')
+
+
+# Status names and colors for the PR and issue donut charts, in slice order
+_PR_STATUS_NAMES = np.array(['Merged', 'Open', 'Closed'])
+_PR_STATUS_COLORS = np.array(['#2ca02c', '#1f77b4', '#d62728'])
+_ISSUE_STATUS_NAMES = np.array(['Closed', 'Open'])
+_ISSUE_STATUS_COLORS = np.array(['#2ca02c', '#ff7f0e'])
+
+
+def _status_slices(names: np.ndarray, counts: List[int], colors: np.ndarray) -> tuple:
+    """
+    Select the non-empty slices of a status donut chart.
+    
+    Args:
+        names: Status names, one per slice
+        counts: Count for each status, in the same order as names
+        colors: Slice color for each status
+    
+    Returns:
+        Tuple of (labels, values, colors) for the statuses with a positive count
+    """
+    counts = np.asarray(counts)
+    mask = counts > 0
+    values = counts[mask]
+    labels = [f'{name} ({count})' for name, count in zip(names[mask], values)]
+    return labels, values, colors[mask].tolist()
+
+
+# Cache decorator for chart builders: unchanged metrics and filter inputs
+# return the previously built figure instead of reconstructing it each rerun
+_cache_chart = st.cache_data(
+    show_spinner=False,
+    max_entries=64,
+    hash_funcs={ProductivityMetrics: _metrics_fingerprint}
+)
+
+
+@_cache_chart
+def _velocity_soa(metrics: ProductivityMetrics) -> Dict[str, np.ndarray]:
+    """
+    Build a struct-of-arrays view of the velocity trends, sorted by timestamp.
+    
+    Args:
+        metrics: ProductivityMetrics containing velocity trends
+    
+    Returns:
+        Dictionary of NumPy arrays keyed by series name
+    """
+    velocity_data = metrics.velocity_trends
+    # Drop tzinfo so the arrays keep each point's wall-clock date
+    ts = np.array([vp.timestamp.replace(tzinfo=None) for vp in velocity_data],
+                  dtype='datetime64[ns]')
+    order = np.argsort(ts, kind='stable')
+    
+    def column(attr: str) -> np.ndarray:
+        return np.fromiter((getattr(vp, attr) for vp in velocity_data),
+                           dtype=np.int64, count=len(velocity_data))[order]
+    
+    soa = {
+        'ts': ts[order],
+        'commits': column('commits'),
+        'additions': column('additions'),
+        'deletions': column('deletions'),
+        'prs': column('pull_requests'),
+        'issues': column('issues_closed'),
+    }
+    soa['total'] = soa['additions'] + soa['deletions']
+    soa['ts_date'] = soa['ts'].astype('datetime64[D]')
+    return soa
+
+
+def _filter_velocity(soa: Dict[str, np.ndarray],
+                     date_range: Optional[tuple] = None) -> Dict[str, np.ndarray]:
+    """
+    Restrict the velocity arrays to an inclusive (start_date, end_date) range.
+    
+    The arrays are sorted by timestamp, so the range is located with two
+    binary searches and returned as views rather than copies.
+    
+    Args:
+        soa: Arrays returned by _velocity_soa
+        date_range: Optional tuple of (start_date, end_date) for filtering
+    
+    Returns:
+        Dictionary of NumPy arrays limited to the date range
+    """
+    if not date_range:
+        return soa
+    
+    start_date, end_date = date_range
+    ts_date = soa['ts_date']
+    lo = np.searchsorted(ts_date, np.datetime64(start_date), side='left')
+    hi = np.searchsorted(ts_date, np.datetime64(end_date), side='right')
+    return {name: values[lo:hi] for name, values in soa.items()}
+
+
+@st.cache_resource(
+    show_spinner=False,
+    max_entries=8,
+    hash_funcs={ProductivityMetrics: _metrics_fingerprint}
+)
+def _metrics_view(metrics: ProductivityMetrics) -> SimpleNamespace:
+    """
+    Get the derived values the section renderers read repeatedly for a metrics object.
+    
+    Keyed by content like the chart builders, so both are invalidated together
+    when the metrics change. The view is only read, so it is returned uncopied.
+    
+    Args:
+        metrics: ProductivityMetrics being rendered
+    
+    Returns:
+        SimpleNamespace with start_d, end_d and the velocity arrays
+    """
+    return SimpleNamespace(
+        start_d=metrics.period_start.date(),
+        end_d=metrics.period_end.date(),
+        velocity=_velocity_soa(metrics)
+    )
+
+
+def _velocity_summary(velocity_data: Dict[str, np.ndarray]) -> Optional[Dict[str, Any]]:
+    """
+    Compute the summary statistics shown under the time-series charts.
+    
+    Args:
+        velocity_data: Velocity arrays, typically already filtered by date range
+    
+    Returns:
+        Dictionary of summary statistics, or None if there are no data points
+    """
+    days = len(velocity_data['ts'])
+    if not days:
+        return None
+    
+    # One reduction over the stacked columns instead of a pass per metric
+    totals = np.stack([
+        velocity_data['commits'], velocity_data['additions'], velocity_data['deletions'],
+        velocity_data['prs'], velocity_data['issues']
+    ]).sum(axis=1)
+    commits_total, additions_total, deletions_total, prs_total, issues_total = (int(t) for t in totals)
+    
+    return {
+        'commits_total': commits_total,
+        'commits_mean': commits_total / days,
+        'commits_max': int(velocity_data['commits'].max()),
+        'additions_total': additions_total,
+        'deletions_total': deletions_total,
+        'net_changes': additions_total - deletions_total,
+        'prs_total': prs_total,
+        'issues_total': issues_total,
+        'changes_total': additions_total + deletions_total
+    }
+
+
+@_cache_chart
 def create_commit_frequency_chart(metrics: ProductivityMetrics, 
                                  date_range: Optional[tuple] = None,
                                  developer_filter: Optional[str] = None) -> go.Figure:
@@ -30,71 +282,48 @@ def create_commit_frequency_chart(metrics: ProductivityMetrics,
         Plotly figure object
     """
     if not metrics.velocity_trends:
-        # Create empty chart with message
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No velocity data available",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, xanchor='center', yanchor='middle',
-            showarrow=False, font=dict(size=16, color="gray")
-        )
-        fig.update_layout(
-            title="Commit Frequency Trends",
-            xaxis_title="Date",
-            yaxis_title="Commits per Day"
-        )
-        return fig
-    
-    # Filter data by date range if provided
-    velocity_data = metrics.velocity_trends
-    if date_range:
-        start_date, end_date = date_range
-        velocity_data = [
-            vp for vp in velocity_data 
-            if start_date <= vp.timestamp.date() <= end_date
-        ]
+        # Shared "no data" figure, built once at import time
+        return _EMPTY_FIGURES["Commit Frequency Trends"]
     
-    # Sort by timestamp
-    velocity_data = sorted(velocity_data, key=lambda x: x.timestamp)
+    # Filter data by date range if provided (arrays are already sorted by timestamp)
+    velocity_data = _filter_velocity(_velocity_soa(metrics), date_range)
     
     # Extract data for plotting
-    dates = [vp.timestamp for vp in velocity_data]
-    commits = [vp.commits for vp in velocity_data]
+    dates = velocity_data['ts']
+    commits = velocity_data['commits']
     
-    # Create the figure
-    fig = go.Figure()
+    scatter = _scatter_trace_class(len(dates))
     
-    # Add commit frequency line
-    fig.add_trace(go.Scatter(
+    # Commit frequency line
+    traces = [scatter(
         x=dates,
         y=commits,
         mode='lines+markers',
         name='Daily Commits',
-        line=dict(color='#1f77b4', width=2),
-        marker=dict(size=6, color='#1f77b4'),
+        line_color='#1f77b4', line_width=2,
+        marker_size=6, marker_color='#1f77b4',
         hovertemplate='<b>%{x}</b><br>Commits: %{y}<extra></extra>'
-    ))
+    )]
     
     # Add trend line if we have enough data points
-    if len(velocity_data) > 2:
+    if len(commits) > 2:
         # Calculate simple moving average (7-day window)
         window_size = min(7, len(commits))
         if window_size > 1:
-            moving_avg = []
-            for i in range(len(commits)):
-                start_idx = max(0, i - window_size + 1)
-                avg = sum(commits[start_idx:i+1]) / (i - start_idx + 1)
-                moving_avg.append(avg)
-            
-            fig.add_trace(go.Scatter(
+            moving_avg = moving_average(commits, window_size)
+
+            traces.append(scatter(
                 x=dates,
                 y=moving_avg,
                 mode='lines',
                 name=f'{window_size}-Day Average',
-                line=dict(color='#ff7f0e', width=2, dash='dash'),
+                line_color='#ff7f0e', line_width=2, line_dash='dash',
                 hovertemplate='<b>%{x}</b><br>Average: %{y:.1f}<extra></extra>'
             ))
     
+    # Create the figure with all traces in one pass
+    fig = go.Figure(data=traces)
+    
     # Update layout
     fig.update_layout(
         title="Commit Frequency Trends",
@@ -115,6 +344,7 @@ def create_commit_frequency_chart(metrics: ProductivityMetrics,
     return fig
 
 
+@_cache_chart
 def create_code_volume_chart(metrics: ProductivityMetrics,
                            date_range: Optional[tuple] = None,
                            developer_filter: Optional[str] = None) -> go.Figure:
@@ -130,74 +360,50 @@ def create_code_volume_chart(metrics: ProductivityMetrics,
         Plotly figure object
     """
     if not metrics.velocity_trends:
-        # Create empty chart with message
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No velocity data available",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, xanchor='center', yanchor='middle',
-            showarrow=False, font=dict(size=16, color="gray")
-        )
-        fig.update_layout(
-            title="Code Volume Trends",
-            xaxis_title="Date",
-            yaxis_title="Lines of Code"
-        )
-        return fig
+        # Shared "no data" figure, built once at import time
+        return _EMPTY_FIGURES["Code Volume Trends"]
     
-    # Filter data by date range if provided
-    velocity_data = metrics.velocity_trends
-    if date_range:
-        start_date, end_date = date_range
-        velocity_data = [
-            vp for vp in velocity_data 
-            if start_date <= vp.timestamp.date() <= end_date
-        ]
-    
-    # Sort by timestamp
-    velocity_data = sorted(velocity_data, key=lambda x: x.timestamp)
+    # Filter data by date range if provided (arrays are already sorted by timestamp)
+    velocity_data = _filter_velocity(_velocity_soa(metrics), date_range)
     
     # Extract data for plotting
-    dates = [vp.timestamp for vp in velocity_data]
-    additions = [vp.additions for vp in velocity_data]
-    deletions = [vp.deletions for vp in velocity_data]
-    net_changes = [vp.additions - vp.deletions for vp in velocity_data]
+    dates = velocity_data['ts']
+    additions = velocity_data['additions']
+    deletions = velocity_data['deletions']
+    net_changes = additions - deletions
     
-    # Create the figure
-    fig = go.Figure()
+    scatter = _scatter_trace_class(len(dates))
     
-    # Add additions line
-    fig.add_trace(go.Scatter(
-        x=dates,
-        y=additions,
-        mode='lines+markers',
-        name='Lines Added',
-        line=dict(color='#2ca02c', width=2),
-        marker=dict(size=4, color='#2ca02c'),
-        hovertemplate='<b>%{x}</b><br>Added: %{y}<extra></extra>'
-    ))
-    
-    # Add deletions line
-    fig.add_trace(go.Scatter(
-        x=dates,
-        y=deletions,
-        mode='lines+markers',
-        name='Lines Deleted',
-        line=dict(color='#d62728', width=2),
-        marker=dict(size=4, color='#d62728'),
-        hovertemplate='<b>%{x}</b><br>Deleted: %{y}<extra></extra>'
-    ))
-    
-    # Add net changes line
-    fig.add_trace(go.Scatter(
-        x=dates,
-        y=net_changes,
-        mode='lines+markers',
-        name='Net Changes',
-        line=dict(color='#1f77b4', width=2, dash='dot'),
-        marker=dict(size=4, color='#1f77b4'),
-        hovertemplate='<b>%{x}</b><br>Net: %{y}<extra></extra>'
-    ))
+    # Create the figure with the additions, deletions and net changes lines
+    fig = go.Figure(data=[
+        scatter(
+            x=dates,
+            y=additions,
+            mode='lines+markers',
+            name='Lines Added',
+            line_color='#2ca02c', line_width=2,
+            marker_size=4, marker_color='#2ca02c',
+            hovertemplate='<b>%{x}</b><br>Added: %{y}<extra></extra>'
+        ),
+        scatter(
+            x=dates,
+            y=deletions,
+            mode='lines+markers',
+            name='Lines Deleted',
+            line_color='#d62728', line_width=2,
+            marker_size=4, marker_color='#d62728',
+            hovertemplate='<b>%{x}</b><br>Deleted: %{y}<extra></extra>'
+        ),
+        scatter(
+            x=dates,
+            y=net_changes,
+            mode='lines+markers',
+            name='Net Changes',
+            line_color='#1f77b4', line_width=2, line_dash='dot',
+            marker_size=4, marker_color='#1f77b4',
+            hovertemplate='<b>%{x}</b><br>Net: %{y}<extra></extra>'
+        )
+    ])
     
     # Update layout
     fig.update_layout(
@@ -219,6 +425,7 @@ def create_code_volume_chart(metrics: ProductivityMetrics,
     return fig
 
 
+@_cache_chart
 def create_velocity_overview_chart(metrics: ProductivityMetrics,
                                  date_range: Optional[tuple] = None) -> go.Figure:
     """
@@ -232,70 +439,46 @@ def create_velocity_overview_chart(metrics: ProductivityMetrics,
         Plotly figure object with subplots
     """
     if not metrics.velocity_trends:
-        # Create empty chart with message
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No velocity data available",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, xanchor='center', yanchor='middle',
-            showarrow=False, font=dict(size=16, color="gray")
-        )
-        fig.update_layout(title="Velocity Overview")
-        return fig
-    
-    # Filter data by date range if provided
-    velocity_data = metrics.velocity_trends
-    if date_range:
-        start_date, end_date = date_range
-        velocity_data = [
-            vp for vp in velocity_data 
-            if start_date <= vp.timestamp.date() <= end_date
-        ]
+        # Shared "no data" figure, built once at import time
+        return _EMPTY_FIGURES["Velocity Overview"]
     
-    # Sort by timestamp
-    velocity_data = sorted(velocity_data, key=lambda x: x.timestamp)
+    # Filter data by date range if provided (arrays are already sorted by timestamp)
+    velocity_data = _filter_velocity(_velocity_soa(metrics), date_range)
     
     # Extract data for plotting
-    dates = [vp.timestamp for vp in velocity_data]
-    commits = [vp.commits for vp in velocity_data]
-    prs = [vp.pull_requests for vp in velocity_data]
-    issues = [vp.issues_closed for vp in velocity_data]
-    total_changes = [vp.total_changes for vp in velocity_data]
+    dates = velocity_data['ts']
+    commits = velocity_data['commits']
+    prs = velocity_data['prs']
+    issues = velocity_data['issues']
+    total_changes = velocity_data['total']
+    
+    # Imported here so the subplots module only loads when this chart is built
+    from plotly.subplots import make_subplots
     
     # Create subplots
     fig = make_subplots(
         rows=2, cols=2,
         subplot_titles=('Commits', 'Pull Requests', 'Issues Closed', 'Code Changes'),
+        shared_xaxes=True,
         vertical_spacing=0.12,
         horizontal_spacing=0.1
     )
-    
-    # Add commits subplot
-    fig.add_trace(
-        go.Scatter(x=dates, y=commits, mode='lines+markers', name='Commits',
-                  line=dict(color='#1f77b4'), marker=dict(size=4)),
-        row=1, col=1
-    )
-    
-    # Add PRs subplot
-    fig.add_trace(
-        go.Scatter(x=dates, y=prs, mode='lines+markers', name='Pull Requests',
-                  line=dict(color='#ff7f0e'), marker=dict(size=4)),
-        row=1, col=2
-    )
-    
-    # Add issues subplot
-    fig.add_trace(
-        go.Scatter(x=dates, y=issues, mode='lines+markers', name='Issues Closed',
-                  line=dict(color='#2ca02c'), marker=dict(size=4)),
-        row=2, col=1
-    )
-    
-    # Add code changes subplot
-    fig.add_trace(
-        go.Scatter(x=dates, y=total_changes, mode='lines+markers', name='Total Changes',
-                  line=dict(color='#d62728'), marker=dict(size=4)),
-        row=2, col=2
+    scatter = _scatter_trace_class(len(dates))
+    
+    # Add all four subplot traces in a single call
+    fig.add_traces(
+        [
+            scatter(x=dates, y=commits, mode='lines+markers', name='Commits',
+                    line_color='#1f77b4', marker_size=4),
+            scatter(x=dates, y=prs, mode='lines+markers', name='Pull Requests',
+                    line_color='#ff7f0e', marker_size=4),
+            scatter(x=dates, y=issues, mode='lines+markers', name='Issues Closed',
+                    line_color='#2ca02c', marker_size=4),
+            scatter(x=dates, y=total_changes, mode='lines+markers', name='Total Changes',
+                    line_color='#d62728', marker_size=4)
+        ],
+        rows=[1, 1, 2, 2],
+        cols=[1, 2, 1, 2]
     )
     
     # Update layout
@@ -306,18 +489,19 @@ def create_velocity_overview_chart(metrics: ProductivityMetrics,
         margin=dict(l=0, r=0, t=60, b=0)
     )
     
-    # Update all x-axes
-    for i in range(1, 3):
-        for j in range(1, 3):
-            fig.update_xaxes(tickformat='%m-%d', tickangle=45, row=i, col=j)
+    # Format every x-axis in one call; all panes share the same date range
+    fig.update_xaxes(tickformat='%m-%d', tickangle=45, matches='x')
     
     return fig
 
 
+@st.fragment
 def render_time_series_section(metrics: ProductivityMetrics):
     """
     Render the time-series charts section with filtering options.
     
+    Runs as a fragment, so changing the filters reruns only this section.
+    
     Args:
         metrics: ProductivityMetrics to visualize
     """
@@ -327,24 +511,29 @@ def render_time_series_section(metrics: ProductivityMetrics):
         st.info("📊 Load repository data to see time-series analysis")
         return
     
+    view = _metrics_view(metrics)
+    velocity_arrays = view.velocity
+    
     # Date range filtering
     col1, col2, col3 = st.columns([2, 2, 1])
     
     with col1:
         # Calculate default date range (last 30 days or available data range)
-        if metrics.velocity_trends:
-            min_date = min(vp.timestamp.date() for vp in metrics.velocity_trends)
-            max_date = max(vp.timestamp.date() for vp in metrics.velocity_trends)
+        ts_date = velocity_arrays['ts_date']
+        if len(ts_date):
+            # Dates are sorted, so the range is just the first and last entries
+            min_date = ts_date[0].item()
+            max_date = ts_date[-1].item()
             default_start = max(min_date, max_date - timedelta(days=30))
         else:
-            default_start = metrics.period_start.date()
-            max_date = metrics.period_end.date()
+            default_start = view.start_d
+            max_date = view.end_d
         
         start_date = st.date_input(
             "Start Date",
             value=default_start,
-            min_value=metrics.period_start.date(),
-            max_value=metrics.period_end.date(),
+            min_value=view.start_d,
+            max_value=view.end_d,
             key="ts_start_date"
         )
     
@@ -352,8 +541,8 @@ def render_time_series_section(metrics: ProductivityMetrics):
         end_date = st.date_input(
             "End Date",
             value=max_date,
-            min_value=metrics.period_start.date(),
-            max_value=metrics.period_end.date(),
+            min_value=view.start_d,
+            max_value=view.end_d,
             key="ts_end_date"
         )
     
@@ -375,97 +564,108 @@ def render_time_series_section(metrics: ProductivityMetrics):
     date_range = (start_date, end_date)
     dev_filter = None if developer_filter == "All Developers" else developer_filter
     
+    # Slice the sorted velocity arrays once and reduce them for all summary statistics
+    stats = _velocity_summary(_filter_velocity(velocity_arrays, date_range))
+    
+    # Build the three figures before laying out the tabs
+    commit_chart = create_commit_frequency_chart(metrics, date_range, dev_filter)
+    volume_chart = create_code_volume_chart(metrics, date_range, dev_filter)
+    velocity_chart = create_velocity_overview_chart(metrics, date_range)
+    
     # Create tabs for different chart types
     tab1, tab2, tab3 = st.tabs(["📊 Commit Frequency", "📝 Code Volume", "🔄 Velocity Overview"])
     
     with tab1:
-        st.markdown("**Daily commit frequency with trend analysis**")
-        
-        # Create and display commit frequency chart
-        commit_chart = create_commit_frequency_chart(metrics, date_range, dev_filter)
-        st.plotly_chart(commit_chart, use_container_width=True)
-        
-        # Show summary statistics
-        if metrics.velocity_trends:
-            filtered_data = [
-                vp for vp in metrics.velocity_trends 
-                if start_date <= vp.timestamp.date() <= end_date
-            ]
-            
-            if filtered_data:
-                total_commits = sum(vp.commits for vp in filtered_data)
-                avg_commits = total_commits / len(filtered_data) if filtered_data else 0
-                max_commits = max(vp.commits for vp in filtered_data)
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Total Commits", total_commits)
-                with col2:
-                    st.metric("Daily Average", f"{avg_commits:.1f}")
-                with col3:
-                    st.metric("Peak Day", max_commits)
+        _render_commit_tab(commit_chart, stats)
     
     with tab2:
-        st.markdown("**Code additions, deletions, and net changes over time**")
-        
-        # Create and display code volume chart
-        volume_chart = create_code_volume_chart(metrics, date_range, dev_filter)
-        st.plotly_chart(volume_chart, use_container_width=True)
-        
-        # Show summary statistics
-        if metrics.velocity_trends:
-            filtered_data = [
-                vp for vp in metrics.velocity_trends 
-                if start_date <= vp.timestamp.date() <= end_date
-            ]
-            
-            if filtered_data:
-                total_additions = sum(vp.additions for vp in filtered_data)
-                total_deletions = sum(vp.deletions for vp in filtered_data)
-                net_changes = total_additions - total_deletions
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Total Additions", total_additions, delta=f"+{total_additions}")
-                with col2:
-                    st.metric("Total Deletions", total_deletions, delta=f"-{total_deletions}")
-                with col3:
-                    st.metric("Net Changes", net_changes, delta=f"{'+' if net_changes >= 0 else ''}{net_changes}")
+        _render_volume_tab(volume_chart, stats)
     
     with tab3:
-        st.markdown("**Multi-metric velocity overview**")
+        _render_velocity_tab(velocity_chart, stats)
+
+
+def _render_commit_tab(commit_chart: go.Figure, stats: Optional[Dict[str, Any]]):
+    """
+    Render the commit frequency tab.
+    
+    Args:
+        commit_chart: Commit frequency figure
+        stats: Summary statistics from _velocity_summary, or None if no data
+    """
+    st.markdown("**Daily commit frequency with trend analysis**")
+    
+    st.plotly_chart(commit_chart, use_container_width=True)
+    
+    # Show summary statistics
+    if stats:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Total Commits", stats['commits_total'])
+        with col2:
+            st.metric("Daily Average", f"{stats['commits_mean']:.1f}")
+        with col3:
+            st.metric("Peak Day", stats['commits_max'])
+
+
+def _render_volume_tab(volume_chart: go.Figure, stats: Optional[Dict[str, Any]]):
+    """
+    Render the code volume tab.
+    
+    Args:
+        volume_chart: Code volume figure
+        stats: Summary statistics from _velocity_summary, or None if no data
+    """
+    st.markdown("**Code additions, deletions, and net changes over time**")
+    
+    st.plotly_chart(volume_chart, use_container_width=True)
+    
+    # Show summary statistics
+    if stats:
+        total_additions = stats['additions_total']
+        total_deletions = stats['deletions_total']
+        net_changes = stats['net_changes']
         
-        # Create and display velocity overview chart
-        velocity_chart = create_velocity_overview_chart(metrics, date_range)
-        st.plotly_chart(velocity_chart, use_container_width=True)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Total Additions", total_additions, delta=f"+{total_additions}")
+        with col2:
+            st.metric("Total Deletions", total_deletions, delta=f"-{total_deletions}")
+        with col3:
+            st.metric("Net Changes", net_changes, delta=f"{'+' if net_changes >= 0 else ''}{net_changes}")
+
+
+def _render_velocity_tab(velocity_chart: go.Figure, stats: Optional[Dict[str, Any]]):
+    """
+    Render the multi-metric velocity overview tab.
+    
+    Args:
+        velocity_chart: Velocity overview figure
+        stats: Summary statistics from _velocity_summary, or None if no data
+    """
+    st.markdown("**Multi-metric velocity overview**")
+    
+    st.plotly_chart(velocity_chart, use_container_width=True)
+    
+    # Show period summary
+    if stats:
+        st.markdown("**Period Summary**")
+        col1, col2, col3, col4 = st.columns(4)
         
-        # Show period summary
-        if metrics.velocity_trends:
-            filtered_data = [
-                vp for vp in metrics.velocity_trends 
-                if start_date <= vp.timestamp.date() <= end_date
-            ]
-            
-            if filtered_data:
-                st.markdown("**Period Summary**")
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    total_commits = sum(vp.commits for vp in filtered_data)
-                    st.metric("Commits", total_commits)
-                
-                with col2:
-                    total_prs = sum(vp.pull_requests for vp in filtered_data)
-                    st.metric("Pull Requests", total_prs)
-                
-                with col3:
-                    total_issues = sum(vp.issues_closed for vp in filtered_data)
-                    st.metric("Issues Closed", total_issues)
-                
-                with col4:
-                    total_changes = sum(vp.total_changes for vp in filtered_data)
-                    st.metric("Code Changes", total_changes)
+        with col1:
+            st.metric("Commits", stats['commits_total'])
+        
+        with col2:
+            st.metric("Pull Requests", stats['prs_total'])
+        
+        with col3:
+            st.metric("Issues Closed", stats['issues_total'])
+        
+        with col4:
+            st.metric("Code Changes", stats['changes_total'])
+
 
+@_cache_chart
 def create_pr_metrics_chart(metrics: ProductivityMetrics,
                            date_range: Optional[tuple] = None,
                            repository_filter: Optional[str] = None) -> go.Figure:
@@ -483,36 +683,15 @@ def create_pr_metrics_chart(metrics: ProductivityMetrics,
     pr_metrics = metrics.pr_metrics
     
     # Create pie chart for PR status distribution
-    labels = []
-    values = []
-    colors = []
-    
-    if pr_metrics.merged_prs > 0:
-        labels.append(f'Merged ({pr_metrics.merged_prs})')
-        values.append(pr_metrics.merged_prs)
-        colors.append('#2ca02c')
-    
-    if pr_metrics.open_prs > 0:
-        labels.append(f'Open ({pr_metrics.open_prs})')
-        values.append(pr_metrics.open_prs)
-        colors.append('#1f77b4')
-    
-    if pr_metrics.closed_prs > 0:
-        labels.append(f'Closed ({pr_metrics.closed_prs})')
-        values.append(pr_metrics.closed_prs)
-        colors.append('#d62728')
-    
-    if not values:
-        # Create empty chart
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No pull request data available",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, xanchor='center', yanchor='middle',
-            showarrow=False, font=dict(size=16, color="gray")
-        )
-        fig.update_layout(title="Pull Request Status Distribution")
-        return fig
+    labels, values, colors = _status_slices(
+        _PR_STATUS_NAMES,
+        [pr_metrics.merged_prs, pr_metrics.open_prs, pr_metrics.closed_prs],
+        _PR_STATUS_COLORS
+    )
+    
+    if not labels:
+        # Shared "no data" figure, built once at import time
+        return _EMPTY_FIGURES["Pull Request Status Distribution"]
     
     fig = go.Figure(data=[go.Pie(
         labels=labels,
@@ -532,6 +711,7 @@ def create_pr_metrics_chart(metrics: ProductivityMetrics,
     return fig
 
 
+@_cache_chart
 def create_pr_performance_chart(metrics: ProductivityMetrics) -> go.Figure:
     """
     Create pull request performance metrics chart.
@@ -560,7 +740,7 @@ def create_pr_performance_chart(metrics: ProductivityMetrics) -> go.Figure:
             x=categories,
             y=values,
             marker_color=colors,
-            text=[f'{v:.1f}' for v in values],
+            texttemplate='%{y:.1f}',
             textposition='auto',
             hovertemplate='<b>%{x}</b><br>Value: %{y:.1f}<extra></extra>'
         )
@@ -577,6 +757,7 @@ def create_pr_performance_chart(metrics: ProductivityMetrics) -> go.Figure:
     return fig
 
 
+@_cache_chart
 def create_review_participation_chart(metrics: ProductivityMetrics) -> go.Figure:
     """
     Create code review participation chart.
@@ -598,7 +779,7 @@ def create_review_participation_chart(metrics: ProductivityMetrics) -> go.Figure
             x=categories,
             y=values,
             marker_color=['#1f77b4', '#ff7f0e'],
-            text=values,
+            texttemplate='%{y}',
             textposition='auto',
             hovertemplate='<b>%{x}</b><br>Count: %{y}<extra></extra>'
         )
@@ -615,6 +796,7 @@ def create_review_participation_chart(metrics: ProductivityMetrics) -> go.Figure
     return fig
 
 
+@_cache_chart
 def create_review_quality_chart(metrics: ProductivityMetrics) -> go.Figure:
     """
     Create code review quality metrics chart.
@@ -670,6 +852,7 @@ def create_review_quality_chart(metrics: ProductivityMetrics) -> go.Figure:
     return fig
 
 
+@_cache_chart
 def create_issue_resolution_chart(metrics: ProductivityMetrics,
                                  date_range: Optional[tuple] = None) -> go.Figure:
     """
@@ -685,31 +868,15 @@ def create_issue_resolution_chart(metrics: ProductivityMetrics,
     issue_metrics = metrics.issue_metrics
     
     # Create donut chart for issue status
-    labels = []
-    values = []
-    colors = []
-    
-    if issue_metrics.closed_issues > 0:
-        labels.append(f'Closed ({issue_metrics.closed_issues})')
-        values.append(issue_metrics.closed_issues)
-        colors.append('#2ca02c')
-    
-    if issue_metrics.open_issues > 0:
-        labels.append(f'Open ({issue_metrics.open_issues})')
-        values.append(issue_metrics.open_issues)
-        colors.append('#ff7f0e')
-    
-    if not values:
-        # Create empty chart
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No issue data available",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, xanchor='center', yanchor='middle',
-            showarrow=False, font=dict(size=16, color="gray")
-        )
-        fig.update_layout(title="Issue Resolution Status")
-        return fig
+    labels, values, colors = _status_slices(
+        _ISSUE_STATUS_NAMES,
+        [issue_metrics.closed_issues, issue_metrics.open_issues],
+        _ISSUE_STATUS_COLORS
+    )
+    
+    if not labels:
+        # Shared "no data" figure, built once at import time
+        return _EMPTY_FIGURES["Issue Resolution Status"]
     
     fig = go.Figure(data=[go.Pie(
         labels=labels,
@@ -737,6 +904,7 @@ def create_issue_resolution_chart(metrics: ProductivityMetrics,
     return fig
 
 
+@_cache_chart
 def create_issue_performance_chart(metrics: ProductivityMetrics) -> go.Figure:
     """
     Create issue performance metrics chart.
@@ -765,7 +933,7 @@ def create_issue_performance_chart(metrics: ProductivityMetrics) -> go.Figure:
             x=categories,
             y=values,
             marker_color=colors,
-            text=[f'{v:.0f}' if i < 3 else f'{v:.1f}' for i, v in enumerate(values)],
+            texttemplate=_ISSUE_PERFORMANCE_TEXT_TEMPLATES,
             textposition='auto',
             hovertemplate='<b>%{x}</b><br>Value: %{y:.1f}<extra></extra>'
         )
@@ -782,10 +950,61 @@ def create_issue_performance_chart(metrics: ProductivityMetrics) -> go.Figure:
     return fig
 
 
+def _commits_per_pr(metrics: ProductivityMetrics) -> Optional[float]:
+    """Average commits per pull request, or None when there are no commits or PRs."""
+    if metrics.commit_metrics.total_commits > 0 and metrics.pr_metrics.total_prs > 0:
+        return metrics.commit_metrics.total_commits / metrics.pr_metrics.total_prs
+    return None
+
+
+# Key insight rules, checked in order:
+# (value getter, low threshold, low message, high threshold, high message)
+_INSIGHT_RULES = (
+    (lambda m: m.pr_metrics.merge_rate,
+     50, "⚠️ Low PR merge rate - consider reviewing PR quality or approval processes",
+     80, "🎉 Excellent PR merge rate - most pull requests are being successfully merged"),
+    (lambda m: m.review_metrics.review_participation_rate,
+     30, "📝 Low review participation - consider encouraging more peer reviews",
+     70, "👥 Strong code review participation - good collaboration practices"),
+    (lambda m: m.issue_metrics.resolution_rate,
+     40, "🔧 Low issue resolution rate - may need to focus on closing open issues",
+     75, "🐛 Good issue resolution rate - effective bug tracking and fixing"),
+    (_commits_per_pr,
+     2, "⚡ Small, focused PRs - good practice for code review and integration",
+     10, "📦 Large PRs detected - consider breaking down changes into smaller PRs"),
+)
+
+
+def _metric_insights(metrics: ProductivityMetrics) -> List[str]:
+    """
+    Generate the key insight messages for a set of metrics.
+    
+    Args:
+        metrics: ProductivityMetrics to evaluate
+    
+    Returns:
+        List of insight messages, one per rule whose value is above its high
+        threshold or below its low threshold
+    """
+    insights = []
+    for getter, low, low_message, high, high_message in _INSIGHT_RULES:
+        value = getter(metrics)
+        if value is None:
+            continue
+        if value > high:
+            insights.append(high_message)
+        elif value < low:
+            insights.append(low_message)
+    return insights
+
+
+@st.fragment
 def render_detailed_analytics_section(metrics: ProductivityMetrics):
     """
     Render detailed analytics and drill-down views section.
     
+    Runs as a fragment, so changing the filters reruns only this section.
+    
     Args:
         metrics: ProductivityMetrics to visualize
     """
@@ -795,6 +1014,8 @@ def render_detailed_analytics_section(metrics: ProductivityMetrics):
         st.info("📊 Load repository data to see detailed analytics")
         return
     
+    view = _metrics_view(metrics)
+    
     # Filtering options
     st.markdown("**Filters**")
     col1, col2, col3 = st.columns(3)
@@ -803,18 +1024,18 @@ def render_detailed_analytics_section(metrics: ProductivityMetrics):
         # Date range filter
         start_date = st.date_input(
             "Start Date",
-            value=metrics.period_start.date(),
-            min_value=metrics.period_start.date(),
-            max_value=metrics.period_end.date(),
+            value=view.start_d,
+            min_value=view.start_d,
+            max_value=view.end_d,
             key="analytics_start_date"
         )
     
     with col2:
         end_date = st.date_input(
             "End Date",
-            value=metrics.period_end.date(),
-            min_value=metrics.period_start.date(),
-            max_value=metrics.period_end.date(),
+            value=view.end_d,
+            min_value=view.start_d,
+            max_value=view.end_d,
             key="analytics_end_date"
         )
     
@@ -838,6 +1059,14 @@ def render_detailed_analytics_section(metrics: ProductivityMetrics):
     
     st.markdown("---")
     
+    # Build all six figures before laying out the tabs
+    pr_status_chart = create_pr_metrics_chart(metrics, date_range, repo_filter)
+    pr_performance_chart = create_pr_performance_chart(metrics)
+    review_participation_chart = create_review_participation_chart(metrics)
+    review_quality_chart = create_review_quality_chart(metrics)
+    issue_resolution_chart = create_issue_resolution_chart(metrics, date_range)
+    issue_performance_chart = create_issue_performance_chart(metrics)
+    
     # Create tabs for different analytics categories
     tab1, tab2, tab3 = st.tabs(["🔄 Pull Requests", "👥 Code Reviews", "🐛 Issues"])
     
@@ -849,12 +1078,10 @@ def render_detailed_analytics_section(metrics: ProductivityMetrics):
         
         with col1:
             # PR status distribution
-            pr_status_chart = create_pr_metrics_chart(metrics, date_range, repo_filter)
             st.plotly_chart(pr_status_chart, use_container_width=True)
         
         with col2:
             # PR performance metrics
-            pr_performance_chart = create_pr_performance_chart(metrics)
             st.plotly_chart(pr_performance_chart, use_container_width=True)
         
         # PR summary statistics
@@ -900,12 +1127,10 @@ def render_detailed_analytics_section(metrics: ProductivityMetrics):
         
         with col1:
             # Review participation
-            review_participation_chart = create_review_participation_chart(metrics)
             st.plotly_chart(review_participation_chart, use_container_width=True)
         
         with col2:
             # Review quality distribution
-            review_quality_chart = create_review_quality_chart(metrics)
             st.plotly_chart(review_quality_chart, use_container_width=True)
         
         # Review summary statistics
@@ -951,12 +1176,10 @@ def render_detailed_analytics_section(metrics: ProductivityMetrics):
         
         with col1:
             # Issue resolution status
-            issue_resolution_chart = create_issue_resolution_chart(metrics, date_range)
             st.plotly_chart(issue_resolution_chart, use_container_width=True)
         
         with col2:
             # Issue performance metrics
-            issue_performance_chart = create_issue_performance_chart(metrics)
             st.plotly_chart(issue_performance_chart, use_container_width=True)
         
         # Issue summary statistics
@@ -998,30 +1221,7 @@ def render_detailed_analytics_section(metrics: ProductivityMetrics):
     st.markdown("---")
     st.subheader("📊 Key Insights")
     
-    insights = []
-    
-    # Generate insights based on metrics
-    if metrics.pr_metrics.merge_rate > 80:
-        insights.append("🎉 Excellent PR merge rate - most pull requests are being successfully merged")
-    elif metrics.pr_metrics.merge_rate < 50:
-        insights.append("⚠️ Low PR merge rate - consider reviewing PR quality or approval processes")
-    
-    if metrics.review_metrics.review_participation_rate > 70:
-        insights.append("👥 Strong code review participation - good collaboration practices")
-    elif metrics.review_metrics.review_participation_rate < 30:
-        insights.append("📝 Low review participation - consider encouraging more peer reviews")
-    
-    if metrics.issue_metrics.resolution_rate > 75:
-        insights.append("🐛 Good issue resolution rate - effective bug tracking and fixing")
-    elif metrics.issue_metrics.resolution_rate < 40:
-        insights.append("🔧 Low issue resolution rate - may need to focus on closing open issues")
-    
-    if metrics.commit_metrics.total_commits > 0 and metrics.pr_metrics.total_prs > 0:
-        commits_per_pr = metrics.commit_metrics.total_commits / metrics.pr_metrics.total_prs
-        if commits_per_pr > 10:
-            insights.append("📦 Large PRs detected - consider breaking down changes into smaller PRs")
-        elif commits_per_pr < 2:
-            insights.append("⚡ Small, focused PRs - good practice for code review and integration")
+    insights = _metric_insights(metrics)
     
     if insights:
         for insight in insights:
@@ -15,8 +15,24 @@ from utils.user_feedback import (
     show_warning, show_info, is_loading, set_loading, set_success, set_error
 )
 import hashlib
-import json
+import io
 import logging
+import re
+import zipfile
+from collections import deque, namedtuple
+from concurrent.futures import as_completed
+from dataclasses import asdict
+from functools import lru_cache
+from itertools import islice
+
+from models.config import GitHubCredentials, OpenAICredentials, RepositoryConfig
+from models.metrics import (
+    ProductivityMetrics, CommitMetrics, PRMetrics, ReviewMetrics, IssueMetrics, VelocityPoint, AnalysisReport
+)
+from utils.github_client import GitHubClient
+from utils.llm_disk_cache import LLMDiskCache, make_key
+from utils.metrics_calculator import MetricsCalculator
+from utils.review_metrics_processor import ReviewMetricsProcessor
 
 # Dashboard sections
 DASHBOARD_SECTIONS = {
@@ -27,152 +43,125 @@ DASHBOARD_SECTIONS = {
     "Export": "📥"
 }
 
-def initialize_session_state():
-    """Initialize session state variables"""
-    if 'current_section' not in st.session_state:
-        st.session_state.current_section = "Overview"
-    if 'github_token' not in st.session_state:
-        st.session_state.github_token = ""
-    if 'openai_key' not in st.session_state:
-        st.session_state.openai_key = ""
-    if 'repository_url' not in st.session_state:
-        st.session_state.repository_url = ""
-    if 'credentials_valid' not in st.session_state:
-        st.session_state.credentials_valid = False
-    if 'data_loaded' not in st.session_state:
-        st.session_state.data_loaded = False
-    
-    # Initialize caching system
-    if 'github_data_cache' not in st.session_state:
-        st.session_state.github_data_cache = {}
-    if 'metrics_cache' not in st.session_state:
-        st.session_state.metrics_cache = {}
-    if 'cache_timestamps' not in st.session_state:
-        st.session_state.cache_timestamps = {}
-    if 'performance_metrics' not in st.session_state:
-        st.session_state.performance_metrics = {
-            'data_load_time': 0,
-            'metrics_calc_time': 0,
-            'chart_render_time': 0,
-            'api_calls_made': 0,
-            'cache_hits': 0,
-            'cache_misses': 0
-        }
+# Sidebar label per section, formatted once at import
+SECTION_LABELS = {section: f"{icon} {section}" for section, icon in DASHBOARD_SECTIONS.items()}
 
-def create_cache_key(repo_owner: str, repo_name: str, data_type: str, 
-                    since_date: datetime = None, **kwargs) -> str:
-    """
-    Create a unique cache key for GitHub data.
-    
-    Args:
-        repo_owner: Repository owner
-        repo_name: Repository name  
-        data_type: Type of data (commits, prs, issues)
-        since_date: Optional date filter
-        **kwargs: Additional parameters for cache key
-    
-    Returns:
-        str: Unique cache key
-    """
-    key_data = {
-        'repo': f"{repo_owner}/{repo_name}",
-        'type': data_type,
-        'since': since_date.isoformat() if since_date else None,
-        **kwargs
-    }
-    
-    key_string = json.dumps(key_data, sort_keys=True, default=str)
-    return hashlib.md5(key_string.encode()).hexdigest()
+# Credential and repository patterns, compiled once at import
+_GH_TOKEN_RE = re.compile(r'^gh[a-z]_[A-Za-z0-9_]{36,}$')
+_GH_URL_RE = re.compile(r'^https://github\.com/([a-zA-Z0-9_.-]+)/([a-zA-Z0-9_.-]+?)(?:\.git)?/?$')
+_GH_NAME_RE = re.compile(r'^[a-zA-Z0-9_.-]+$')
 
-def is_cache_valid(cache_key: str, max_age_minutes: int = 30) -> bool:
-    """
-    Check if cached data is still valid based on timestamp.
-    
-    Args:
-        cache_key: Cache key to check
-        max_age_minutes: Maximum age in minutes before cache expires
-    
-    Returns:
-        bool: True if cache is valid
-    """
-    if cache_key not in st.session_state.cache_timestamps:
-        return False
-    
-    cache_time = st.session_state.cache_timestamps[cache_key]
-    age_minutes = (datetime.now() - cache_time).total_seconds() / 60
-    
-    return age_minutes < max_age_minutes
+# Part of the on-disk analysis cache key; bump when the analysis prompts change
+ANALYSIS_PROMPT_VERSION = 1
 
-def get_cached_data(cache_key: str, data_type: str):
-    """
-    Retrieve data from cache if valid.
-    
-    Args:
-        cache_key: Cache key
-        data_type: Type of data being retrieved
-    
-    Returns:
-        Cached data or None if not available/expired
-    """
-    if not is_cache_valid(cache_key):
-        return None
-    
-    if data_type == 'github_data':
-        cache = st.session_state.github_data_cache
-    elif data_type == 'metrics':
-        cache = st.session_state.metrics_cache
-    else:
-        return None
-    
-    if cache_key in cache:
-        st.session_state.performance_metrics['cache_hits'] += 1
-        return cache[cache_key]
-    
-    return None
+# Suggested questions offered below the Q&A input; answers are fetched together
+SUGGESTED_QUESTIONS = (
+    "What are my most productive days and times?",
+    "How does my code review participation compare to best practices?",
+    "What patterns do you see in my pull request activity?",
+    "Are there any concerning trends in my productivity?",
+    "How can I improve my development workflow?",
+    "What's my strongest area of contribution?",
+)
 
-def cache_data(cache_key: str, data: Any, data_type: str):
-    """
-    Store data in cache with timestamp.
-    
-    Args:
-        cache_key: Cache key
-        data: Data to cache
-        data_type: Type of data being cached
-    """
-    if data_type == 'github_data':
-        cache = st.session_state.github_data_cache
-    elif data_type == 'metrics':
-        cache = st.session_state.metrics_cache
-    else:
-        return
-    
-    cache[cache_key] = data
-    st.session_state.cache_timestamps[cache_key] = datetime.now()
-    st.session_state.performance_metrics['cache_misses'] += 1
+# Questions kept in the Q&A history; older ones are dropped as new ones arrive
+QA_HISTORY_LIMIT = 50
 
-def clear_expired_cache():
-    """Clear expired cache entries to free memory."""
-    current_time = datetime.now()
-    expired_keys = []
-    
-    for cache_key, timestamp in st.session_state.cache_timestamps.items():
-        age_minutes = (current_time - timestamp).total_seconds() / 60
-        if age_minutes > 60:  # Clear cache older than 1 hour
-            expired_keys.append(cache_key)
+# Longest wait for an AI answer before the request is cancelled
+QUESTION_TIMEOUT_SECONDS = 30
+
+# Longest wait for the selected AI export reports, which are requested concurrently
+REPORT_TIMEOUT_SECONDS = 120
+
+# Analysis types produced together by generate_real_time_analysis(metrics, "combined")
+COMBINED_ANALYSIS_PARTS = ("summary", "detailed")
+
+# On-disk cache analysis type per AI export report; shared with the AI tabs where they overlap
+REPORT_ANALYSIS_TYPES = {
+    "Analysis Summary": "summary",
+    "Detailed Insights": "detailed",
+    "Executive Summary": "executive",
+    "Trend Analysis": "trends",
+    "Anomaly Report": "anomalies",
+}
+
+# Analysis types one combined summary-and-trends request can produce together
+BUNDLED_ANALYSIS_TYPES = ("summary", "trends", "detailed")
+
+# Session state defaults, merged in once per rerun
+SESSION_DEFAULTS = {
+    'current_section': "Overview",
+    'github_token': "",
+    'openai_key': "",
+    'repository_url': "",
+    'credentials_valid': False,
+    'data_loaded': False,
+    'github_valid': False,
+    'openai_valid': False,
+    'integrated_metrics': None,
+    'repository_info': None,
+    'ai_export_results': None,
+}
+
+# How long fetched GitHub data and the metrics built from it are reused, across all sessions
+GITHUB_DATA_TTL = timedelta(minutes=30)
+
+# Most recent items kept per data type, to bound metrics processing time
+COMMIT_FETCH_LIMIT = 1000
+PR_FETCH_LIMIT = 500
+ISSUE_FETCH_LIMIT = 300
+
+# Mutable session state entries, created by factory so each session gets its own
+SESSION_CONTAINERS = {
+    'performance_metrics': lambda: {
+        'data_load_time': 0,
+        'metrics_calc_time': 0,
+        'chart_render_time': 0,
+        'api_calls_made': 0,
+        'cache_hits': 0,
+        'cache_misses': 0
+    },
+}
+
+# Markdown text colour per status badge kind
+STATUS_COLORS = {
+    "success": "green",
+    "warning": "orange",
+    "error": "red",
+    "info": "blue",
+}
+
+# Alert element per anomaly severity; unknown severities render as info
+SEVERITY_RENDERERS = {
+    "LOW": st.info,
+    "MEDIUM": st.warning,
+    "HIGH": st.error,
+}
+
+# Icon per AI trend direction
+TREND_EMOJIS = {
+    "increasing": "📈",
+    "decreasing": "📉",
+    "stable": "➡️",
+    "volatile": "📊",
+}
+
+def initialize_session_state():
+    """Initialize session state variables"""
+    for key, default in SESSION_DEFAULTS.items():
+        st.session_state.setdefault(key, default)
     
-    for key in expired_keys:
-        # Remove from all caches
-        st.session_state.github_data_cache.pop(key, None)
-        st.session_state.metrics_cache.pop(key, None)
-        st.session_state.cache_timestamps.pop(key, None)
+    # Initialize caching system; containers are built per session so they are never shared
+    for key, factory in SESSION_CONTAINERS.items():
+        if key not in st.session_state:
+            st.session_state[key] = factory()
 
 def validate_github_token(token: str) -> bool:
     """Validate GitHub token format"""
     if not token:
         return False
     # Basic GitHub token format validation
-    import re
-    return bool(re.match(r'^gh[a-z]_[A-Za-z0-9_]{36,}$', token))
+    return bool(_GH_TOKEN_RE.match(token))
 
 def validate_openai_key(key: str) -> bool:
     """Validate OpenAI API key format"""
@@ -180,19 +169,18 @@ def validate_openai_key(key: str) -> bool:
         return False
     return key.startswith('sk-') and len(key) > 20
 
+@lru_cache(maxsize=32)
 def validate_repository_url(url: str) -> tuple[bool, str, str]:
-    """Validate GitHub repository URL and extract owner/name"""
+    """Validate GitHub repository URL and extract owner/name (memoized per URL string)"""
     if not url or not url.strip():
         return False, "", ""
     
     # Strip whitespace
     url = url.strip()
     
-    import re
     # Support both full URLs and owner/repo format
     if url.startswith('https://github.com/'):
-        pattern = r'^https://github\.com/([a-zA-Z0-9_.-]+)/([a-zA-Z0-9_.-]+?)(?:\.git)?/?$'
-        match = re.match(pattern, url)
+        match = _GH_URL_RE.match(url)
         if match:
             owner, name = match.groups()
             # Remove .git suffix if present
@@ -210,19 +198,254 @@ def validate_repository_url(url: str) -> tuple[bool, str, str]:
             if (owner and name and 
                 owner.strip() and name.strip() and
                 not owner.endswith('/') and not name.startswith('/') and
-                re.match(r'^[a-zA-Z0-9_.-]+$', owner) and
-                re.match(r'^[a-zA-Z0-9_.-]+$', name)):
+                _GH_NAME_RE.match(owner) and
+                _GH_NAME_RE.match(name)):
                 return True, owner.strip(), name.strip()
     
     return False, "", ""
 
+def remembered_validation(state_key: str, value: str, validator):
+    """
+    Validate an input, reusing the previous result while the input is unchanged.
+    
+    Args:
+        state_key: Session state key holding the last (value, result) pair
+        value: Input value to validate
+        validator: Validation function to call when the value has changed
+        
+    Returns:
+        The validator's result for value
+    """
+    last_check = st.session_state.get(state_key)
+    if last_check is not None and last_check[0] == value:
+        return last_check[1]
+    
+    result = validator(value)
+    st.session_state[state_key] = (value, result)
+    return result
+
+# Configuration flags derived from the sidebar inputs and connection tests
+ConfigStatus = namedtuple('ConfigStatus', 'creds_ok github_ready openai_ready')
+
+def configuration_status(github_token: str, repo_valid: bool, openai_key: str) -> ConfigStatus:
+    """
+    Derive the configuration flags once for the current inputs.
+    
+    Args:
+        github_token: GitHub token entered in the sidebar
+        repo_valid: Whether the repository URL is valid
+        openai_key: OpenAI API key entered in the sidebar
+        
+    Returns:
+        ConfigStatus with creds_ok (GitHub tested and configured), github_ready
+        (token and repository entered) and openai_ready (API key entered)
+    """
+    github_ready = bool(github_token and repo_valid)
+    return ConfigStatus(
+        creds_ok=bool(st.session_state.github_valid) and github_ready,
+        github_ready=github_ready,
+        openai_ready=bool(openai_key)
+    )
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def get_github_client(token: str):
+    """
+    Get a GitHub client for a token, shared across reruns.
+    
+    Args:
+        token: GitHub personal access token
+        
+    Returns:
+        GitHubClient whose HTTP session is reused for every call with this token
+    """
+    return GitHubClient(GitHubCredentials(personal_access_token=token))
+
+@st.cache_data(ttl=timedelta(minutes=5), show_spinner=False, max_entries=32)
+def probe_github_connection(token: str, repo_owner: str, repo_name: str) -> tuple[bool, str]:
+    """
+    Check GitHub authentication and repository access.
+    
+    A successful result is reused for five minutes, so pressing Test again with
+    the same inputs does not repeat the API round-trips. test_github_connection
+    clears failures, so a fixed token or permission is picked up right away.
+    
+    Args:
+        token: GitHub personal access token
+        repo_owner: Repository owner
+        repo_name: Repository name
+        
+    Returns:
+        Tuple of (success, message)
+    """
+    client = get_github_client(token)
+    
+    # Test authentication
+    if not client.authenticate():
+        return False, "Authentication failed - invalid token or insufficient permissions"
+    
+    # Test repository access
+    repo_config = RepositoryConfig(owner=repo_owner, name=repo_name)
+    if not client.validate_repository_access(repo_config):
+        return False, f"Cannot access repository {repo_owner}/{repo_name} - check permissions"
+    
+    return True, "Connection successful - GitHub API and repository access verified"
+
+def record_cache_miss(api_call: bool = True):
+    """
+    Count a data cache miss for this session.
+    
+    Called from inside the cached loaders, whose bodies only run on a miss.
+    
+    Args:
+        api_call: Whether the miss was served by a GitHub API request
+    """
+    performance = st.session_state.performance_metrics
+    performance['cache_misses'] += 1
+    if api_call:
+        performance['api_calls_made'] += 1
+
+def load_with_cache(loader, *args) -> tuple[Any, bool]:
+    """
+    Call a cached loader and record whether it was served from the cache.
+    
+    Args:
+        loader: One of the st.cache_data loaders below
+        *args: Arguments for the loader
+        
+    Returns:
+        Tuple of (loaded data, whether it came from the cache)
+    """
+    misses = st.session_state.performance_metrics['cache_misses']
+    data = loader(*args)
+    from_cache = st.session_state.performance_metrics['cache_misses'] == misses
+    if from_cache:
+        st.session_state.performance_metrics['cache_hits'] += 1
+    return data, from_cache
+
+@st.cache_data(ttl=GITHUB_DATA_TTL, show_spinner=False, max_entries=128)
+def fetch_commits(token: str, repo_owner: str, repo_name: str, since_iso: str) -> list:
+    """
+    Fetch the most recent commits of a repository, shared across sessions.
+    
+    Args:
+        token: GitHub personal access token; part of the key so data is only reused for the same access
+        repo_owner: Repository owner
+        repo_name: Repository name
+        since_iso: Start date in ISO format; a date rather than a timestamp so reloads on the same day hit
+        
+    Returns:
+        Up to COMMIT_FETCH_LIMIT commits
+    """
+    record_cache_miss()
+    repo_config = RepositoryConfig(owner=repo_owner, name=repo_name)
+    commits = get_github_client(token).get_commits(repo_config, since=datetime.fromisoformat(since_iso))
+    return commits[:COMMIT_FETCH_LIMIT]
+
+@st.cache_data(ttl=GITHUB_DATA_TTL, show_spinner=False, max_entries=128)
+def fetch_pull_requests(token: str, repo_owner: str, repo_name: str) -> list:
+    """
+    Fetch the most recent pull requests of a repository, shared across sessions.
+    
+    Args:
+        token: GitHub personal access token
+        repo_owner: Repository owner
+        repo_name: Repository name
+        
+    Returns:
+        Up to PR_FETCH_LIMIT pull requests in any state
+    """
+    record_cache_miss()
+    start_time = time.time()
+    
+    def pr_progress_callback(current, total, message, estimated_time_remaining):
+        elapsed = time.time() - start_time
+        logging.info(f"Pull request download progress - Request count: {current}, Elapsed time: {elapsed:.2f}s, Status: {message}")
+    
+    repo_config = RepositoryConfig(owner=repo_owner, name=repo_name)
+    pull_requests = get_github_client(token).get_pull_requests(
+        repo_config, state='all', progress_callback=pr_progress_callback
+    )
+    return pull_requests[:PR_FETCH_LIMIT]
+
+@st.cache_data(ttl=GITHUB_DATA_TTL, show_spinner=False, max_entries=128)
+def fetch_issues(token: str, repo_owner: str, repo_name: str) -> list:
+    """
+    Fetch the most recent issues of a repository, shared across sessions.
+    
+    Args:
+        token: GitHub personal access token
+        repo_owner: Repository owner
+        repo_name: Repository name
+        
+    Returns:
+        Up to ISSUE_FETCH_LIMIT issues in any state
+    """
+    record_cache_miss()
+    repo_config = RepositoryConfig(owner=repo_owner, name=repo_name)
+    issues = get_github_client(token).get_issues(repo_config, state='all')
+    return issues[:ISSUE_FETCH_LIMIT]
+
+@st.cache_data(ttl=GITHUB_DATA_TTL, show_spinner=False, max_entries=128)
+def calculate_repository_metrics(token: str, repo_owner: str, repo_name: str, since_iso: str) -> Dict[str, Any]:
+    """
+    Calculate the productivity metrics of a repository, shared across sessions.
+    
+    Keyed like the fetchers it reads from, so the metrics always match the cached
+    data; clear it together with them (see clear_github_data_cache).
+    
+    Args:
+        token: GitHub personal access token
+        repo_owner: Repository owner
+        repo_name: Repository name
+        since_iso: Start date of the commit history in ISO format
+        
+    Returns:
+        Dictionary of commit, PR, review and issue metrics, velocity trends and time distribution
+    """
+    record_cache_miss(api_call=False)
+    commits = fetch_commits(token, repo_owner, repo_name, since_iso)
+    pull_requests = fetch_pull_requests(token, repo_owner, repo_name)
+    issues = fetch_issues(token, repo_owner, repo_name)
+    
+    calc_start_time = time.time()
+    calculator = MetricsCalculator()
+    
+    # Use review metrics processor for review and issue metrics
+    processor = ReviewMetricsProcessor()
+    metrics_data = {
+        'commit_metrics': calculator.calculate_commit_metrics(commits),
+        'pr_metrics': calculator.calculate_pr_metrics(pull_requests),
+        'review_metrics': processor.calculate_review_metrics(pull_requests),
+        'issue_metrics': processor.calculate_issue_metrics(issues),
+        'velocity_trends': calculator.generate_time_series_data(commits, pull_requests, issues),
+        'time_distribution': calculator._calculate_time_distribution(commits, pull_requests)
+    }
+    st.session_state.performance_metrics['metrics_calc_time'] = time.time() - calc_start_time
+    return metrics_data
+
+def clear_github_data_cache(*repo_args):
+    """
+    Clear cached GitHub data and metrics.
+    
+    The cache is shared by all sessions, so clearing without arguments affects everyone.
+    
+    Args:
+        *repo_args: Optional (token, repo_owner, repo_name, since_iso) to clear one repository only
+    """
+    if repo_args:
+        token, repo_owner, repo_name, since_iso = repo_args
+        fetch_commits.clear(token, repo_owner, repo_name, since_iso)
+        fetch_pull_requests.clear(token, repo_owner, repo_name)
+        fetch_issues.clear(token, repo_owner, repo_name)
+        calculate_repository_metrics.clear(token, repo_owner, repo_name, since_iso)
+    else:
+        for loader in (fetch_commits, fetch_pull_requests, fetch_issues, calculate_repository_metrics):
+            loader.clear()
+
 @with_error_handling(context="test_github_connection", fallback=(False, "Connection test failed"))
 def test_github_connection(token: str, repo_owner: str, repo_name: str) -> tuple[bool, str]:
     """Test GitHub API connection and repository access with enhanced error handling"""
     try:
-        from models.config import GitHubCredentials, RepositoryConfig
-        from utils.github_client import GitHubClient
-        
         # Validate inputs
         if not token or not token.strip():
             return False, "GitHub token is required"
@@ -230,20 +453,12 @@ def test_github_connection(token: str, repo_owner: str, repo_name: str) -> tuple
         if not repo_owner or not repo_name:
             return False, "Repository owner and name are required"
         
-        # Create credentials and client
-        credentials = GitHubCredentials(personal_access_token=token.strip())
-        client = GitHubClient(credentials)
-        
-        # Test authentication
-        if not client.authenticate():
-            return False, "Authentication failed - invalid token or insufficient permissions"
-        
-        # Test repository access
-        repo_config = RepositoryConfig(owner=repo_owner.strip(), name=repo_name.strip())
-        if not client.validate_repository_access(repo_config):
-            return False, f"Cannot access repository {repo_owner}/{repo_name} - check permissions"
-        
-        return True, "Connection successful - GitHub API and repository access verified"
+        probe_args = (token.strip(), repo_owner.strip(), repo_name.strip())
+        success, message = probe_github_connection(*probe_args)
+        if not success:
+            # Only successes are reused; the next test re-checks access
+            probe_github_connection.clear(*probe_args)
+        return success, message
         
     except Exception as e:
         error_info = error_handler.handle_github_api_error(e, "connection_test")
@@ -268,21 +483,12 @@ def perform_integrated_data_collection(github_token: str, repo_owner: str, repo_
     Returns:
         bool: True if data collection was successful
     """
-    from models.config import GitHubCredentials, RepositoryConfig
-    from utils.github_client import GitHubClient
-    from utils.metrics_calculator import MetricsCalculator
-    from datetime import datetime, timedelta
-    
     start_time = time.time()
     
     try:
-        # Clear expired cache entries
-        clear_expired_cache()
-        
         # Step 1: Initialize GitHub client and authenticate
         update_progress(0.1, "Initializing GitHub API client...")
-        credentials = GitHubCredentials(personal_access_token=github_token)
-        client = GitHubClient(credentials)
+        client = get_github_client(github_token)
         
         if not client.authenticate():
             raise Exception("GitHub authentication failed")
@@ -294,133 +500,45 @@ def perform_integrated_data_collection(github_token: str, repo_owner: str, repo_
         if not client.validate_repository_access(repo_config):
             raise Exception(f"Cannot access repository {repo_owner}/{repo_name}")
         
-        # Step 3: Collect GitHub data with caching
-        since_date = datetime.now() - timedelta(days=30)
+        # Step 3: Collect GitHub data through the shared data cache
+        since_iso = (datetime.now() - timedelta(days=30)).date().isoformat()
         
-        # Check cache for commits
         update_progress(0.3, "Fetching commit history...")
-        commits_cache_key = create_cache_key(repo_owner, repo_name, 'commits', since_date)
-        commits = get_cached_data(commits_cache_key, 'github_data')
-        
-        if commits is None:
-            # Optimize by limiting data collection for performance
-            commits = client.get_commits(repo_config, since=since_date)
-            
-            # Limit commits to most recent 1000 for performance
-            if len(commits) > 1000:
-                commits = commits[:1000]
-                update_progress(0.35, f"Optimized: Using {len(commits)} most recent commits...")
-            
-            cache_data(commits_cache_key, commits, 'github_data')
-            st.session_state.performance_metrics['api_calls_made'] += 1
-        else:
+        commits, from_cache = load_with_cache(fetch_commits, github_token, repo_owner, repo_name, since_iso)
+        if from_cache:
             update_progress(0.4, "Using cached commit data...")
+        elif len(commits) >= COMMIT_FETCH_LIMIT:
+            update_progress(0.35, f"Optimized: Using {len(commits)} most recent commits...")
         
-        # Check cache for pull requests
         update_progress(0.5, "Fetching pull requests...")
-        prs_start_time = time.time()
-        prs_cache_key = create_cache_key(repo_owner, repo_name, 'pull_requests')
-        pull_requests = get_cached_data(prs_cache_key, 'github_data')
-
-        def pr_progress_callback(current, total, message, estimated_time_remaining):
-            elapsed = time.time() - prs_start_time
-            logging.info(f"Pull request download progress - Request count: {current}, Elapsed time: {elapsed:.2f}s, Status: {message}")
-
-        if pull_requests is None:
-            pull_requests = client.get_pull_requests(repo_config, state='all', progress_callback=pr_progress_callback)
-            
-            # Limit PRs to most recent 500 for performance
-            if len(pull_requests) > 500:
-                pull_requests = pull_requests[:500]
-                update_progress(0.52, f"Optimized: Using {len(pull_requests)} most recent PRs...")
-            
-            cache_data(prs_cache_key, pull_requests, 'github_data')
-            st.session_state.performance_metrics['api_calls_made'] += 1
-        else:
+        pull_requests, from_cache = load_with_cache(fetch_pull_requests, github_token, repo_owner, repo_name)
+        if from_cache:
             update_progress(0.55, "Using cached pull request data...")
+        elif len(pull_requests) >= PR_FETCH_LIMIT:
+            update_progress(0.52, f"Optimized: Using {len(pull_requests)} most recent PRs...")
         
-        # Check cache for issues
         update_progress(0.6, "Fetching issues...")
-        issues_cache_key = create_cache_key(repo_owner, repo_name, 'issues')
-        issues = get_cached_data(issues_cache_key, 'github_data')
-        
-        if issues is None:
-            issues = client.get_issues(repo_config, state='all')
-            
-            # Limit issues to most recent 300 for performance
-            if len(issues) > 300:
-                issues = issues[:300]
-                update_progress(0.62, f"Optimized: Using {len(issues)} most recent issues...")
-            
-            cache_data(issues_cache_key, issues, 'github_data')
-            st.session_state.performance_metrics['api_calls_made'] += 1
-        else:
+        issues, from_cache = load_with_cache(fetch_issues, github_token, repo_owner, repo_name)
+        if from_cache:
             update_progress(0.65, "Using cached issue data...")
+        elif len(issues) >= ISSUE_FETCH_LIMIT:
+            update_progress(0.62, f"Optimized: Using {len(issues)} most recent issues...")
         
         # Step 4: Process and calculate metrics with caching
         update_progress(0.7, "Processing data and calculating metrics...")
-        
-        # Check cache for calculated metrics
-        metrics_cache_key = create_cache_key(
-            repo_owner, repo_name, 'metrics', since_date,
-            commits_count=len(commits), prs_count=len(pull_requests), issues_count=len(issues)
+        metrics_data, from_cache = load_with_cache(
+            calculate_repository_metrics, github_token, repo_owner, repo_name, since_iso
         )
-        
-        cached_metrics = get_cached_data(metrics_cache_key, 'metrics')
-        
-        if cached_metrics is None:
-            calc_start_time = time.time()
-            calculator = MetricsCalculator()
-            
-            # Calculate productivity metrics
-            commit_metrics = calculator.calculate_commit_metrics(commits)
-            pr_metrics = calculator.calculate_pr_metrics(pull_requests)
-            
-            # Use review metrics processor for review and issue metrics
-            from utils.review_metrics_processor import ReviewMetricsProcessor
-            processor = ReviewMetricsProcessor()
-            review_metrics = processor.calculate_review_metrics(pull_requests)
-            issue_metrics = processor.calculate_issue_metrics(issues)
-            
-            update_progress(0.8, "Generating velocity trends...")
-            velocity_trends = calculator.generate_time_series_data(commits, pull_requests, issues)
-            time_distribution = calculator._calculate_time_distribution(commits, pull_requests)
-            
-            # Cache the calculated metrics
-            metrics_data = {
-                'commit_metrics': commit_metrics,
-                'pr_metrics': pr_metrics,
-                'review_metrics': review_metrics,
-                'issue_metrics': issue_metrics,
-                'velocity_trends': velocity_trends,
-                'time_distribution': time_distribution
-            }
-            cache_data(metrics_cache_key, metrics_data, 'metrics')
-            
-            calc_time = time.time() - calc_start_time
-            st.session_state.performance_metrics['metrics_calc_time'] = calc_time
-        else:
+        if from_cache:
             update_progress(0.85, "Using cached metrics...")
-            commit_metrics = cached_metrics['commit_metrics']
-            pr_metrics = cached_metrics['pr_metrics']
-            review_metrics = cached_metrics['review_metrics']
-            issue_metrics = cached_metrics['issue_metrics']
-            velocity_trends = cached_metrics['velocity_trends']
-            time_distribution = cached_metrics['time_distribution']
         
         # Step 5: Create integrated metrics object
         update_progress(0.9, "Finalizing metrics integration...")
-        from models.metrics import ProductivityMetrics
         
         integrated_metrics = ProductivityMetrics(
-            period_start=since_date,
+            period_start=datetime.fromisoformat(since_iso),
             period_end=datetime.now(),
-            commit_metrics=commit_metrics,
-            pr_metrics=pr_metrics,
-            review_metrics=review_metrics,
-            issue_metrics=issue_metrics,
-            velocity_trends=velocity_trends,
-            time_distribution=time_distribution
+            **metrics_data
         )
         
         # Step 6: Store metrics in session state for dashboard use
@@ -430,6 +548,7 @@ def perform_integrated_data_collection(github_token: str, repo_owner: str, repo_
             'owner': repo_owner,
             'name': repo_name,
             'last_updated': datetime.now(),
+            'since': since_iso,
             'data_points': {
                 'commits': len(commits),
                 'pull_requests': len(pull_requests),
@@ -485,13 +604,8 @@ def test_end_to_end_workflow(github_token: str, repo_owner: str, repo_name: str,
     
     try:
         # Step 1: Test GitHub data collection
-        from models.config import GitHubCredentials, RepositoryConfig
-        from utils.github_client import GitHubClient
-        from utils.metrics_calculator import MetricsCalculator
-        from datetime import datetime, timedelta
         
-        credentials = GitHubCredentials(personal_access_token=github_token)
-        client = GitHubClient(credentials)
+        client = get_github_client(github_token)
         
         if not client.authenticate():
             test_results['errors'].append("GitHub authentication failed")
@@ -525,7 +639,6 @@ def test_end_to_end_workflow(github_token: str, repo_owner: str, repo_name: str,
         pr_metrics = calculator.calculate_pr_metrics(pull_requests)
         
         # Use review metrics processor for review and issue metrics
-        from utils.review_metrics_processor import ReviewMetricsProcessor
         processor = ReviewMetricsProcessor()
         review_metrics = processor.calculate_review_metrics(pull_requests)
         issue_metrics = processor.calculate_issue_metrics(issues)
@@ -542,10 +655,6 @@ def test_end_to_end_workflow(github_token: str, repo_owner: str, repo_name: str,
         # Step 3: Test AI insights generation (if OpenAI key provided)
         if openai_key:
             try:
-                from models.config import OpenAICredentials
-                from utils.chatgpt_analyzer import ChatGPTAnalyzer
-                from models.metrics import ProductivityMetrics
-                
                 # Create integrated metrics for AI analysis
                 integrated_metrics = ProductivityMetrics(
                     period_start=since_date,
@@ -558,8 +667,7 @@ def test_end_to_end_workflow(github_token: str, repo_owner: str, repo_name: str,
                     time_distribution=calculator.calculate_time_distribution(commits, pull_requests)
                 )
                 
-                openai_credentials = OpenAICredentials(api_key=openai_key)
-                analyzer = ChatGPTAnalyzer(openai_credentials)
+                analyzer = get_openai_analyzer(openai_key)
                 
                 if analyzer.validate_credentials():
                     # Test AI analysis generation
@@ -611,6 +719,71 @@ def test_end_to_end_workflow(github_token: str, repo_owner: str, repo_name: str,
         test_results['errors'].append(f"End-to-end workflow test failed: {str(e)}")
         return test_results
 
+@st.cache_resource(show_spinner=False, max_entries=8)
+def get_openai_analyzer(api_key: str):
+    """
+    Get a ChatGPT analyzer for an API key, shared across reruns.
+    
+    Args:
+        api_key: OpenAI API key
+        
+    Returns:
+        ChatGPTAnalyzer whose OpenAI client is reused for every call with this key
+    """
+    from utils.chatgpt_analyzer import ChatGPTAnalyzer
+    
+    return ChatGPTAnalyzer(OpenAICredentials(api_key=api_key))
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def get_insight_generator(api_key: str):
+    """
+    Get the insight generator for an API key, shared across reruns.
+    
+    Args:
+        api_key: OpenAI API key
+        
+    Returns:
+        ProductivityInsightGenerator wrapping the shared analyzer for this key
+    """
+    from utils.chatgpt_analyzer import ProductivityInsightGenerator
+    
+    return ProductivityInsightGenerator(get_openai_analyzer(api_key))
+
+@lru_cache(maxsize=1)
+def get_export_manager():
+    """
+    Build the export manager once per process; the export module loads pandas.
+    
+    Returns:
+        Shared ExportManager (its exporters hold no per-export state)
+    """
+    from utils.export_manager import ExportManager
+    
+    return ExportManager()
+
+@st.cache_data(ttl=timedelta(minutes=5), show_spinner=False, max_entries=32)
+def probe_openai_connection(api_key: str) -> tuple[bool, str]:
+    """
+    Check that an OpenAI API key is accepted.
+    
+    A successful result is reused for five minutes, so pressing Test again with
+    the same key does not repeat the API round-trip. test_openai_connection
+    clears failures, so a fixed key or account is picked up right away.
+    
+    Args:
+        api_key: OpenAI API key
+        
+    Returns:
+        Tuple of (success, message)
+    """
+    analyzer = get_openai_analyzer(api_key)
+    
+    # Test credential validation first
+    if not analyzer.validate_credentials():
+        return False, "OpenAI API key validation failed - check key and account status"
+    
+    return True, "Connection successful - OpenAI API access verified"
+
 @with_error_handling(context="test_openai_connection", fallback=(False, "OpenAI connection test failed"))
 def test_openai_connection(api_key: str) -> tuple[bool, str]:
     """Test OpenAI API connection with enhanced error handling"""
@@ -622,68 +795,108 @@ def test_openai_connection(api_key: str) -> tuple[bool, str]:
         if not api_key.startswith('sk-'):
             return False, "Invalid OpenAI API key format - should start with 'sk-'"
         
-        from models.config import OpenAICredentials
-        from utils.chatgpt_analyzer import ChatGPTAnalyzer
-        
-        # Create credentials and analyzer
-        credentials = OpenAICredentials(api_key=api_key.strip())
-        analyzer = ChatGPTAnalyzer(credentials)
-        
-        # Test credential validation first
-        if not analyzer.validate_credentials():
-            return False, "OpenAI API key validation failed - check key and account status"
-        
-        return True, "Connection successful - OpenAI API access verified"
+        success, message = probe_openai_connection(api_key.strip())
+        if not success:
+            # Only successes are reused; the next test re-checks the key
+            probe_openai_connection.clear(api_key.strip())
+        return success, message
             
     except Exception as e:
         error_info = error_handler.handle_openai_api_error(e, "connection_test")
         return False, f"Connection failed: {error_info.get('message', str(e))}"
 
+def main_content_state() -> tuple:
+    """
+    Snapshot the session values that the main content area depends on.
+    
+    Returns:
+        Tuple that changes whenever the main content needs to be re-rendered
+    """
+    return (
+        bool(st.session_state.credentials_valid),
+        st.session_state.data_loaded,
+        st.session_state.openai_key,
+        id(st.session_state.get('integrated_metrics'))
+    )
+
+def render_status_badges(badges):
+    """
+    Render status badges on one line as a single markdown element.
+    
+    Args:
+        badges: List of (kind, text) pairs, kind being a STATUS_COLORS key
+    """
+    st.markdown("  ·  ".join(f":{STATUS_COLORS[kind]}[**{text}**]" for kind, text in badges))
+
+def apply_github_config():
+    """Apply form callback: store the GitHub inputs, invalidating credentials only on a change"""
+    github_token = st.session_state.github_token_input
+    repository_url = st.session_state.repo_url_input
+    
+    if (github_token, repository_url) != (st.session_state.github_token, st.session_state.repository_url):
+        st.session_state.github_token = github_token
+        st.session_state.repository_url = repository_url
+        st.session_state.credentials_valid = False
+        st.session_state.github_valid = False
+
+def apply_openai_key():
+    """OpenAI key input callback: store the new key and invalidate credentials"""
+    st.session_state.openai_key = st.session_state.openai_key_input
+    st.session_state.credentials_valid = False
+    st.session_state.openai_valid = False
+
+@st.fragment
 def render_configuration_panel():
-    """Render the configuration and credentials panel"""
+    """
+    Render the configuration and credentials panel.
+    
+    Runs as a fragment, so editing the sidebar inputs reruns only this panel.
+    A full app rerun is triggered when a value used by the main content changes.
+    """
+    initial_state = main_content_state()
+    
     st.header("⚙️ Configuration")
     
     # GitHub Configuration
     st.subheader("🐙 GitHub Configuration")
     
-    github_token = st.text_input(
-        "GitHub Personal Access Token",
-        type="password",
-        value=st.session_state.github_token,
-        help="Enter your GitHub personal access token with repo access",
-        key="github_token_input"
-    )
-    
-    if github_token != st.session_state.github_token:
-        st.session_state.github_token = github_token
-        st.session_state.credentials_valid = False
+    # Token and repository are applied together, so filling both in costs one
+    # rerun instead of one per field
+    with st.form("github_config_form", border=False):
+        github_token = st.text_input(
+            "GitHub Personal Access Token",
+            type="password",
+            value=st.session_state.github_token,
+            help="Enter your GitHub personal access token with repo access",
+            key="github_token_input"
+        )
+        
+        # Repository Configuration
+        repository_url = st.text_input(
+            "Repository URL or Owner/Name",
+            value=st.session_state.repository_url,
+            help="Enter GitHub repository URL (https://github.com/owner/repo) or owner/repo format",
+            key="repo_url_input"
+        )
+        
+        st.form_submit_button("Apply", use_container_width=True, on_click=apply_github_config)
     
     # GitHub token validation
     if github_token:
-        if validate_github_token(github_token):
+        if remembered_validation('github_token_check', github_token, validate_github_token):
             st.success("✅ Valid GitHub token format")
         else:
             st.error("❌ Invalid GitHub token format")
     
-    # Repository Configuration
-    repository_url = st.text_input(
-        "Repository URL or Owner/Name",
-        value=st.session_state.repository_url,
-        help="Enter GitHub repository URL (https://github.com/owner/repo) or owner/repo format",
-        key="repo_url_input"
-    )
-    
-    if repository_url != st.session_state.repository_url:
-        st.session_state.repository_url = repository_url
-        st.session_state.credentials_valid = False
-    
     # Repository validation
     repo_valid = False
     repo_owner = ""
     repo_name = ""
     
     if repository_url:
-        repo_valid, repo_owner, repo_name = validate_repository_url(repository_url)
+        repo_valid, repo_owner, repo_name = remembered_validation(
+            'repository_url_check', repository_url, validate_repository_url
+        )
         if repo_valid:
             st.success(f"✅ Valid repository: {repo_owner}/{repo_name}")
         else:
@@ -719,16 +932,13 @@ def render_configuration_panel():
         type="password",
         value=st.session_state.openai_key,
         help="Enter your OpenAI API key for AI-powered insights",
-        key="openai_key_input"
+        key="openai_key_input",
+        on_change=apply_openai_key
     )
     
-    if openai_key != st.session_state.openai_key:
-        st.session_state.openai_key = openai_key
-        st.session_state.credentials_valid = False
-    
     # OpenAI key validation
     if openai_key:
-        if validate_openai_key(openai_key):
+        if remembered_validation('openai_key_check', openai_key, validate_openai_key):
             st.success("✅ Valid OpenAI API key format")
         else:
             st.error("❌ Invalid OpenAI API key format")
@@ -758,32 +968,26 @@ def render_configuration_panel():
     # Configuration Status
     st.subheader("📋 Configuration Status")
     
-    col1, col2 = st.columns(2)
+    status = configuration_status(github_token, repo_valid, openai_key)
     
-    with col1:
-        github_status = getattr(st.session_state, 'github_valid', False)
-        if github_status:
-            st.success("✅ GitHub Connected")
-        elif github_token and repo_valid:
-            st.warning("⚠️ GitHub Not Tested")
-        else:
-            st.error("❌ GitHub Not Configured")
+    if st.session_state.github_valid:
+        github_badge = ("success", "✅ GitHub Connected")
+    elif status.github_ready:
+        github_badge = ("warning", "⚠️ GitHub Not Tested")
+    else:
+        github_badge = ("error", "❌ GitHub Not Configured")
     
-    with col2:
-        openai_status = getattr(st.session_state, 'openai_valid', False)
-        if openai_status:
-            st.success("✅ OpenAI Connected")
-        elif openai_key:
-            st.warning("⚠️ OpenAI Not Tested")
-        else:
-            st.info("ℹ️ OpenAI Optional")
+    if st.session_state.openai_valid:
+        openai_badge = ("success", "✅ OpenAI Connected")
+    elif status.openai_ready:
+        openai_badge = ("warning", "⚠️ OpenAI Not Tested")
+    else:
+        openai_badge = ("info", "ℹ️ OpenAI Optional")
+    
+    render_status_badges([github_badge, openai_badge])
     
     # Update overall credentials status
-    st.session_state.credentials_valid = (
-        github_status and 
-        github_token and 
-        repo_valid
-    )
+    st.session_state.credentials_valid = status.creds_ok
     
     if st.session_state.credentials_valid:
         st.success("🎉 Configuration Complete! You can now load data and analyze productivity.")
@@ -849,17 +1053,18 @@ def render_configuration_panel():
     st.markdown("---")
     st.subheader("🚀 Performance & Caching")
     
+    # One three-column layout for both the cache metrics and the cache buttons
     col1, col2, col3 = st.columns(3)
     
+    hits = st.session_state.performance_metrics.get('cache_hits', 0)
+    misses = st.session_state.performance_metrics.get('cache_misses', 0)
+    
     with col1:
         # Cache status
-        cache_entries = len(st.session_state.github_data_cache) + len(st.session_state.metrics_cache)
-        st.metric("Cache Entries", cache_entries, help="Number of cached data items")
+        st.metric("Cache Hits", hits, help="Data loads served from the shared cache in this session")
     
     with col2:
         # Cache hit ratio
-        hits = st.session_state.performance_metrics.get('cache_hits', 0)
-        misses = st.session_state.performance_metrics.get('cache_misses', 0)
         total = hits + misses
         hit_ratio = (hits / total * 100) if total > 0 else 0
         st.metric("Cache Hit Ratio", f"{hit_ratio:.1f}%", help="Percentage of requests served from cache")
@@ -869,46 +1074,37 @@ def render_configuration_panel():
         api_calls = st.session_state.performance_metrics.get('api_calls_made', 0)
         st.metric("API Calls Made", api_calls, help="Total GitHub API calls in this session")
     
-    # Cache management buttons
-    col1, col2, col3 = st.columns(3)
-    
+    # Cache management buttons, placed under the metrics in the same columns
     with col1:
-        if st.button("🗑️ Clear Cache", help="Clear all cached data to force fresh API calls"):
-            st.session_state.github_data_cache.clear()
-            st.session_state.metrics_cache.clear()
-            st.session_state.cache_timestamps.clear()
+        if st.button("🗑️ Clear Cache", help="Clear all cached GitHub data, shared by every session, to force fresh API calls"):
+            clear_github_data_cache()
             st.success("Cache cleared successfully!")
             st.rerun()
     
     with col2:
-        if st.button("🧹 Clear Expired", help="Remove only expired cache entries"):
-            clear_expired_cache()
-            st.success("Expired cache entries cleared!")
-            st.rerun()
-    
-    with col3:
         if st.button("📊 Reset Performance", help="Reset performance metrics counters"):
-            st.session_state.performance_metrics = {
-                'data_load_time': 0,
-                'metrics_calc_time': 0,
-                'chart_render_time': 0,
-                'api_calls_made': 0,
-                'cache_hits': 0,
-                'cache_misses': 0
-            }
+            st.session_state.performance_metrics = SESSION_CONTAINERS['performance_metrics']()
             st.success("Performance metrics reset!")
             st.rerun()
+    
+    # Refresh the main content if this panel changed what it shows
+    if main_content_state() != initial_state:
+        st.rerun()
 
 def render_sidebar_navigation():
     """Render sidebar navigation and configuration"""
     with st.sidebar:
         st.header("🚀 Navigation")
         
-        # Navigation buttons
-        for section, icon in DASHBOARD_SECTIONS.items():
-            if st.button(f"{icon} {section}", key=f"nav_{section}", use_container_width=True):
-                st.session_state.current_section = section
-                st.rerun()
+        # One radio bound to current_section; a change triggers a single rerun
+        # that already renders the new section
+        st.radio(
+            "Section",
+            list(DASHBOARD_SECTIONS),
+            format_func=SECTION_LABELS.get,
+            key="current_section",
+            label_visibility="collapsed"
+        )
         
         st.markdown("---")
         
@@ -917,20 +1113,37 @@ def render_sidebar_navigation():
 
 def get_sample_metrics():
     """Get metrics data - either integrated real data or sample data for demonstration"""
-    from datetime import datetime, timedelta
-    from models.metrics import ProductivityMetrics, CommitMetrics, PRMetrics, ReviewMetrics, IssueMetrics, VelocityPoint
-    
     # Return integrated metrics if available (from real data collection)
-    if hasattr(st.session_state, 'integrated_metrics') and st.session_state.integrated_metrics:
-        return st.session_state.integrated_metrics
+    integrated_metrics = st.session_state.get('integrated_metrics')
+    if integrated_metrics:
+        return integrated_metrics
     
     # Create sample data when real data is not available
-    if not st.session_state.data_loaded:
+    if not st.session_state.get('data_loaded'):
         return None
     
     # Sample metrics (fallback when integrated data is not available)
-    period_start = datetime.now() - timedelta(days=30)
-    period_end = datetime.now()
+    return build_sample_metrics(period_key=datetime.now().date())
+
+@lru_cache(maxsize=1)
+def build_sample_metrics(period_key):
+    """
+    Build the sample metrics shown when no real data has been collected.
+    
+    Memoized per day so reruns get the same object back. A Streamlit cache
+    hit costs more than building the sample (hashing, plus unpickling a copy
+    for cache_data); the renderers only read the metrics, so sharing is safe.
+    
+    Args:
+        period_key: Current date; part of the cache key so a new day starts a new sample period
+        
+    Returns:
+        ProductivityMetrics with sample data for the last 30 days
+    """
+    # Take the time once so the period bounds refer to the same instant
+    now = datetime.now()
+    period_end = now
+    period_start = now - timedelta(days=30)
     
     commit_metrics = CommitMetrics(
         total_commits=45,
@@ -973,18 +1186,31 @@ def get_sample_metrics():
         issues_assigned=5
     )
     
+    # Sample velocity series, computed as whole columns
+    import numpy as np
+    
+    days = np.arange(7)
+    sample_columns = zip(
+        days.tolist(),
+        (6 + days % 3).tolist(),
+        (150 + days * 20).tolist(),
+        (50 + days * 10).tolist(),
+        np.where(days % 2 == 0, 1, 2).tolist(),
+        np.where(days % 3 == 0, 1, 0).tolist()
+    )
+    
     # Sample velocity points
-    velocity_trends = []
-    for i in range(7):
-        date = period_end - timedelta(days=i)
-        velocity_trends.append(VelocityPoint(
-            timestamp=date,
-            commits=6 + (i % 3),
-            additions=150 + (i * 20),
-            deletions=50 + (i * 10),
-            pull_requests=1 if i % 2 == 0 else 2,
-            issues_closed=1 if i % 3 == 0 else 0
-        ))
+    velocity_trends = [
+        VelocityPoint(
+            timestamp=period_end - timedelta(days=day),
+            commits=commits,
+            additions=additions,
+            deletions=deletions,
+            pull_requests=pull_requests,
+            issues_closed=issues_closed
+        )
+        for day, commits, additions, deletions, pull_requests, issues_closed in sample_columns
+    ]
     
     return ProductivityMetrics(
         period_start=period_start,
@@ -997,6 +1223,15 @@ def get_sample_metrics():
         time_distribution={"coding": 65.5, "reviewing": 20.3, "meetings": 14.2}
     )
 
+def format_percent(value: float) -> str:
+    """Format a percentage metric for display, e.g. 83.3%"""
+    return f"{value:.1f}%"
+
+def format_hours(value: float) -> str:
+    """Format a duration metric in hours for display, e.g. 24.5 hours"""
+    return f"{value:.1f} hours"
+
+@st.fragment
 def render_metrics_summary(metrics):
     """Render high-level metrics summary"""
     if not metrics:
@@ -1005,41 +1240,27 @@ def render_metrics_summary(metrics):
     
     st.subheader("📈 Productivity Summary")
     
-    # Key metrics in columns
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric(
-            "Total Commits", 
-            metrics.commit_metrics.total_commits,
-            delta=f"{metrics.daily_commit_average:.1f}/day",
-            help="Total commits in the selected period"
-        )
-    
-    with col2:
-        st.metric(
-            "Pull Requests", 
-            metrics.pr_metrics.total_prs,
-            delta=f"{metrics.pr_metrics.merge_rate:.1f}% merged",
-            help="Total pull requests created"
-        )
-    
-    with col3:
-        st.metric(
-            "Code Reviews", 
-            metrics.review_metrics.total_reviews_given,
-            delta=f"{metrics.review_metrics.review_participation_rate:.1f}% participation",
-            help="Code reviews given to others"
-        )
+    # Key metrics as (label, value, delta, help)
+    summary_metrics = [
+        ("Total Commits", metrics.commit_metrics.total_commits,
+         f"{metrics.daily_commit_average:.1f}/day",
+         "Total commits in the selected period"),
+        ("Pull Requests", metrics.pr_metrics.total_prs,
+         f"{format_percent(metrics.pr_metrics.merge_rate)} merged",
+         "Total pull requests created"),
+        ("Code Reviews", metrics.review_metrics.total_reviews_given,
+         f"{format_percent(metrics.review_metrics.review_participation_rate)} participation",
+         "Code reviews given to others"),
+        ("Issues Resolved", metrics.issue_metrics.closed_issues,
+         f"{format_percent(metrics.issue_metrics.resolution_rate)} rate",
+         "Issues closed in the period"),
+    ]
     
-    with col4:
-        st.metric(
-            "Issues Resolved", 
-            metrics.issue_metrics.closed_issues,
-            delta=f"{metrics.issue_metrics.resolution_rate:.1f}% rate",
-            help="Issues closed in the period"
-        )
+    for col, (label, value, delta, help_text) in zip(st.columns(len(summary_metrics)), summary_metrics):
+        with col:
+            st.metric(label, value, delta=delta, help=help_text)
 
+@st.fragment
 def render_detailed_metrics(metrics):
     """Render detailed metrics breakdown"""
     if not metrics:
@@ -1050,63 +1271,73 @@ def render_detailed_metrics(metrics):
     # Create tabs for different metric categories
     tab1, tab2, tab3, tab4 = st.tabs(["💻 Commits", "🔄 Pull Requests", "👥 Reviews", "🐛 Issues"])
     
+    # Each tab renders its metrics as one table rather than a metric card per value
     with tab1:
         st.markdown("**Commit Activity**")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.metric("Average Additions", f"{metrics.commit_metrics.average_additions:.0f}")
-            st.metric("Average Deletions", f"{metrics.commit_metrics.average_deletions:.0f}")
-            st.metric("Files per Commit", f"{metrics.commit_metrics.average_files_changed:.1f}")
-        
-        with col2:
-            st.metric("Message Length", f"{metrics.commit_metrics.commit_message_length_avg:.0f} chars")
-            if metrics.commit_metrics.most_active_hours:
-                active_hours = ", ".join(f"{h}:00" for h in metrics.commit_metrics.most_active_hours[:3])
-                st.metric("Most Active Hours", active_hours)
+        rows = [
+            ("Average Additions", f"{metrics.commit_metrics.average_additions:.0f}"),
+            ("Average Deletions", f"{metrics.commit_metrics.average_deletions:.0f}"),
+            ("Files per Commit", f"{metrics.commit_metrics.average_files_changed:.1f}"),
+            ("Message Length", f"{metrics.commit_metrics.commit_message_length_avg:.0f} chars"),
+        ]
+        if metrics.commit_metrics.most_active_hours:
+            active_hours = ", ".join(f"{h}:00" for h in metrics.commit_metrics.most_active_hours[:3])
+            rows.append(("Most Active Hours", active_hours))
+        render_metric_table(rows)
     
     with tab2:
         st.markdown("**Pull Request Performance**")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.metric("Merged PRs", metrics.pr_metrics.merged_prs)
-            st.metric("Open PRs", metrics.pr_metrics.open_prs)
-            st.metric("Closed PRs", metrics.pr_metrics.closed_prs)
-        
-        with col2:
-            if metrics.pr_metrics.average_time_to_merge:
-                st.metric("Avg Time to Merge", f"{metrics.pr_metrics.average_time_to_merge:.1f} hours")
-            st.metric("Avg Commits/PR", f"{metrics.pr_metrics.average_commits_per_pr:.1f}")
-            st.metric("Avg Changes/PR", f"{metrics.pr_metrics.average_additions + metrics.pr_metrics.average_deletions:.0f}")
+        rows = [
+            ("Merged PRs", metrics.pr_metrics.merged_prs),
+            ("Open PRs", metrics.pr_metrics.open_prs),
+            ("Closed PRs", metrics.pr_metrics.closed_prs),
+        ]
+        if metrics.pr_metrics.average_time_to_merge:
+            rows.append(("Avg Time to Merge", format_hours(metrics.pr_metrics.average_time_to_merge)))
+        rows.append(("Avg Commits/PR", f"{metrics.pr_metrics.average_commits_per_pr:.1f}"))
+        rows.append(("Avg Changes/PR", f"{metrics.pr_metrics.average_additions + metrics.pr_metrics.average_deletions:.0f}"))
+        render_metric_table(rows)
     
     with tab3:
         st.markdown("**Code Review Activity**")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.metric("Reviews Given", metrics.review_metrics.total_reviews_given)
-            st.metric("Reviews Received", metrics.review_metrics.total_reviews_received)
-        
-        with col2:
-            st.metric("Approval Rate", f"{metrics.review_metrics.approval_rate:.1f}%")
-            st.metric("Change Request Rate", f"{metrics.review_metrics.change_request_rate:.1f}%")
-            if metrics.review_metrics.average_review_time:
-                st.metric("Avg Review Time", f"{metrics.review_metrics.average_review_time:.1f} hours")
+        rows = [
+            ("Reviews Given", metrics.review_metrics.total_reviews_given),
+            ("Reviews Received", metrics.review_metrics.total_reviews_received),
+            ("Approval Rate", format_percent(metrics.review_metrics.approval_rate)),
+            ("Change Request Rate", format_percent(metrics.review_metrics.change_request_rate)),
+        ]
+        if metrics.review_metrics.average_review_time:
+            rows.append(("Avg Review Time", format_hours(metrics.review_metrics.average_review_time)))
+        render_metric_table(rows)
     
     with tab4:
         st.markdown("**Issue Management**")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.metric("Issues Created", metrics.issue_metrics.issues_created)
-            st.metric("Issues Assigned", metrics.issue_metrics.issues_assigned)
-        
-        with col2:
-            st.metric("Issues Closed", metrics.issue_metrics.closed_issues)
-            if metrics.issue_metrics.average_time_to_close:
-                st.metric("Avg Time to Close", f"{metrics.issue_metrics.average_time_to_close:.1f} hours")
+        rows = [
+            ("Issues Created", metrics.issue_metrics.issues_created),
+            ("Issues Assigned", metrics.issue_metrics.issues_assigned),
+            ("Issues Closed", metrics.issue_metrics.closed_issues),
+        ]
+        if metrics.issue_metrics.average_time_to_close:
+            rows.append(("Avg Time to Close", format_hours(metrics.issue_metrics.average_time_to_close)))
+        render_metric_table(rows)
+
+def render_metric_table(rows):
+    """
+    Render labelled metric values as a single table element.
+    
+    Args:
+        rows: List of (label, value) pairs; values are shown as text
+    """
+    st.dataframe(
+        {
+            "Metric": [label for label, _ in rows],
+            "Value": [str(value) for _, value in rows],
+        },
+        use_container_width=True,
+        hide_index=True
+    )
 
+@st.fragment
 def render_activity_distribution(metrics):
     """Render time distribution chart"""
     if not metrics or not metrics.time_distribution:
@@ -1115,43 +1346,51 @@ def render_activity_distribution(metrics):
     st.subheader("⏰ Time Distribution")
     
     # Create a simple bar chart for time distribution
-    import pandas as pd
+    st.bar_chart(time_distribution_frame(tuple(metrics.time_distribution.items())))
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def time_distribution_frame(distribution_items: tuple):
+    """
+    Build the time distribution chart data, reused while the distribution is unchanged.
     
-    df = pd.DataFrame(
-        list(metrics.time_distribution.items()),
-        columns=['Activity', 'Hours']
-    )
+    Args:
+        distribution_items: Tuple of (activity, hours) pairs
+        
+    Returns:
+        Series of hours indexed by activity
+    """
+    import pandas as pd
     
-    st.bar_chart(df.set_index('Activity'))
+    return pd.Series(dict(distribution_items), name='Hours').rename_axis('Activity')
 
 def render_overview_section():
     """Render the overview dashboard section"""
     st.header("📊 Dashboard Overview")
     st.markdown("Welcome to your GitHub Productivity Dashboard")
     
+    credentials_valid = st.session_state.credentials_valid
+    data_loaded = st.session_state.data_loaded
+    
     # Status indicators
-    col1, col2, col3 = st.columns(3)
+    if credentials_valid:
+        credentials_badge = ("success", "✅ Credentials Configured")
+    else:
+        credentials_badge = ("warning", "⚠️ Configure Credentials")
     
-    with col1:
-        if st.session_state.credentials_valid:
-            st.success("✅ Credentials Configured")
+    if data_loaded:
+        if st.session_state.get('integrated_metrics'):
+            data_badge = ("success", "✅ Real Data Loaded")
         else:
-            st.warning("⚠️ Configure Credentials")
+            data_badge = ("success", "✅ Sample Data Loaded")
+    else:
+        data_badge = ("info", "📊 No Data Loaded")
     
-    with col2:
-        if st.session_state.data_loaded:
-            if hasattr(st.session_state, 'integrated_metrics') and st.session_state.integrated_metrics:
-                st.success("✅ Real Data Loaded")
-            else:
-                st.success("✅ Sample Data Loaded")
-        else:
-            st.info("📊 No Data Loaded")
+    if credentials_valid and data_loaded:
+        analysis_badge = ("success", "🔄 Ready for Analysis")
+    else:
+        analysis_badge = ("info", "🔄 Configure & Load Data")
     
-    with col3:
-        if st.session_state.credentials_valid and st.session_state.data_loaded:
-            st.success("🔄 Ready for Analysis")
-        else:
-            st.info("🔄 Configure & Load Data")
+    render_status_badges([credentials_badge, data_badge, analysis_badge])
     
     st.markdown("---")
     
@@ -1159,8 +1398,8 @@ def render_overview_section():
     metrics = get_sample_metrics()
     
     # Show repository information if real data is loaded
-    if hasattr(st.session_state, 'repository_info') and st.session_state.repository_info:
-        repo_info = st.session_state.repository_info
+    repo_info = st.session_state.repository_info
+    if repo_info:
         st.markdown("---")
         st.subheader("📁 Repository Information")
         
@@ -1218,7 +1457,7 @@ def render_overview_section():
         render_activity_distribution(metrics)
         
         # Auto-refresh functionality
-        if st.session_state.credentials_valid and st.session_state.data_loaded:
+        if credentials_valid and data_loaded:
             st.markdown("---")
             col1, col2, col3 = st.columns([1, 1, 1])
             
@@ -1226,21 +1465,15 @@ def render_overview_section():
                 if st.button("🔄 Refresh Data", help="Reload data from GitHub"):
                     with st.spinner("Refreshing data..."):
                         # Clear relevant cache entries to force fresh data
-                        if hasattr(st.session_state, 'repository_info') and st.session_state.repository_info:
-                            repo_info = st.session_state.repository_info
+                        repo_info = st.session_state.repository_info
+                        if repo_info:
                             repo_owner = repo_info['owner']
                             repo_name = repo_info['name']
                             
                             # Clear cache for this repository
-                            keys_to_remove = []
-                            for cache_key in st.session_state.github_data_cache.keys():
-                                if f"{repo_owner}/{repo_name}" in str(cache_key):
-                                    keys_to_remove.append(cache_key)
-                            
-                            for key in keys_to_remove:
-                                st.session_state.github_data_cache.pop(key, None)
-                                st.session_state.metrics_cache.pop(key, None)
-                                st.session_state.cache_timestamps.pop(key, None)
+                            clear_github_data_cache(
+                                st.session_state.github_token, repo_owner, repo_name, repo_info['since']
+                            )
                             
                             # Trigger data reload
                             st.session_state.data_loaded = False
@@ -1265,14 +1498,10 @@ def render_metrics_section():
     
     # Period information
     st.subheader("📅 Analysis Period")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric("Period Start", metrics.period_start.strftime("%Y-%m-%d"))
-    with col2:
-        st.metric("Period End", metrics.period_end.strftime("%Y-%m-%d"))
-    with col3:
-        st.metric("Total Days", metrics.period_days)
+    st.markdown(
+        f"**{metrics.period_start:%Y-%m-%d}** → **{metrics.period_end:%Y-%m-%d}** "
+        f"({metrics.period_days} days)"
+    )
     
     st.markdown("---")
     
@@ -1296,17 +1525,15 @@ def render_metrics_section():
         import pandas as pd
         
         recent_velocity = metrics.velocity_trends[:5]  # Last 5 days
-        df = pd.DataFrame([
-            {
-                'Date': vp.timestamp.strftime("%Y-%m-%d"),
-                'Commits': vp.commits,
-                'Additions': vp.additions,
-                'Deletions': vp.deletions,
-                'PRs': vp.pull_requests,
-                'Issues': vp.issues_closed
-            }
-            for vp in recent_velocity
-        ])
+        # Build column-wise so pandas doesn't have to transpose per-row dicts
+        df = pd.DataFrame({
+            'Date': [vp.timestamp.strftime("%Y-%m-%d") for vp in recent_velocity],
+            'Commits': [vp.commits for vp in recent_velocity],
+            'Additions': [vp.additions for vp in recent_velocity],
+            'Deletions': [vp.deletions for vp in recent_velocity],
+            'PRs': [vp.pull_requests for vp in recent_velocity],
+            'Issues': [vp.issues_closed for vp in recent_velocity]
+        })
         
         st.dataframe(df, use_container_width=True)
 
@@ -1341,15 +1568,8 @@ def detect_data_changes(metrics):
     if 'last_data_signature' not in st.session_state:
         st.session_state.last_data_signature = None
     
-    # Create a signature of the current data
-    current_signature = {
-        'period_start': metrics.period_start,
-        'period_end': metrics.period_end,
-        'total_commits': metrics.commit_metrics.total_commits,
-        'total_prs': metrics.pr_metrics.total_prs,
-        'total_reviews': metrics.review_metrics.total_reviews_given,
-        'total_issues': metrics.issue_metrics.total_issues
-    }
+    # Same fields as the analysis cache keys, so a change here always means a cache miss
+    current_signature = analysis_cache_key(metrics, "data")
     
     # Check if data has changed
     if st.session_state.last_data_signature != current_signature:
@@ -1369,104 +1589,242 @@ def generate_real_time_analysis(metrics, analysis_type="summary"):
         if not st.session_state.get('openai_key'):
             raise ValueError("OpenAI API key is required for AI analysis")
         
-        from models.config import OpenAICredentials
-        from utils.chatgpt_analyzer import ChatGPTAnalyzer, ProductivityInsightGenerator
-        
         # Create analyzer with error handling
-        credentials = OpenAICredentials(api_key=st.session_state.openai_key.strip())
-        analyzer = ChatGPTAnalyzer(credentials)
+        analyzer = get_openai_analyzer(st.session_state.openai_key.strip())
+        
+        # Reuse results persisted by any session for identical metrics
+        llm_cache = get_llm_cache()
+        parts = COMBINED_ANALYSIS_PARTS if analysis_type == "combined" else (analysis_type,)
+        persisted = {part: llm_cache.get(persisted_analysis_key(metrics, part)) for part in parts}
+        if None not in persisted.values():
+            return persisted if analysis_type == "combined" else persisted[analysis_type]
         
         # Validate credentials first
         if not analyzer.validate_credentials():
             raise ValueError("OpenAI API credentials validation failed - check key and account status")
         
-        # Generate analysis based on type with fallbacks
+        # Generate analysis based on type; the analyzer raises instead of returning
+        # its own fallbacks, so only model output reaches the shared disk cache
         try:
             if analysis_type == "summary":
-                return analyzer.analyze_productivity_trends(metrics)
+                result = analyzer.analyze_productivity_trends(metrics, fallback=False)
             elif analysis_type == "detailed":
-                insight_generator = ProductivityInsightGenerator(analyzer)
-                return insight_generator.generate_comprehensive_insights(metrics)
+                insight_generator = get_insight_generator(st.session_state.openai_key.strip())
+                result = insight_generator.generate_comprehensive_insights(metrics, fallback=False)
             elif analysis_type == "trends":
-                return analyzer.analyze_trends(metrics)
+                result = analyzer.analyze_trends(metrics, fallback=False)
             elif analysis_type == "anomalies":
-                return analyzer.identify_anomalies(metrics)
+                result = analyzer.identify_anomalies(metrics, fallback=False)
+            elif analysis_type == "combined":
+                # One completion serves both the summary and the detailed insights
+                report, trends = analyzer.generate_combined_analysis(metrics)
+                insight_generator = get_insight_generator(st.session_state.openai_key.strip())
+                result = {
+                    "summary": report,
+                    "detailed": insight_generator.generate_comprehensive_insights(
+                        metrics, report, trends, fallback=False
+                    )
+                }
             else:
                 raise ValueError(f"Unknown analysis type: {analysis_type}")
         
         except Exception as analysis_error:
-            # Create fallback analysis based on type
+            # Create fallback analysis based on type; fallbacks are never persisted
             return create_fallback_analysis(metrics, analysis_type, str(analysis_error))
+        
+        # Combined results are persisted per part so the single-type views find them
+        for part, value in (result if analysis_type == "combined" else {analysis_type: result}).items():
+            if value is not None:
+                llm_cache.set(persisted_analysis_key(metrics, part), value)
+        return result
             
     except Exception as e:
         error_handler.handle_openai_api_error(e, f"real_time_analysis_{analysis_type}")
         raise
 
-def create_fallback_analysis(metrics, analysis_type: str, error_message: str):
-    """Create fallback analysis when AI analysis fails"""
-    fallback_data = {
+def fallback_status(metrics, analysis_type: str, error_message: str) -> dict:
+    """Base fallback payload recording why AI analysis was unavailable"""
+    return {
         'status': 'fallback',
         'error_message': error_message,
         'generated_at': datetime.now().isoformat(),
         'analysis_type': analysis_type
     }
+
+def fallback_summary(metrics, analysis_type: str, error_message: str):
+    """Fallback summary report built from the basic metrics"""
+    return AnalysisReport(
+        generated_at=datetime.now(),
+        summary=f"Basic analysis for {metrics.period_days} day period with {metrics.commit_metrics.total_commits} commits.",
+        key_insights=[
+            f"Total commits: {metrics.commit_metrics.total_commits}",
+            f"Pull requests: {metrics.pr_metrics.total_prs} ({metrics.pr_metrics.merge_rate:.1f}% merge rate)",
+            f"Code reviews: {metrics.review_metrics.total_reviews_given} given"
+        ],
+        recommendations=[
+            "AI analysis temporarily unavailable - basic metrics shown",
+            "Try refreshing the analysis in a few minutes"
+        ],
+        anomalies=[],
+        confidence_score=0.5
+    )
+
+def fallback_detailed(metrics, analysis_type: str, error_message: str) -> dict:
+    """Fallback detailed insights with neutral scores"""
+    fallback_data = fallback_status(metrics, analysis_type, error_message)
+    fallback_data.update({
+        'performance_score': 75.0,
+        'overview': {
+            'summary': f"Fallback analysis for {metrics.period_days} day period",
+            'key_insights': [f"Processed {metrics.commit_metrics.total_commits} commits"],
+            'confidence_score': 0.5
+        },
+        'trends': {
+            'trend_direction': 'stable',
+            'key_patterns': ['AI analysis temporarily unavailable'],
+            'confidence_score': 0.5
+        }
+    })
+    return fallback_data
+
+def fallback_trends(metrics, analysis_type: str, error_message: str) -> dict:
+    """Fallback trend analysis reporting a stable trend"""
+    return {
+        'trend_direction': 'stable',
+        'key_patterns': ['Trend analysis temporarily unavailable'],
+        'confidence_score': 0.0,
+        'fallback': True
+    }
+
+def fallback_executive(metrics, analysis_type: str, error_message: str) -> dict:
+    """Fallback executive summary reporting stable productivity"""
+    return {
+        'overall_assessment': 'Satisfactory',
+        'key_achievements': [f"Completed {metrics.commit_metrics.total_commits} commits"],
+        'concerns': [],
+        'strategic_recommendations': ['AI analysis temporarily unavailable - try again in a few minutes'],
+        'productivity_trend': 'Stable',
+        'executive_summary': f"Basic summary for {metrics.period_days} day period with {metrics.commit_metrics.total_commits} commits and {metrics.pr_metrics.merge_rate:.1f}% PR merge rate.",
+        'fallback': True
+    }
+
+# Fallback builder per analysis type; other types get the base fallback_status payload
+FALLBACK_BUILDERS = {
+    "summary": fallback_summary,
+    "detailed": fallback_detailed,
+    "executive": fallback_executive,
+    "trends": fallback_trends,
+    "anomalies": lambda metrics, analysis_type, error_message: [],
+    "combined": lambda metrics, analysis_type, error_message: {
+        "summary": fallback_summary(metrics, "summary", error_message),
+        "detailed": fallback_detailed(metrics, "detailed", error_message),
+    },
+}
+
+def create_fallback_analysis(metrics, analysis_type: str, error_message: str):
+    """Create fallback analysis when AI analysis fails"""
+    builder = FALLBACK_BUILDERS.get(analysis_type, fallback_status)
+    return builder(metrics, analysis_type, error_message)
+
+# Session AI cache key; compared field by field, so distinct metrics never share an entry
+AnalysisKey = namedtuple(
+    'AnalysisKey', 'kind period_start period_end total_commits total_prs total_reviews total_issues'
+)
+
+def analysis_cache_key(metrics, prefix: str) -> AnalysisKey:
+    """
+    Build the AI analysis cache key for a metrics object.
     
-    if analysis_type == "summary":
-        from models.metrics import AnalysisReport
-        return AnalysisReport(
-            generated_at=datetime.now(),
-            summary=f"Basic analysis for {metrics.period_days} day period with {metrics.commit_metrics.total_commits} commits.",
-            key_insights=[
-                f"Total commits: {metrics.commit_metrics.total_commits}",
-                f"Pull requests: {metrics.pr_metrics.total_prs} ({metrics.pr_metrics.merge_rate:.1f}% merge rate)",
-                f"Code reviews: {metrics.review_metrics.total_reviews_given} given"
-            ],
-            recommendations=[
-                "AI analysis temporarily unavailable - basic metrics shown",
-                "Try refreshing the analysis in a few minutes"
-            ],
-            anomalies=[],
-            confidence_score=0.5
-        )
+    Args:
+        metrics: ProductivityMetrics the analysis was generated from
+        prefix: Analysis kind, e.g. "analysis" or "detailed"
     
-    elif analysis_type == "detailed":
-        fallback_data.update({
-            'performance_score': 75.0,
-            'overview': {
-                'summary': f"Fallback analysis for {metrics.period_days} day period",
-                'key_insights': [f"Processed {metrics.commit_metrics.total_commits} commits"],
-                'confidence_score': 0.5
-            },
-            'trends': {
-                'trend_direction': 'stable',
-                'key_patterns': ['AI analysis temporarily unavailable'],
-                'confidence_score': 0.5
-            }
-        })
-        return fallback_data
+    Returns:
+        AnalysisKey of the prefix, analysis period and activity totals
+    """
+    return AnalysisKey(
+        prefix,
+        metrics.period_start,
+        metrics.period_end,
+        metrics.commit_metrics.total_commits,
+        metrics.pr_metrics.total_prs,
+        metrics.review_metrics.total_reviews_given,
+        metrics.issue_metrics.total_issues
+    )
+
+@st.cache_resource(show_spinner=False)
+def get_llm_cache():
+    """
+    Get the on-disk AI analysis cache, shared by all sessions.
     
-    elif analysis_type == "trends":
-        return {
-            'trend_direction': 'stable',
-            'key_patterns': ['Trend analysis temporarily unavailable'],
-            'confidence_score': 0.0,
-            'fallback': True
-        }
+    Returns:
+        LLMDiskCache backed by the default SQLite database
+    """
+    return LLMDiskCache()
+
+def metrics_digest(metrics) -> str:
+    """
+    Hash the full content of a metrics object, once per object.
     
-    elif analysis_type == "anomalies":
-        return []
+    The dataclass repr walks every metric and velocity point, so the digest
+    is kept in session state for the metrics object it was computed from and
+    reused until a different object is passed in.
     
-    return fallback_data
+    Args:
+        metrics: ProductivityMetrics to hash
+    
+    Returns:
+        SHA256 hex digest of the metrics repr
+    """
+    source, digest = st.session_state.get('metrics_digest', (None, None))
+    if source is not metrics:
+        digest = hashlib.sha256(repr(metrics).encode()).hexdigest()
+        st.session_state.metrics_digest = (metrics, digest)
+    return digest
+
+def persisted_analysis_key(metrics, analysis_type: str) -> Optional[str]:
+    """
+    Build the on-disk cache key for an analysis of a metrics object.
+    
+    Args:
+        metrics: ProductivityMetrics the analysis is generated from
+        analysis_type: Analysis kind passed to generate_real_time_analysis
+    
+    Returns:
+        SHA256 key covering the metrics content, analysis type, model and
+        prompt version, or None when no OpenAI key is configured
+    """
+    if not st.session_state.get('openai_key'):
+        return None
+    
+    analyzer = get_openai_analyzer(st.session_state.openai_key.strip())
+    return make_key(
+        metrics=metrics_digest(metrics),
+        type=analysis_type,
+        model=analyzer.credentials.model,
+        v=ANALYSIS_PROMPT_VERSION
+    )
+
+def load_persisted_analysis(metrics, analysis_type: str):
+    """Return an analysis stored on disk by an earlier session, or None"""
+    persisted_key = persisted_analysis_key(metrics, analysis_type)
+    if persisted_key is None:
+        return None
+    return get_llm_cache().get(persisted_key)
+
+def forget_persisted_analysis(metrics, analysis_type: str):
+    """Remove an analysis from the on-disk cache so the next request regenerates it"""
+    persisted_key = persisted_analysis_key(metrics, analysis_type)
+    if persisted_key is not None:
+        get_llm_cache().delete(persisted_key)
 
 def auto_generate_analysis_if_needed(metrics):
     """Automatically generate analysis if data has changed and auto-refresh is enabled"""
     # Check if auto-refresh is enabled for any analysis type
-    auto_refresh_enabled = (
-        st.session_state.get('auto_refresh_summary', False) or
-        st.session_state.get('auto_refresh_detailed', False)
-    )
+    refresh_summary = st.session_state.get('auto_refresh_summary', False)
+    refresh_detailed = st.session_state.get('auto_refresh_detailed', False)
     
-    if not auto_refresh_enabled:
+    if not (refresh_summary or refresh_detailed):
         return
     
     # Check if data has changed
@@ -1481,9 +1839,18 @@ def auto_generate_analysis_if_needed(metrics):
     st.info("🔄 Data changes detected - auto-generating analysis...")
     
     try:
+        # Both views refreshing together share a single API call
+        if refresh_summary and refresh_detailed:
+            with st.spinner("Updating AI analysis and detailed insights..."):
+                combined = generate_real_time_analysis(metrics, "combined")
+                st.session_state.ai_analysis_cache[analysis_cache_key(metrics, "analysis")] = combined["summary"]
+                st.session_state.detailed_insights_cache[analysis_cache_key(metrics, "detailed")] = combined["detailed"]
+            
+            st.success("✅ Analysis and detailed insights updated automatically")
+        
         # Auto-generate summary analysis if enabled
-        if st.session_state.get('auto_refresh_summary', False):
-            cache_key = f"analysis_{metrics.period_start}_{metrics.period_end}_{hash(str(metrics.commit_metrics.total_commits))}"
+        elif refresh_summary:
+            cache_key = analysis_cache_key(metrics, "analysis")
             
             with st.spinner("Updating AI analysis..."):
                 analysis_report = generate_real_time_analysis(metrics, "summary")
@@ -1492,8 +1859,8 @@ def auto_generate_analysis_if_needed(metrics):
             st.success("✅ Analysis updated automatically")
         
         # Auto-generate detailed insights if enabled
-        if st.session_state.get('auto_refresh_detailed', False):
-            cache_key = f"detailed_{metrics.period_start}_{metrics.period_end}_{hash(str(metrics.commit_metrics.total_commits))}"
+        elif refresh_detailed:
+            cache_key = analysis_cache_key(metrics, "detailed")
             
             with st.spinner("Updating detailed insights..."):
                 detailed_insights = generate_real_time_analysis(metrics, "detailed")
@@ -1505,21 +1872,25 @@ def auto_generate_analysis_if_needed(metrics):
         st.warning(f"⚠️ Auto-refresh failed: {str(e)}")
         st.info("You can still generate analysis manually using the buttons below.")
 
+@st.fragment
 def render_ai_analysis_summary(metrics):
     """Render AI-generated analysis summary with real-time generation"""
     st.subheader("📋 AI Analysis Summary")
     st.markdown("Comprehensive productivity analysis powered by ChatGPT")
     
-    # Initialize session state for analysis cache and loading states
+    # Initialize session state for analysis cache
     if 'ai_analysis_cache' not in st.session_state:
         st.session_state.ai_analysis_cache = {}
-    if 'analysis_loading' not in st.session_state:
-        st.session_state.analysis_loading = False
     
     # Create cache key based on metrics
-    cache_key = f"analysis_{metrics.period_start}_{metrics.period_end}_{hash(str(metrics.commit_metrics.total_commits))}"
+    cache_key = analysis_cache_key(metrics, "analysis")
+    
+    # Session cache misses fall through to results persisted by earlier sessions
+    if cache_key not in st.session_state.ai_analysis_cache:
+        persisted = load_persisted_analysis(metrics, "summary")
+        if persisted is not None:
+            st.session_state.ai_analysis_cache[cache_key] = persisted
     
-    # Auto-generate analysis if not cached and not currently loading
     analysis_report = None
     if cache_key in st.session_state.ai_analysis_cache:
         analysis_report = st.session_state.ai_analysis_cache[cache_key]
@@ -1533,26 +1904,22 @@ def render_ai_analysis_summary(metrics):
     col1, col2, col3 = st.columns([1, 1, 1])
     
     with col1:
-        if st.button("🔄 Generate Analysis", type="primary", use_container_width=True, 
-                    disabled=st.session_state.analysis_loading):
-            st.session_state.analysis_loading = True
-            st.rerun()
+        generate_requested = st.button("🔄 Generate Analysis", type="primary", use_container_width=True)
     
     with col2:
-        if st.button("🗑️ Clear Cache", use_container_width=True, 
-                    disabled=st.session_state.analysis_loading):
+        if st.button("🗑️ Clear Cache", use_container_width=True):
             if cache_key in st.session_state.ai_analysis_cache:
                 del st.session_state.ai_analysis_cache[cache_key]
-            st.success("Cache cleared")
-            st.rerun()
+            forget_persisted_analysis(metrics, "summary")
+            st.rerun(scope="fragment")
     
     with col3:
         auto_refresh = st.checkbox("🔄 Auto-refresh", 
                                   key="auto_refresh_summary",
                                   help="Automatically refresh analysis when data changes")
     
-    # Handle loading state and analysis generation
-    if st.session_state.analysis_loading:
+    # Generate in place; the fragment redraws only this tab
+    if generate_requested:
         with loading_context("ai_analysis", "Analyzing your productivity data...") as update_progress:
             try:
                 # Update progress with detailed steps
@@ -1571,17 +1938,9 @@ def render_ai_analysis_summary(metrics):
                 
                 update_progress(1.0, "Analysis complete!")
                 
-                # Reset loading state
-                st.session_state.analysis_loading = False
-                
-                # Show success and rerun to display results
                 show_success("AI analysis generated successfully!")
-                st.rerun()
                 
             except Exception as e:
-                # Reset loading state
-                st.session_state.analysis_loading = False
-                
                 # Show comprehensive error message
                 feedback_manager.show_error_message(
                     "AI Analysis Generation Failed",
@@ -1591,8 +1950,7 @@ def render_ai_analysis_summary(metrics):
                         "Ensure you have a stable internet connection", 
                         "Try again in a few moments if the service is temporarily unavailable",
                         "Consider using the dashboard without AI features for now"
-                    ],
-                    retry_callback=lambda: st.session_state.update({'analysis_loading': True}) or st.rerun()
+                    ]
                 )
                 
                 return
@@ -1621,18 +1979,8 @@ def render_ai_analysis_summary(metrics):
         if analysis_report.anomalies:
             st.subheader("⚠️ Anomalies Detected")
             for anomaly in analysis_report.anomalies:
-                severity_color = {
-                    'LOW': 'info',
-                    'MEDIUM': 'warning', 
-                    'HIGH': 'error'
-                }.get(anomaly.severity, 'info')
-                
-                if severity_color == 'error':
-                    st.error(f"**{anomaly.metric_name}**: {anomaly.description}")
-                elif severity_color == 'warning':
-                    st.warning(f"**{anomaly.metric_name}**: {anomaly.description}")
-                else:
-                    st.info(f"**{anomaly.metric_name}**: {anomaly.description}")
+                render_alert = SEVERITY_RENDERERS.get(anomaly.severity, st.info)
+                render_alert(f"**{anomaly.metric_name}**: {anomaly.description}")
         
         # Confidence score
         st.markdown("---")
@@ -1644,6 +1992,49 @@ def render_ai_analysis_summary(metrics):
         # Analysis metadata
         st.caption(f"Analysis generated at: {analysis_report.generated_at.strftime('%Y-%m-%d %H:%M:%S')}")
 
+def submit_ai_question():
+    """Move the typed question to pending_question and clear the input box"""
+    st.session_state.pending_question = st.session_state.ai_question_input.strip()
+    st.session_state.ai_question_input = ""
+
+def suggest_ai_question(question: str):
+    """Ask a suggested question straight away"""
+    st.session_state.pending_question = question
+
+def answer_ai_question(metrics, question: str) -> str:
+    """
+    Answer a question about the metrics with a cancellable async request.
+    
+    The first suggested question asked for a metrics set fetches the answers
+    to every suggested question concurrently, so later suggestions are lookups.
+    
+    Args:
+        metrics: ProductivityMetrics the question refers to
+        question: Question typed by the user or picked from SUGGESTED_QUESTIONS
+    
+    Returns:
+        Answer text
+    """
+    analyzer = get_openai_analyzer(st.session_state.openai_key.strip())
+    
+    if question in SUGGESTED_QUESTIONS:
+        key = analysis_cache_key(metrics, "questions")
+        cached_key, answers = st.session_state.get('suggested_answers', (None, {}))
+        if cached_key != key:
+            answers = {}
+        
+        missing = [q for q in SUGGESTED_QUESTIONS if q not in answers]
+        if question in missing:
+            answers.update(analyzer.run_async(
+                analyzer.answer_user_questions_async(missing, metrics), QUESTION_TIMEOUT_SECONDS
+            ))
+            st.session_state.suggested_answers = (key, answers)
+        if question in answers:
+            return answers[question]
+    
+    return analyzer.run_async(analyzer.answer_user_question_async(question, metrics), QUESTION_TIMEOUT_SECONDS)
+
+@st.fragment
 def render_ai_question_interface(metrics):
     """Render AI question answering interface"""
     st.subheader("❓ Ask Questions About Your Data")
@@ -1651,7 +2042,7 @@ def render_ai_question_interface(metrics):
     
     # Initialize session state for Q&A history
     if 'qa_history' not in st.session_state:
-        st.session_state.qa_history = []
+        st.session_state.qa_history = deque(maxlen=QA_HISTORY_LIMIT)
     
     # Question input
     user_question = st.text_area(
@@ -1661,21 +2052,15 @@ def render_ai_question_interface(metrics):
         key="ai_question_input"
     )
     
-    # Initialize loading state for questions
-    if 'question_loading' not in st.session_state:
-        st.session_state.question_loading = False
-    
-    # Submit question button
+    # Submit question button; the callback hands the question over and clears the input
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        if st.button("🤖 Ask AI", type="primary", use_container_width=True, 
-                    disabled=not user_question.strip() or st.session_state.question_loading):
-            if user_question.strip():
-                st.session_state.question_loading = True
-                st.rerun()
-    
-    # Handle question processing
-    if st.session_state.question_loading and user_question.strip():
+        st.button("🤖 Ask AI", type="primary", use_container_width=True,
+                  disabled=not user_question.strip(), on_click=submit_ai_question)
+    
+    # Answer in place; the fragment redraws only this tab
+    question = st.session_state.pop('pending_question', None)
+    if question:
         with st.spinner("🤖 Analyzing your question..."):
             progress_bar = st.progress(0)
             status_text = st.empty()
@@ -1684,44 +2069,35 @@ def render_ai_question_interface(metrics):
                 progress_bar.progress(25)
                 status_text.text("Processing question...")
                 
-                from models.config import OpenAICredentials
-                from utils.chatgpt_analyzer import ChatGPTAnalyzer
-                
-                # Create analyzer
-                credentials = OpenAICredentials(api_key=st.session_state.openai_key)
-                analyzer = ChatGPTAnalyzer(credentials)
-                
                 progress_bar.progress(50)
                 status_text.text("Generating AI response...")
                 
                 # Get answer
-                answer = analyzer.answer_user_question(user_question, metrics)
+                answer = answer_ai_question(metrics, question)
                 
                 progress_bar.progress(90)
                 status_text.text("Finalizing response...")
                 
                 # Add to history
+                # Display strings are formatted once here rather than on every rerun
+                asked_at = datetime.now()
                 st.session_state.qa_history.append({
-                    'question': user_question,
+                    'question': question,
                     'answer': answer,
-                    'timestamp': datetime.now()
+                    'timestamp': asked_at,
+                    'title': f"Q: {question[:100]}{'...' if len(question) > 100 else ''}",
+                    'timestamp_str': asked_at.strftime('%Y-%m-%d %H:%M:%S')
                 })
                 
                 progress_bar.progress(100)
                 status_text.text("Complete!")
                 
-                # Reset states
-                st.session_state.question_loading = False
-                st.session_state.ai_question_input = ""
-                
                 st.success("✅ Question answered!")
-                st.rerun()
                 
             except Exception as e:
                 # Handle errors gracefully
                 progress_bar.empty()
                 status_text.empty()
-                st.session_state.question_loading = False
                 
                 st.error("❌ Failed to process question")
                 
@@ -1738,38 +2114,89 @@ def render_ai_question_interface(metrics):
         st.subheader("💬 Q&A History")
         
         # Show most recent questions first
-        for i, qa in enumerate(reversed(st.session_state.qa_history[-5:])):  # Show last 5
-            with st.expander(f"Q: {qa['question'][:100]}{'...' if len(qa['question']) > 100 else ''}", expanded=(i == 0)):
+        for i, qa in enumerate(islice(reversed(st.session_state.qa_history), 5)):  # Show last 5
+            with st.expander(qa['title'], expanded=(i == 0)):
                 st.markdown(f"**Question:** {qa['question']}")
                 st.markdown(f"**Answer:** {qa['answer']}")
-                st.caption(f"Asked at: {qa['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}")
+                st.caption(f"Asked at: {qa['timestamp_str']}")
         
         # Clear history button
         if st.button("🗑️ Clear Q&A History"):
-            st.session_state.qa_history = []
-            st.rerun()
+            st.session_state.qa_history.clear()
+            st.rerun(scope="fragment")
     
     # Suggested questions
     st.markdown("---")
     st.subheader("💡 Suggested Questions")
     
-    suggested_questions = [
-        "What are my most productive days and times?",
-        "How does my code review participation compare to best practices?",
-        "What patterns do you see in my pull request activity?",
-        "Are there any concerning trends in my productivity?",
-        "How can I improve my development workflow?",
-        "What's my strongest area of contribution?"
-    ]
+    col1, col2 = st.columns([3, 1], vertical_alignment="bottom")
+    with col1:
+        picked = st.selectbox(
+            "Suggested questions",
+            SUGGESTED_QUESTIONS,
+            index=None,
+            placeholder="Pick a suggested question",
+            key="suggested_picker",
+            label_visibility="collapsed"
+        )
+    with col2:
+        st.button("💭 Ask", use_container_width=True, disabled=picked is None,
+                  on_click=suggest_ai_question, args=(picked,))
+
+# Detailed insight categories as (insights key, section title)
+INSIGHT_CATEGORIES = (
+    ('commit_insights', '💻 Commit Patterns'),
+    ('pr_insights', '🔄 Pull Request Patterns'),
+    ('review_insights', '👥 Review Patterns'),
+    ('issue_insights', '🐛 Issue Patterns'),
+)
+
+# One rendered insight category: title, (element, text) items and recommendations
+InsightSection = namedtuple('InsightSection', 'title items recommendations')
+
+def insight_alert(value):
+    """Pick the element for an insight value: colour-coded by wording for text, plain otherwise"""
+    if not isinstance(value, str):
+        return st.write
+    lowered = value.lower()
+    if 'high' in lowered or 'excellent' in lowered:
+        return st.success
+    if 'low' in lowered or 'needs' in lowered:
+        return st.warning
+    return st.info
+
+def build_insight_render_plan(insights: dict) -> list:
+    """
+    Resolve the detailed insight categories into ready-to-render sections.
+    
+    Args:
+        insights: Detailed insights payload from generate_real_time_analysis
     
-    cols = st.columns(2)
-    for i, question in enumerate(suggested_questions):
-        col = cols[i % 2]
-        with col:
-            if st.button(f"💭 {question}", key=f"suggested_q_{i}", use_container_width=True):
-                st.session_state.ai_question_input = question
-                st.rerun()
+    Returns:
+        List of InsightSection for the categories present in the payload
+    """
+    plan = []
+    for key, title in INSIGHT_CATEGORIES:
+        category_insights = insights.get(key)
+        if not category_insights:
+            continue
+        items = [
+            (insight_alert(value), f"**{name.replace('_', ' ').title()}:** {value}")
+            for name, value in category_insights.items()
+            if name != 'recommendations'
+        ]
+        plan.append(InsightSection(title, items, category_insights.get('recommendations') or []))
+    return plan
 
+def insight_render_plan(insights: dict) -> list:
+    """Return the render plan for an insights payload, rebuilt only when the payload changes"""
+    source, plan = st.session_state.get('insight_render_plan', (None, None))
+    if source is not insights:
+        plan = build_insight_render_plan(insights)
+        st.session_state.insight_render_plan = (insights, plan)
+    return plan
+
+@st.fragment
 def render_ai_detailed_insights(metrics):
     """Render detailed AI insights and analysis"""
     st.subheader("🔍 Detailed AI Insights")
@@ -1780,36 +2207,34 @@ def render_ai_detailed_insights(metrics):
         st.session_state.detailed_insights_cache = {}
     
     # Create cache key
-    cache_key = f"detailed_{metrics.period_start}_{metrics.period_end}_{hash(str(metrics.commit_metrics.total_commits))}"
+    cache_key = analysis_cache_key(metrics, "detailed")
     
-    # Initialize loading state for detailed insights
-    if 'detailed_loading' not in st.session_state:
-        st.session_state.detailed_loading = False
+    # Session cache misses fall through to results persisted by earlier sessions
+    if cache_key not in st.session_state.detailed_insights_cache:
+        persisted = load_persisted_analysis(metrics, "detailed")
+        if persisted is not None:
+            st.session_state.detailed_insights_cache[cache_key] = persisted
     
     # Control buttons
     col1, col2, col3 = st.columns([1, 1, 1])
     
     with col1:
-        if st.button("🔍 Generate Insights", type="primary", use_container_width=True,
-                    disabled=st.session_state.detailed_loading):
-            st.session_state.detailed_loading = True
-            st.rerun()
+        generate_requested = st.button("🔍 Generate Insights", type="primary", use_container_width=True)
     
     with col2:
-        if st.button("🗑️ Clear Insights", use_container_width=True,
-                    disabled=st.session_state.detailed_loading):
+        if st.button("🗑️ Clear Insights", use_container_width=True):
             if cache_key in st.session_state.detailed_insights_cache:
                 del st.session_state.detailed_insights_cache[cache_key]
+            forget_persisted_analysis(metrics, "detailed")
             st.success("Insights cache cleared")
-            st.rerun()
     
     with col3:
         real_time_mode = st.checkbox("⚡ Real-time", 
                                    key="auto_refresh_detailed",
                                    help="Generate insights automatically when data changes")
     
-    # Handle detailed insights generation
-    if st.session_state.detailed_loading:
+    # Generate in place; the fragment redraws only this tab
+    if generate_requested:
         with st.spinner("🤖 Generating comprehensive analysis..."):
             progress_bar = st.progress(0)
             status_text = st.empty()
@@ -1833,17 +2258,12 @@ def render_ai_detailed_insights(metrics):
                 progress_bar.progress(100)
                 status_text.text("Insights ready!")
                 
-                # Reset loading state
-                st.session_state.detailed_loading = False
-                
                 st.success("✅ Detailed insights generated successfully!")
-                st.rerun()
                 
             except Exception as e:
                 # Handle errors gracefully
                 progress_bar.empty()
                 status_text.empty()
-                st.session_state.detailed_loading = False
                 
                 st.error("❌ Failed to generate detailed insights")
                 
@@ -1885,12 +2305,7 @@ def render_ai_detailed_insights(metrics):
             
             if 'trend_direction' in trend_data:
                 direction = trend_data['trend_direction']
-                direction_emoji = {
-                    'increasing': '📈',
-                    'decreasing': '📉',
-                    'stable': '➡️',
-                    'volatile': '📊'
-                }.get(direction, '📊')
+                direction_emoji = TREND_EMOJIS.get(direction, '📊')
                 
                 st.write(f"{direction_emoji} **Overall Trend:** {direction.title()}")
             
@@ -1899,48 +2314,21 @@ def render_ai_detailed_insights(metrics):
                 for pattern in trend_data['key_patterns']:
                     st.write(f"• {pattern}")
         
-        # Specific insights by category
-        categories = [
-            ('commit_insights', '💻 Commit Patterns'),
-            ('pr_insights', '🔄 Pull Request Patterns'),
-            ('review_insights', '👥 Review Patterns'),
-            ('issue_insights', '🐛 Issue Patterns')
-        ]
-        
-        for key, title in categories:
-            if key in insights and insights[key]:
-                st.subheader(title)
-                category_insights = insights[key]
-                
-                # Display insights in a structured way
-                cols = st.columns(2)
-                col_idx = 0
-                
-                for insight_key, insight_value in category_insights.items():
-                    if insight_key != 'recommendations':
-                        col = cols[col_idx % 2]
-                        with col:
-                            # Format the insight key for display
-                            display_key = insight_key.replace('_', ' ').title()
-                            
-                            if isinstance(insight_value, str):
-                                # Color code based on value
-                                if 'high' in insight_value.lower() or 'excellent' in insight_value.lower():
-                                    st.success(f"**{display_key}:** {insight_value}")
-                                elif 'low' in insight_value.lower() or 'needs' in insight_value.lower():
-                                    st.warning(f"**{display_key}:** {insight_value}")
-                                else:
-                                    st.info(f"**{display_key}:** {insight_value}")
-                            else:
-                                st.write(f"**{display_key}:** {insight_value}")
-                        
-                        col_idx += 1
-                
-                # Show recommendations for this category
-                if 'recommendations' in category_insights and category_insights['recommendations']:
-                    st.write("**Recommendations:**")
-                    for rec in category_insights['recommendations']:
-                        st.write(f"• {rec}")
+        # Specific insights by category, from the plan built once per payload
+        for section in insight_render_plan(insights):
+            st.subheader(section.title)
+            
+            # Display insights in a structured way
+            cols = st.columns(2)
+            for i, (render_alert, text) in enumerate(section.items):
+                with cols[i % 2]:
+                    render_alert(text)
+            
+            # Show recommendations for this category
+            if section.recommendations:
+                st.write("**Recommendations:**")
+                for rec in section.recommendations:
+                    st.write(f"• {rec}")
         
         # Anomalies section
         if 'anomalies' in insights and insights['anomalies']:
@@ -1996,13 +2384,79 @@ def render_ai_insights_section():
     with tab3:
         render_ai_detailed_insights(metrics)
 
+@st.cache_data(ttl=timedelta(minutes=5), show_spinner=False, max_entries=8,
+               hash_funcs={ProductivityMetrics: metrics_digest})
+def build_metrics_csv(metrics: ProductivityMetrics, export_format: str, include_config: bool) -> str:
+    """
+    Build the metrics CSV export for the selected format.
+    
+    The result is reused across reruns, so changing unrelated export
+    options does not regenerate it.
+    
+    Args:
+        metrics: ProductivityMetrics to export
+        export_format: "Complete Metrics", "Velocity Trends Only" or "Summary Only"
+        include_config: Whether to include the metadata header
+    
+    Returns:
+        CSV content with "\n" line endings
+    """
+    csv_exporter = get_export_manager().csv_exporter
+    
+    if export_format == "Velocity Trends Only":
+        return csv_exporter.export_velocity_trends_only(metrics)
+    
+    csv_content = csv_exporter.export_productivity_metrics(metrics, include_config=include_config)
+    if export_format == "Summary Only":
+        # Truncate to summary only (first part before velocity trends)
+        csv_content = csv_content.split("\n\n## Velocity Trends\n")[0]
+    return csv_content
+
+# Charts listed in the charts HTML export
+CHART_EXPORT_SECTIONS = (
+    {"title": "Commit Frequency Trends", "description": "Daily commit activity over time"},
+    {"title": "Code Volume Analysis", "description": "Lines added and deleted trends"},
+    {"title": "Pull Request Metrics", "description": "PR creation and merge statistics"},
+    {"title": "Review Participation", "description": "Code review activity and quality"},
+)
+
+@st.cache_data(ttl=timedelta(hours=1), show_spinner=False, max_entries=8,
+               hash_funcs={ProductivityMetrics: metrics_digest})
+def build_dashboard_html(metrics: ProductivityMetrics) -> str:
+    """
+    Build the dashboard HTML export, reused across reruns for the same metrics.
+    
+    Args:
+        metrics: ProductivityMetrics to export
+    
+    Returns:
+        HTML content as string
+    """
+    return get_export_manager().export_dashboard_html(metrics)
+
+@st.cache_data(ttl=timedelta(hours=1), show_spinner=False, max_entries=8,
+               hash_funcs={ProductivityMetrics: metrics_digest})
+def build_charts_html(metrics: ProductivityMetrics) -> str:
+    """
+    Build the charts collection HTML export, reused across reruns for the same metrics.
+    
+    Args:
+        metrics: ProductivityMetrics to export
+    
+    Returns:
+        HTML content as string
+    """
+    return get_export_manager().export_charts_html(list(CHART_EXPORT_SECTIONS), metrics)
+
 def render_metrics_export_section(metrics):
     """Render metrics export section with CSV download options"""
     st.subheader("📊 Productivity Metrics Export")
     st.markdown("Export your productivity metrics in CSV format for further analysis")
     
-    from utils.export_manager import ExportManager
-    export_manager = ExportManager()
+    from utils.export_manager import dumps_export_json
+    export_manager = get_export_manager()
+    # Every download offered in this render shares one filename stem
+    filename_slug = export_manager.export_filename_slug(metrics)
     
     # Export options
     st.markdown("**Export Options**")
@@ -2041,35 +2495,25 @@ def render_metrics_export_section(metrics):
     st.markdown("**Export Preview**")
     
     try:
-        if export_format == "Complete Metrics":
-            csv_content = export_manager.csv_exporter.export_productivity_metrics(
-                metrics, include_config=include_config
-            )
-        elif export_format == "Velocity Trends Only":
-            csv_content = export_manager.csv_exporter.export_velocity_trends_only(metrics)
-        else:  # Summary Only
-            csv_content = export_manager.csv_exporter.export_productivity_metrics(
-                metrics, include_config=include_config
-            )
-            # Truncate to summary only (first part before velocity trends)
-            if "\n\n## Velocity Trends\n" in csv_content:
-                csv_content = csv_content.split("\n\n## Velocity Trends\n")[0]
+        csv_content = build_metrics_csv(metrics, export_format, include_config)
+        
+        # Split and encode once; the preview, statistics and download share them
+        lines = csv_content.split('\n')
+        csv_bytes = csv_content.encode('utf-8')
         
         # Show preview (first 20 lines)
-        preview_lines = csv_content.split('\n')[:20]
-        preview_text = '\n'.join(preview_lines)
-        if len(csv_content.split('\n')) > 20:
-            remaining_lines = len(csv_content.split('\n')) - 20
-            preview_text += f"\n... ({remaining_lines} more lines)"
+        preview_text = '\n'.join(lines[:20])
+        if len(lines) > 20:
+            preview_text += f"\n... ({len(lines) - 20} more lines)"
         
         st.code(preview_text, language="csv")
         
         # Export statistics
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("Total Lines", len(csv_content.split('\n')))
+            st.metric("Total Lines", len(lines))
         with col2:
-            st.metric("File Size", f"{len(csv_content.encode('utf-8')) / 1024:.1f} KB")
+            st.metric("File Size", f"{len(csv_bytes) / 1024:.1f} KB")
         with col3:
             st.metric("Data Points", len(metrics.velocity_trends) if metrics.velocity_trends else 0)
         
@@ -2081,10 +2525,10 @@ def render_metrics_export_section(metrics):
         col1, col2, col3 = st.columns([1, 1, 1])
         
         with col1:
-            filename = export_manager.create_export_filename("metrics", metrics, "csv")
+            filename = export_manager.create_export_filename("metrics", metrics, "csv", filename_slug)
             st.download_button(
                 label="📥 Download CSV",
-                data=csv_content,
+                data=csv_bytes,
                 file_name=filename,
                 mime="text/csv",
                 type="primary",
@@ -2092,33 +2536,27 @@ def render_metrics_export_section(metrics):
             )
         
         with col2:
-            # Create JSON export as well
-            import json
-            from dataclasses import asdict
-            
-            json_data = {
-                'metadata': export_manager.get_export_metadata(metrics),
-                'metrics': asdict(metrics)
-            }
-            json_content = json.dumps(json_data, indent=2, default=str)
-            json_filename = export_manager.create_export_filename("metrics", metrics, "json")
+            # JSON export, serialized only when its button is clicked
+            json_filename = export_manager.create_export_filename("metrics", metrics, "json", filename_slug)
             
             st.download_button(
                 label="📄 Download JSON",
-                data=json_content,
+                data=lambda: dumps_export_json({
+                    'metadata': export_manager.get_export_metadata(metrics),
+                    'metrics': asdict(metrics)
+                }),
                 file_name=json_filename,
                 mime="application/json",
                 use_container_width=True
             )
         
         with col3:
-            # Create Excel-compatible CSV
-            excel_csv = csv_content.replace('\n', '\r\n')  # Windows line endings
-            excel_filename = export_manager.create_export_filename("metrics", metrics, "csv")
+            # Excel-compatible CSV with Windows line endings; cheap, so built with the page
+            excel_filename = export_manager.create_export_filename("metrics", metrics, "csv", filename_slug)
             
             st.download_button(
                 label="📊 Excel CSV",
-                data=excel_csv,
+                data=csv_content.replace('\n', '\r\n').encode('utf-8'),
                 file_name=excel_filename,
                 mime="text/csv",
                 help="CSV formatted for Excel compatibility",
@@ -2169,6 +2607,404 @@ def render_metrics_export_section(metrics):
             retry_callback=lambda: st.rerun()
         )
 
+TREND_REPORT_TEMPLATE = """
+TREND ANALYSIS REPORT
+====================
+
+{header}
+Overall Trend Direction: {direction}
+
+Key Patterns:
+{patterns}
+
+Confidence Score: {confidence:.1f}%
+"""
+
+ANOMALY_REPORT_TEMPLATE = """
+ANOMALY DETECTION REPORT
+========================
+
+{header}
+Anomalies Detected: {count}
+
+"""
+
+ANOMALY_ENTRY_TEMPLATE = """
+[{anomaly.severity}] {anomaly.metric_name}
+Description: {anomaly.description}
+Detected: {detected}
+Expected: {anomaly.expected_value}, Actual: {anomaly.actual_value}
+
+"""
+
+def format_analysis_summary_report(analysis_report, metrics, report_exporter, include_metadata, report_header):
+    """Format the Analysis Summary export report"""
+    return report_exporter.export_ai_analysis_report(analysis_report, metrics, include_metadata)
+
+def format_detailed_insights_report(insights, metrics, report_exporter, include_metadata, report_header):
+    """Format the Detailed Insights export report"""
+    return report_exporter.export_comprehensive_insights(insights, metrics)
+
+def format_executive_summary_report(executive_summary, metrics, report_exporter, include_metadata, report_header):
+    """Format the Executive Summary export report"""
+    return report_exporter.export_executive_summary(executive_summary, metrics)
+
+def format_trend_analysis_report(trend_analysis, metrics, report_exporter, include_metadata, report_header):
+    """Format the Trend Analysis export report"""
+    return TREND_REPORT_TEMPLATE.format(
+        header=report_header,
+        direction=trend_analysis.get('trend_direction', 'Unknown'),
+        patterns="\n".join(f"• {pattern}" for pattern in trend_analysis.get('key_patterns', ())),
+        confidence=trend_analysis.get('confidence_score', 0) * 100
+    )
+
+def format_anomaly_report(anomalies, metrics, report_exporter, include_metadata, report_header):
+    """Format the Anomaly Report export report"""
+    content_parts = [ANOMALY_REPORT_TEMPLATE.format(header=report_header, count=len(anomalies))]
+    if anomalies:
+        content_parts.extend(
+            ANOMALY_ENTRY_TEMPLATE.format(anomaly=anomaly, detected=anomaly.timestamp.strftime('%Y-%m-%d %H:%M:%S'))
+            for anomaly in anomalies
+        )
+    else:
+        content_parts.append("No anomalies detected in the current period.\n")
+    return "".join(content_parts)
+
+# Export report text per report type, built from that report's AI result
+REPORT_FORMATTERS = {
+    "Analysis Summary": format_analysis_summary_report,
+    "Detailed Insights": format_detailed_insights_report,
+    "Executive Summary": format_executive_summary_report,
+    "Trend Analysis": format_trend_analysis_report,
+    "Anomaly Report": format_anomaly_report,
+}
+
+async def keyed_analysis(analysis_type: str, coroutine) -> dict:
+    """Await one analysis and key it by type, matching the combined bundle's result shape; a failure maps to its exception"""
+    try:
+        return {analysis_type: await coroutine}
+    except Exception as e:
+        return {analysis_type: e}
+
+async def settled_bundle(analysis_types, coroutine) -> dict:
+    """Await the combined analysis bundle; a failure maps each requested type to its exception"""
+    try:
+        return await coroutine
+    except Exception as e:
+        return dict.fromkeys(analysis_types, e)
+
+def generate_ai_export_results(metrics, report_types, progress_bar, status_text) -> dict:
+    """
+    Get the AI results for the selected export reports.
+    
+    Results cached on disk for identical metrics are reused. Summary, trend
+    and detailed reports are served by one combined request when that saves
+    a call, and the remaining requests run concurrently while the progress
+    bar tracks them.
+    
+    Args:
+        metrics: ProductivityMetrics to analyze
+        report_types: Selected export report names
+        progress_bar: Progress element updated as reports finish
+        status_text: Placeholder for the current generation status
+    
+    Returns:
+        Dictionary of report name to AI result
+    
+    Raises:
+        TimeoutError: If the reports were not ready within REPORT_TIMEOUT_SECONDS
+    """
+    total_reports = len(report_types)
+    
+    # Initialize AI components
+    analyzer = get_openai_analyzer(st.session_state.openai_key.strip())
+    insight_generator = get_insight_generator(st.session_state.openai_key.strip())
+    analysis_requests = {
+        "summary": analyzer.analyze_productivity_trends_async,
+        "detailed": insight_generator.generate_comprehensive_insights_async,
+        "executive": insight_generator.generate_executive_summary_async,
+        "trends": analyzer.analyze_trends_async,
+        "anomalies": analyzer.identify_anomalies_async
+    }
+    
+    # Requests raise instead of returning the analyzer's fallbacks, so failures can be kept off disk
+    
+    # Reports already generated for identical metrics skip the API call
+    llm_cache = get_llm_cache()
+    parts = {}
+    for analysis_type in {REPORT_ANALYSIS_TYPES[report_type] for report_type in report_types}:
+        cached = llm_cache.get(persisted_analysis_key(metrics, analysis_type))
+        if cached is not None:
+            parts[analysis_type] = cached
+    missing = [REPORT_ANALYSIS_TYPES[report_type] for report_type in report_types
+               if REPORT_ANALYSIS_TYPES[report_type] not in parts]
+    done = total_reports - len(missing)
+    progress_bar.progress(done / total_reports)
+    
+    # Summary, trends and detailed insights share one combined request when that saves a call
+    bundled = [analysis_type for analysis_type in missing if analysis_type in BUNDLED_ANALYSIS_TYPES]
+    pending = {}
+    if "detailed" in bundled or len(bundled) > 1:
+        coroutine = settled_bundle(bundled, insight_generator.generate_analysis_bundle_async(metrics, fallback=False))
+        pending[analyzer.submit_async(coroutine)] = bundled
+        missing = [analysis_type for analysis_type in missing if analysis_type not in bundled]
+    
+    # Request every remaining report at once and track them as they finish
+    for analysis_type in missing:
+        coroutine = keyed_analysis(analysis_type, analysis_requests[analysis_type](metrics, fallback=False))
+        pending[analyzer.submit_async(coroutine)] = [analysis_type]
+    status_text.text(f"Generating {total_reports - done} report(s) in {len(pending)} request(s)...")
+    try:
+        for future in as_completed(pending, timeout=REPORT_TIMEOUT_SECONDS):
+            for analysis_type, value in future.result().items():
+                if isinstance(value, Exception):
+                    # Show a fallback in this export only; nothing is persisted for a failed request
+                    logging.warning(f"AI export {analysis_type} analysis failed: {value}")
+                    value = create_fallback_analysis(metrics, analysis_type, str(value))
+                else:
+                    llm_cache.set(persisted_analysis_key(metrics, analysis_type), value)
+                parts[analysis_type] = value
+            done += len(pending[future])
+            progress_bar.progress(done / total_reports)
+            status_text.text(f"Generated {done}/{total_reports} reports")
+    except TimeoutError:
+        for future in pending:
+            future.cancel()
+        raise TimeoutError(f"AI reports were not ready within {REPORT_TIMEOUT_SECONDS} seconds")
+    
+    return {report_type: parts[REPORT_ANALYSIS_TYPES[report_type]] for report_type in report_types}
+
+def build_reports_archive(reports_content) -> bytes:
+    """
+    Pack generated reports into a zip archive with one text file per report.
+    
+    Args:
+        reports_content: List of (title, content) report pairs
+    
+    Returns:
+        DEFLATE-compressed zip archive bytes
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as archive:
+        for title, content in reports_content:
+            archive.writestr(f"{title.replace(' ', '_').lower()}.txt", content)
+    return buffer.getvalue()
+
+def render_ai_reports_output(metrics, report_types, results, report_header, export_format, include_metadata):
+    """
+    Render the preview and downloads for generated AI export reports.
+    
+    Args:
+        metrics: ProductivityMetrics the reports were generated from
+        report_types: Selected export report names, in display order
+        results: Dictionary of report name to AI result
+        report_header: Generation time and period lines for plain-text reports
+        export_format: "Text Report", "Markdown" or "JSON Data"
+        include_metadata: Whether the analysis summary includes its metadata
+    """
+    from utils.export_manager import dumps_export_json
+    export_manager = get_export_manager()
+    # Every download offered in this render shares one filename stem
+    filename_slug = export_manager.export_filename_slug(metrics)
+    
+    reports_content = [
+        (report_type, REPORT_FORMATTERS[report_type](
+            results[report_type], metrics, export_manager.report_exporter,
+            include_metadata, report_header
+        ))
+        for report_type in report_types
+    ]
+    
+    # Combine all reports
+    if export_format == "Text Report":
+        report_sections = []
+        for title, content in reports_content:
+            separator = '=' * len(title)
+            section = f"{title}\n{separator}\n\n{content}"
+            report_sections.append(section)
+        combined_content = "\n\n" + "="*80 + "\n\n".join(report_sections)
+    elif export_format == "Markdown":
+        report_sections = []
+        for title, content in reports_content:
+            section = f"# {title}\n\n{content}"
+            report_sections.append(section)
+        combined_content = "\n\n---\n\n".join(report_sections)
+    else:  # JSON
+        json_data = {
+            'metadata': export_manager.get_export_metadata(metrics, {
+                'report_types': report_types,
+                'ai_model': get_openai_analyzer(st.session_state.openai_key.strip()).credentials.model
+            }),
+            'reports': {title: content for title, content in reports_content}
+        }
+        combined_content = dumps_export_json(json_data)
+    
+    # Report statistics, each computed with one pass over the content
+    total_lines = combined_content.count('\n') + 1
+    combined_bytes = combined_content.encode('utf-8')
+    word_count = len(combined_content.split())
+    
+    # Show preview; the bounded split stops after the previewed lines
+    st.markdown("**Report Preview**")
+    preview_text = '\n'.join(combined_content.split('\n', 30)[:30])
+    if total_lines > 30:
+        remaining_lines = total_lines - 30
+        preview_text += f"\n... ({remaining_lines} more lines)"
+    
+    st.code(preview_text, language="markdown" if export_format == "Markdown" else "text")
+    
+    # Export statistics
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Reports Generated", len(reports_content))
+    with col2:
+        st.metric("Total Lines", total_lines)
+    with col3:
+        st.metric("File Size", f"{len(combined_bytes) / 1024:.1f} KB")
+    
+    st.markdown("---")
+    
+    # Download buttons
+    st.markdown("**Download Reports**")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        file_ext = "txt" if export_format == "Text Report" else "md" if export_format == "Markdown" else "json"
+        filename = export_manager.create_export_filename("ai_reports", metrics, file_ext, filename_slug)
+        mime_type = "text/plain" if export_format == "Text Report" else "text/markdown" if export_format == "Markdown" else "application/json"
+        
+        st.download_button(
+            label=f"📥 Download {export_format}",
+            data=combined_bytes,
+            file_name=filename,
+            mime=mime_type,
+            type="primary",
+            use_container_width=True
+        )
+    
+    with col2:
+        # PDF-ready version (plain text) with markdown stripped; chained str.replace
+        # is cheap and faster here than str.translate or re.sub
+        pdf_filename = export_manager.create_export_filename("ai_reports", metrics, "txt", filename_slug)
+        
+        st.download_button(
+            label="📄 PDF-Ready Text",
+            data=combined_content.replace('*', '').replace('#', '').encode('utf-8'),
+            file_name=pdf_filename,
+            mime="text/plain",
+            help="Plain text version suitable for PDF conversion",
+            use_container_width=True
+        )
+    
+    with col3:
+        # One text file per report in a zip archive, built only when downloaded
+        archive_filename = export_manager.create_export_filename("ai_reports_archive", metrics, "zip", filename_slug)
+        
+        st.download_button(
+            label="📦 ZIP Archive",
+            data=lambda: build_reports_archive(reports_content),
+            file_name=archive_filename,
+            mime="application/zip",
+            help="Each report as a separate text file in a zip archive",
+            use_container_width=True
+        )
+    
+    # Additional export formats
+    st.markdown("**Dashboard Visualizations**")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        # Dashboard HTML export, built only when downloaded
+        dashboard_filename = export_manager.create_export_filename("dashboard", metrics, "html", filename_slug)
+        
+        st.download_button(
+            label="🌐 Dashboard HTML",
+            data=lambda: build_dashboard_html(metrics),
+            file_name=dashboard_filename,
+            mime="text/html",
+            help="Complete dashboard as HTML for screenshots or PDF conversion",
+            use_container_width=True
+        )
+    
+    with col2:
+        # Charts collection HTML, built only when downloaded
+        charts_filename = export_manager.create_export_filename("charts", metrics, "html", filename_slug)
+        
+        st.download_button(
+            label="📊 Charts HTML",
+            data=lambda: build_charts_html(metrics),
+            file_name=charts_filename,
+            mime="text/html",
+            help="Interactive charts collection for presentations",
+            use_container_width=True
+        )
+    
+    with col3:
+        # PDF export (if available)
+        if export_manager.is_pdf_export_available():
+            if st.button("📄 Generate PDF", use_container_width=True):
+                try:
+                    pdf_content = export_manager.pdf_exporter.create_pdf_report(metrics)
+                    pdf_filename = export_manager.create_export_filename("dashboard", metrics, "pdf", filename_slug)
+                    
+                    st.download_button(
+                        label="📥 Download PDF",
+                        data=pdf_content,
+                        file_name=pdf_filename,
+                        mime="application/pdf",
+                        use_container_width=True
+                    )
+                except Exception as e:
+                    st.error(f"PDF generation failed: {str(e)}")
+        else:
+            pdf_info_text = "📄 PDF Export\n\nInstall weasyprint or similar library to enable PDF export"
+            st.info(pdf_info_text)
+    
+    # Screenshot instructions
+    st.markdown("---")
+    st.markdown("**📸 Screenshot Instructions**")
+    
+    with st.expander("How to create screenshots and PDFs"):
+        st.markdown("""
+        **For Screenshots:**
+        1. Download the "Dashboard HTML" file above
+        2. Open it in your web browser
+        3. Use your browser's screenshot tools or extensions
+        4. For full-page screenshots, try browser extensions like "Full Page Screen Capture"
+        
+        **For PDF Conversion:**
+        1. Download the "Dashboard HTML" file
+        2. Open it in your web browser
+        3. Use Print → Save as PDF (Ctrl+P / Cmd+P)
+        4. Or use online HTML-to-PDF converters
+        
+        **For Presentations:**
+        1. Download the "Charts HTML" file for interactive charts
+        2. Open in browser and screenshot individual charts
+        3. Use the dashboard HTML for overview slides
+        
+        **Professional PDF Reports:**
+        - Install `weasyprint` library for automated PDF generation
+        - Use `pip install weasyprint` in your environment
+        - Restart the dashboard to enable PDF export button
+        """)
+    
+    # Export summary
+    st.markdown("---")
+    st.info(f"""
+    **Export Summary:**
+    - {len(reports_content)} AI reports generated
+    - {word_count} words total
+    - Multiple formats available (Text, Markdown, JSON, HTML)
+    - Dashboard visualization exports included
+    """)
+    
+    st.success("✅ All export formats ready for download!")
+    
+    st.success("✅ AI reports generated and ready for download!")
+
 def render_ai_reports_export_section(metrics):
     """Render AI reports export section"""
     st.subheader("🤖 AI Analysis Reports")
@@ -2180,9 +3016,6 @@ def render_ai_reports_export_section(metrics):
         st.info("Configure your OpenAI API key in the sidebar to enable AI report exports.")
         return
     
-    from utils.export_manager import ExportManager
-    export_manager = ExportManager()
-    
     # Report type selection
     st.markdown("**Report Types**")
     
@@ -2230,291 +3063,20 @@ def render_ai_reports_export_section(metrics):
             status_text = st.empty()
             
             try:
-                reports_content = []
-                total_reports = len(report_types)
-                
-                from models.config import OpenAICredentials
-                from utils.chatgpt_analyzer import ChatGPTAnalyzer, ProductivityInsightGenerator
+                results = generate_ai_export_results(metrics, report_types, progress_bar, status_text)
                 
-                # Initialize AI components
-                credentials = OpenAICredentials(api_key=st.session_state.openai_key)
-                analyzer = ChatGPTAnalyzer(credentials)
-                insight_generator = ProductivityInsightGenerator(analyzer)
+                # Generation time and period shared by the plain-text reports of this run
+                report_header = (
+                    f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                    f"Period: {metrics.period_start.strftime('%Y-%m-%d')} to {metrics.period_end.strftime('%Y-%m-%d')}\n"
+                )
                 
-                for i, report_type in enumerate(report_types):
-                    progress = (i + 1) / total_reports
-                    progress_bar.progress(progress)
-                    status_text.text(f"Generating {report_type}...")
-                    
-                    if report_type == "Analysis Summary":
-                        analysis_report = analyzer.analyze_productivity_trends(metrics)
-                        content = export_manager.report_exporter.export_ai_analysis_report(
-                            analysis_report, metrics, include_metadata
-                        )
-                        reports_content.append(("Analysis Summary", content))
-                    
-                    elif report_type == "Detailed Insights":
-                        insights = insight_generator.generate_comprehensive_insights(metrics)
-                        content = export_manager.report_exporter.export_comprehensive_insights(
-                            insights, metrics
-                        )
-                        reports_content.append(("Detailed Insights", content))
-                    
-                    elif report_type == "Executive Summary":
-                        executive_summary = insight_generator.generate_executive_summary(metrics)
-                        content = export_manager.report_exporter.export_executive_summary(
-                            executive_summary, metrics
-                        )
-                        reports_content.append(("Executive Summary", content))
-                    
-                    elif report_type == "Trend Analysis":
-                        trend_analysis = analyzer.analyze_trends(metrics)
-                        content = f"""
-TREND ANALYSIS REPORT
-====================
-
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Period: {metrics.period_start.strftime('%Y-%m-%d')} to {metrics.period_end.strftime('%Y-%m-%d')}
-
-Overall Trend Direction: {trend_analysis.get('trend_direction', 'Unknown')}
-
-Key Patterns:
-{chr(10).join(f"• {pattern}" for pattern in trend_analysis.get('key_patterns', []))}
-
-Confidence Score: {trend_analysis.get('confidence_score', 0) * 100:.1f}%
-"""
-                        reports_content.append(("Trend Analysis", content))
-                    
-                    elif report_type == "Anomaly Report":
-                        anomalies = analyzer.identify_anomalies(metrics)
-                        content = f"""
-ANOMALY DETECTION REPORT
-========================
-
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Period: {metrics.period_start.strftime('%Y-%m-%d')} to {metrics.period_end.strftime('%Y-%m-%d')}
-
-Anomalies Detected: {len(anomalies)}
-
-"""
-                        if anomalies:
-                            for anomaly in anomalies:
-                                content += f"""
-[{anomaly.severity}] {anomaly.metric_name}
-Description: {anomaly.description}
-Detected: {anomaly.timestamp.strftime('%Y-%m-%d %H:%M:%S')}
-Expected: {anomaly.expected_value}, Actual: {anomaly.actual_value}
-
-"""
-                        else:
-                            content += "No anomalies detected in the current period.\n"
-                        
-                        reports_content.append(("Anomaly Report", content))
+                # Kept for later reruns, so other widgets and downloads do not drop the reports
+                st.session_state.ai_export_results = (metrics, results, report_header)
                 
                 progress_bar.progress(1.0)
                 status_text.text("Reports generated successfully!")
                 
-                # Combine all reports
-                if export_format == "Text Report":
-                    report_sections = []
-                    for title, content in reports_content:
-                        separator = '=' * len(title)
-                        section = f"{title}\n{separator}\n\n{content}"
-                        report_sections.append(section)
-                    combined_content = "\n\n" + "="*80 + "\n\n".join(report_sections)
-                elif export_format == "Markdown":
-                    report_sections = []
-                    for title, content in reports_content:
-                        section = f"# {title}\n\n{content}"
-                        report_sections.append(section)
-                    combined_content = "\n\n---\n\n".join(report_sections)
-                else:  # JSON
-                    json_data = {
-                        'metadata': export_manager.get_export_metadata(metrics, {
-                            'report_types': report_types,
-                            'ai_model': credentials.model
-                        }),
-                        'reports': {title: content for title, content in reports_content}
-                    }
-                    combined_content = json.dumps(json_data, indent=2, default=str)
-                
-                # Show preview
-                st.markdown("**Report Preview**")
-                preview_lines = combined_content.split('\n')[:30]
-                preview_text = '\n'.join(preview_lines)
-                if len(combined_content.split('\n')) > 30:
-                    remaining_lines = len(combined_content.split('\n')) - 30
-                    preview_text += f"\n... ({remaining_lines} more lines)"
-                
-                st.code(preview_text, language="markdown" if export_format == "Markdown" else "text")
-                
-                # Export statistics
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Reports Generated", len(reports_content))
-                with col2:
-                    st.metric("Total Lines", len(combined_content.split('\n')))
-                with col3:
-                    st.metric("File Size", f"{len(combined_content.encode('utf-8')) / 1024:.1f} KB")
-                
-                st.markdown("---")
-                
-                # Download buttons
-                st.markdown("**Download Reports**")
-                
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    file_ext = "txt" if export_format == "Text Report" else "md" if export_format == "Markdown" else "json"
-                    filename = export_manager.create_export_filename("ai_reports", metrics, file_ext)
-                    mime_type = "text/plain" if export_format == "Text Report" else "text/markdown" if export_format == "Markdown" else "application/json"
-                    
-                    st.download_button(
-                        label=f"📥 Download {export_format}",
-                        data=combined_content,
-                        file_name=filename,
-                        mime=mime_type,
-                        type="primary",
-                        use_container_width=True
-                    )
-                
-                with col2:
-                    # Create PDF-ready version (plain text)
-                    pdf_content = combined_content.replace('*', '').replace('#', '')  # Remove markdown
-                    pdf_filename = export_manager.create_export_filename("ai_reports", metrics, "txt")
-                    
-                    st.download_button(
-                        label="📄 PDF-Ready Text",
-                        data=pdf_content,
-                        file_name=pdf_filename,
-                        mime="text/plain",
-                        help="Plain text version suitable for PDF conversion",
-                        use_container_width=True
-                    )
-                
-                with col3:
-                    # Create individual reports zip (simplified as combined file)
-                    archive_sections = []
-                    for title, content in reports_content:
-                        filename = title.replace(' ', '_').lower()
-                        section = f"FILE: {filename}.txt\n\n{content}"
-                        archive_sections.append(section)
-                    separator = "="*50 + " ARCHIVE SEPARATOR " + "="*50
-                    archive_content = f"\n\n{separator}\n\n".join(archive_sections)
-                    archive_filename = export_manager.create_export_filename("ai_reports_archive", metrics, "txt")
-                    
-                    st.download_button(
-                        label="📦 Archive Format",
-                        data=archive_content,
-                        file_name=archive_filename,
-                        mime="text/plain",
-                        help="All reports in a single archive-style file",
-                        use_container_width=True
-                    )
-                
-                # Additional export formats
-                st.markdown("**Dashboard Visualizations**")
-                
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    # Dashboard HTML export
-                    dashboard_html = export_manager.export_dashboard_html(metrics)
-                    dashboard_filename = export_manager.create_export_filename("dashboard", metrics, "html")
-                    
-                    st.download_button(
-                        label="🌐 Dashboard HTML",
-                        data=dashboard_html,
-                        file_name=dashboard_filename,
-                        mime="text/html",
-                        help="Complete dashboard as HTML for screenshots or PDF conversion",
-                        use_container_width=True
-                    )
-                
-                with col2:
-                    # Charts collection HTML
-                    charts_data = [
-                        {"title": "Commit Frequency Trends", "description": "Daily commit activity over time"},
-                        {"title": "Code Volume Analysis", "description": "Lines added and deleted trends"},
-                        {"title": "Pull Request Metrics", "description": "PR creation and merge statistics"},
-                        {"title": "Review Participation", "description": "Code review activity and quality"}
-                    ]
-                    charts_html = export_manager.export_charts_html(charts_data, metrics)
-                    charts_filename = export_manager.create_export_filename("charts", metrics, "html")
-                    
-                    st.download_button(
-                        label="📊 Charts HTML",
-                        data=charts_html,
-                        file_name=charts_filename,
-                        mime="text/html",
-                        help="Interactive charts collection for presentations",
-                        use_container_width=True
-                    )
-                
-                with col3:
-                    # PDF export (if available)
-                    if export_manager.is_pdf_export_available():
-                        if st.button("📄 Generate PDF", use_container_width=True):
-                            try:
-                                pdf_content = export_manager.pdf_exporter.create_pdf_report(metrics)
-                                pdf_filename = export_manager.create_export_filename("dashboard", metrics, "pdf")
-                                
-                                st.download_button(
-                                    label="📥 Download PDF",
-                                    data=pdf_content,
-                                    file_name=pdf_filename,
-                                    mime="application/pdf",
-                                    use_container_width=True
-                                )
-                            except Exception as e:
-                                st.error(f"PDF generation failed: {str(e)}")
-                    else:
-                        pdf_info_text = "📄 PDF Export\n\nInstall weasyprint or similar library to enable PDF export"
-                        st.info(pdf_info_text)
-                
-                # Screenshot instructions
-                st.markdown("---")
-                st.markdown("**📸 Screenshot Instructions**")
-                
-                with st.expander("How to create screenshots and PDFs"):
-                    st.markdown("""
-                    **For Screenshots:**
-                    1. Download the "Dashboard HTML" file above
-                    2. Open it in your web browser
-                    3. Use your browser's screenshot tools or extensions
-                    4. For full-page screenshots, try browser extensions like "Full Page Screen Capture"
-                    
-                    **For PDF Conversion:**
-                    1. Download the "Dashboard HTML" file
-                    2. Open it in your web browser
-                    3. Use Print → Save as PDF (Ctrl+P / Cmd+P)
-                    4. Or use online HTML-to-PDF converters
-                    
-                    **For Presentations:**
-                    1. Download the "Charts HTML" file for interactive charts
-                    2. Open in browser and screenshot individual charts
-                    3. Use the dashboard HTML for overview slides
-                    
-                    **Professional PDF Reports:**
-                    - Install `weasyprint` library for automated PDF generation
-                    - Use `pip install weasyprint` in your environment
-                    - Restart the dashboard to enable PDF export button
-                    """)
-                
-                # Export summary
-                st.markdown("---")
-                st.info(f"""
-                **Export Summary:**
-                - {len(reports_content)} AI reports generated
-                - {len(combined_content.split())} words total
-                - Multiple formats available (Text, Markdown, JSON, HTML)
-                - Dashboard visualization exports included
-                """)
-                
-                st.success("✅ All export formats ready for download!")
-                
-                st.success("✅ AI reports generated and ready for download!")
-                
             except Exception as e:
                 progress_bar.empty()
                 status_text.empty()
@@ -2528,6 +3090,12 @@ Expected: {anomaly.expected_value}, Actual: {anomaly.actual_value}
                     st.markdown("• Try generating fewer reports at once")
                     st.markdown("• Ensure the productivity data is properly loaded")
     
+    # Reports generated for these metrics stay available until the selection needs new ones
+    stored = st.session_state.ai_export_results
+    if stored and stored[0] is metrics and all(report_type in stored[1] for report_type in report_types):
+        _, results, report_header = stored
+        render_ai_reports_output(metrics, report_types, results, report_header, export_format, include_metadata)
+    
     # Additional export options
     with st.expander("🔧 Advanced Report Options"):
         st.markdown("**Report Customization**")
@@ -2572,29 +3140,32 @@ def render_export_section():
     with tab2:
         render_ai_reports_export_section(metrics)
 
+# Section renderers keyed by section name, with an optional spinner message
+# for the sections that are loaded lazily
+SECTION_RENDERERS = {
+    "Overview": (render_overview_section, None),
+    "Metrics": (render_metrics_section, None),
+    "Analytics": (render_analytics_section, "Loading analytics..."),
+    "AI Insights": (render_ai_insights_section, "Loading AI insights..."),
+    "Export": (render_export_section, None)
+}
+
 def render_main_content():
     """Render main content area based on selected section with lazy loading optimization"""
-    current_section = st.session_state.current_section
-    
     # Performance optimization: Only render the active section
     # This reduces initial page load time and memory usage
+    # Unknown section names fall back to the overview
+    render_section, spinner_message = SECTION_RENDERERS.get(
+        st.session_state.current_section, SECTION_RENDERERS["Overview"]
+    )
     
     render_start_time = time.time()
     
-    if current_section == "Overview":
-        render_overview_section()
-    elif current_section == "Metrics":
-        render_metrics_section()
-    elif current_section == "Analytics":
-        # Lazy load analytics section only when needed
-        with st.spinner("Loading analytics..."):
-            render_analytics_section()
-    elif current_section == "AI Insights":
-        # Lazy load AI insights section only when needed
-        with st.spinner("Loading AI insights..."):
-            render_ai_insights_section()
-    elif current_section == "Export":
-        render_export_section()
+    if spinner_message:
+        with st.spinner(spinner_message):
+            render_section()
+    else:
+        render_section()
     
     # Track rendering performance
     render_time = time.time() - render_start_time
@@ -12,6 +12,12 @@ from enum import Enum
 import re
 
 
+# Validation patterns, compiled once at import
+_GITHUB_TOKEN_RE = re.compile(r'^gh[a-z]_[A-Za-z0-9_]{36,}$')
+_REPO_NAME_RE = re.compile(r'^[a-zA-Z0-9._-]+$')
+_REPO_URL_RE = re.compile(r'https://github\.com/([^/]+)/([^/]+)/?')
+
+
 class AnalysisPeriod(Enum):
     """Enumeration for analysis time periods."""
     LAST_7_DAYS = "last_7_days"
@@ -43,7 +49,7 @@ class GitHubCredentials:
             raise ValueError("GitHub personal access token is required")
         
         # Basic token format validation (GitHub tokens start with 'ghp_', 'gho_', etc.)
-        if not re.match(r'^gh[a-z]_[A-Za-z0-9_]{36,}$', self.personal_access_token):
+        if not _GITHUB_TOKEN_RE.match(self.personal_access_token):
             raise ValueError("Invalid GitHub token format")
     
     def is_valid(self) -> bool:
@@ -130,7 +136,7 @@ class RepositoryConfig:
             raise ValueError("Repository name is required")
         
         # Validate repository name format
-        if not re.match(r'^[a-zA-Z0-9._-]+$', self.name):
+        if not _REPO_NAME_RE.match(self.name):
             raise ValueError("Invalid repository name format")
         
         # Generate URL if not provided
@@ -157,8 +163,7 @@ class RepositoryConfig:
     def from_url(cls, url: str) -> 'RepositoryConfig':
         """Create repository config from GitHub URL."""
         # Parse GitHub URL
-        pattern = r'https://github\.com/([^/]+)/([^/]+)/?'
-        match = re.match(pattern, url)
+        match = _REPO_URL_RE.match(url)
         
         if not match:
             raise ValueError("Invalid GitHub repository URL")
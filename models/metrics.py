@@ -19,7 +19,7 @@ class MetricPeriod(Enum):
     QUARTERLY = "quarterly"
 
 
-@dataclass
+@dataclass(slots=True)
 class VelocityPoint:
     """Represents a single velocity measurement point."""
     timestamp: datetime
@@ -64,7 +64,7 @@ class VelocityPoint:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CommitMetrics:
     """Metrics related to commit activity."""
     total_commits: int
@@ -96,7 +96,7 @@ class CommitMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PRMetrics:
     """Metrics related to pull request activity."""
     total_prs: int
@@ -133,7 +133,7 @@ class PRMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewMetrics:
     """Metrics related to code review activity."""
     total_reviews_given: int
@@ -163,7 +163,7 @@ class ReviewMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class IssueMetrics:
     """Metrics related to issue activity."""
     total_issues: int
@@ -197,7 +197,7 @@ class IssueMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class ProductivityMetrics:
     """Comprehensive productivity metrics for a developer or team."""
     period_start: datetime
@@ -254,7 +254,7 @@ class ProductivityMetrics:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Anomaly:
     """Represents an anomaly detected in productivity data."""
     metric_name: str
@@ -290,7 +290,7 @@ class Anomaly:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisReport:
     """AI-generated analysis report for productivity data."""
     generated_at: datetime
@@ -4,8 +4,9 @@ Unit tests for ChatGPT analyzer.
 Tests OpenAI API integration, prompt management, analysis generation, and error handling.
 """
 
+import asyncio
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from datetime import datetime, timedelta
 import json
 
@@ -295,6 +296,49 @@ class TestChatGPTAnalyzer(unittest.TestCase):
         
         self.assertIn("Failed to get response", str(context.exception))
     
+    @patch.object(ChatGPTAnalyzer, '_make_api_call')
+    def test_generate_combined_analysis_success(self, mock_api_call):
+        """Test the summary and trend analyses come back from one API call."""
+        mock_response = {
+            "summary": {
+                "summary": "Productivity is steady.",
+                "key_insights": ["Regular commits"],
+                "recommendations": ["Keep PRs small"],
+                "anomalies": [],
+                "confidence_score": 0.9
+            },
+            "trends": {
+                "trend_direction": "stable",
+                "key_patterns": ["Weekday activity"],
+                "confidence_score": 0.7
+            }
+        }
+        mock_api_call.return_value = json.dumps(mock_response)
+        
+        report, trends = self.analyzer.generate_combined_analysis(self.metrics)
+        
+        self.assertIsInstance(report, AnalysisReport)
+        self.assertEqual(report.summary, "Productivity is steady.")
+        self.assertEqual(report.confidence_score, 0.9)
+        self.assertEqual(trends["trend_direction"], "stable")
+        mock_api_call.assert_called_once()
+        
+        # Reusing both parts, comprehensive insights make no further calls
+        generator = ProductivityInsightGenerator(self.analyzer)
+        insights = generator.generate_comprehensive_insights(self.metrics, report, trends)
+        
+        self.assertEqual(insights['overview']['summary'], "Productivity is steady.")
+        self.assertEqual(insights['trends'], trends)
+        mock_api_call.assert_called_once()
+    
+    @patch.object(ChatGPTAnalyzer, '_make_api_call')
+    def test_generate_combined_analysis_missing_section(self, mock_api_call):
+        """Test a combined response without both sections is rejected."""
+        mock_api_call.return_value = json.dumps({"summary": {"summary": "Only a summary"}})
+        
+        with self.assertRaises(ValueError):
+            self.analyzer.generate_combined_analysis(self.metrics)
+    
     @patch.object(ChatGPTAnalyzer, '_make_api_call')
     def test_identify_anomalies_success(self, mock_api_call):
         """Test successful anomaly identification."""
@@ -402,6 +446,82 @@ class TestChatGPTAnalyzer(unittest.TestCase):
         self.assertIn("error", result.lower())
         self.assertIn("API Error", result)
     
+    @patch.object(ChatGPTAnalyzer, '_async_client')
+    def test_answer_user_question_async(self, mock_async_client):
+        """Test async question answering parses the completion like the sync path."""
+        client = mock_async_client.return_value
+        client.chat.completions.create = AsyncMock(return_value=self._create_mock_chat_completion(
+            json.dumps({"answer": "Reviews are frequent."})
+        ))
+        
+        result = self.analyzer.run_async(
+            self.analyzer.answer_user_question_async("How are my reviews?", self.metrics), timeout=5
+        )
+        
+        self.assertEqual(result, "Reviews are frequent.")
+        client.chat.completions.create.assert_awaited_once()
+    
+    @patch('utils.chatgpt_analyzer.asyncio.sleep', new_callable=AsyncMock)
+    @patch.object(ChatGPTAnalyzer, '_async_client')
+    def test_answer_user_questions_async_skips_failures(self, mock_async_client, mock_sleep):
+        """Test batched questions are answered concurrently and failures are left out after retries."""
+        answers = {"Q1": "First answer", "Q3": "Third answer"}
+        
+        async def create(**request):
+            question = request['messages'][-1]['content'].split("USER QUESTION: ")[1].split("\n")[0]
+            if question not in answers:
+                raise Exception("API Error")
+            return self._create_mock_chat_completion(answers[question])
+        
+        client = mock_async_client.return_value
+        client.chat.completions.create = AsyncMock(side_effect=create)
+        
+        result = self.analyzer.run_async(
+            self.analyzer.answer_user_questions_async(["Q1", "Q2", "Q3"], self.metrics), timeout=5
+        )
+        
+        self.assertEqual(result, answers)
+        # Q2 goes through the shared retry policy before it is left out
+        self.assertEqual(client.chat.completions.create.await_count, 5)
+        self.assertEqual(mock_sleep.await_count, 2)
+    
+    @patch('utils.chatgpt_analyzer.asyncio.sleep', new_callable=AsyncMock)
+    @patch.object(ChatGPTAnalyzer, '_async_client')
+    def test_analyze_trends_async_retries(self, mock_async_client, mock_sleep):
+        """Test async analysis retries failed calls with the sync backoff policy."""
+        client = mock_async_client.return_value
+        client.chat.completions.create = AsyncMock(side_effect=[
+            Exception("Server error"),
+            self._create_mock_chat_completion(json.dumps({"trend_direction": "increasing"}))
+        ])
+        
+        result = self.analyzer.run_async(self.analyzer.analyze_trends_async(self.metrics), timeout=5)
+        
+        self.assertEqual(result, {"trend_direction": "increasing"})
+        self.assertEqual(client.chat.completions.create.await_count, 2)
+        mock_sleep.assert_awaited_once_with(1)
+    
+    def test_run_async_cancels_on_timeout(self):
+        """Test slow requests are cancelled and reported as a timeout."""
+        cancelled = []
+        
+        async def slow_answer():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+        
+        with self.assertRaises(TimeoutError):
+            self.analyzer.run_async(slow_answer(), timeout=0.05)
+        
+        # The same loop keeps serving later requests
+        async def quick_answer():
+            return "done"
+        
+        self.assertEqual(self.analyzer.run_async(quick_answer(), timeout=5), "done")
+        self.assertEqual(cancelled, [True])
+    
     @patch.object(ChatGPTAnalyzer, '_make_api_call')
     def test_analyze_trends_success(self, mock_api_call):
         """Test successful trend analysis."""
@@ -438,6 +558,24 @@ class TestChatGPTAnalyzer(unittest.TestCase):
         self.assertIn("Analysis error", result["key_patterns"][0])
         self.assertEqual(result["confidence_score"], 0.0)
     
+    @patch.object(ChatGPTAnalyzer, '_make_api_call')
+    def test_analyze_without_fallback_raises(self, mock_api_call):
+        """Test that fallback=False surfaces request and parsing errors."""
+        mock_api_call.side_effect = Exception("API Error")
+        
+        with self.assertRaises(Exception):
+            self.analyzer.analyze_trends(self.metrics, fallback=False)
+        with self.assertRaises(Exception):
+            self.analyzer.identify_anomalies(self.metrics, fallback=False)
+        
+        mock_api_call.side_effect = None
+        mock_api_call.return_value = "Invalid JSON response"
+        with self.assertRaises(json.JSONDecodeError):
+            self.analyzer.analyze_productivity_trends(self.metrics, fallback=False)
+        
+        # The default still returns the fallback report
+        self.assertEqual(self.analyzer.analyze_productivity_trends(self.metrics).confidence_score, 0.6)
+    
     @patch('utils.chatgpt_analyzer.OpenAI')
     def test_validate_credentials_success(self, mock_openai_class):
         """Test successful credential validation."""
@@ -674,6 +812,67 @@ class TestProductivityInsightGenerator(unittest.TestCase):
         self.assertEqual(result['trends']['trend_direction'], "increasing")
         self.assertGreater(result['performance_score'], 0)
     
+    @patch.object(ChatGPTAnalyzer, 'analyze_productivity_trends_async', new_callable=AsyncMock)
+    @patch.object(ChatGPTAnalyzer, 'analyze_trends_async', new_callable=AsyncMock)
+    def test_generate_comprehensive_insights_async(self, mock_analyze_trends, mock_analyze_productivity):
+        """Test async insights request both analyses and build the same structure."""
+        mock_analyze_productivity.return_value = AnalysisReport(
+            generated_at=datetime.now(),
+            summary="Good productivity",
+            key_insights=["Insight 1"],
+            recommendations=["Rec 1"],
+            anomalies=[],
+            confidence_score=0.85
+        )
+        mock_analyze_trends.return_value = {"trend_direction": "increasing"}
+        
+        result = self.generator.analyzer.run_async(
+            self.generator.generate_comprehensive_insights_async(self.metrics), timeout=5
+        )
+        
+        self.assertEqual(result['overview']['summary'], "Good productivity")
+        self.assertEqual(result['trends']['trend_direction'], "increasing")
+        self.assertIn('commit_insights', result)
+        mock_analyze_productivity.assert_awaited_once_with(self.metrics, fallback=True)
+        mock_analyze_trends.assert_awaited_once_with(self.metrics, fallback=True)
+    
+    @patch.object(ChatGPTAnalyzer, '_make_api_call_async', new_callable=AsyncMock)
+    def test_generate_analysis_bundle_async(self, mock_api_call):
+        """Test one combined request yields the summary, trends and detailed insights."""
+        mock_api_call.return_value = json.dumps({
+            "summary": {"summary": "Good productivity", "key_insights": [], "recommendations": ["Rec 1"],
+                        "confidence_score": 0.9},
+            "trends": {"trend_direction": "increasing", "key_patterns": [], "confidence_score": 0.8}
+        })
+        
+        result = self.generator.analyzer.run_async(
+            self.generator.generate_analysis_bundle_async(self.metrics), timeout=5
+        )
+        
+        mock_api_call.assert_awaited_once()
+        self.assertEqual(result['summary'].summary, "Good productivity")
+        self.assertEqual(result['trends']['trend_direction'], "increasing")
+        self.assertEqual(result['detailed']['overview']['summary'], "Good productivity")
+        self.assertEqual(result['detailed']['recommendations'], ["Rec 1"])
+    
+    @patch.object(ChatGPTAnalyzer, '_make_api_call_async', new_callable=AsyncMock)
+    def test_generate_analysis_bundle_async_falls_back(self, mock_api_call):
+        """Test an unusable combined response falls back to separate requests."""
+        mock_api_call.side_effect = [
+            json.dumps({"summary": {}}),
+            json.dumps({"summary": "Separate summary", "confidence_score": 0.7}),
+            json.dumps({"trend_direction": "stable"})
+        ]
+        
+        result = self.generator.analyzer.run_async(
+            self.generator.generate_analysis_bundle_async(self.metrics), timeout=5
+        )
+        
+        self.assertEqual(mock_api_call.await_count, 3)
+        self.assertEqual(result['summary'].summary, "Separate summary")
+        self.assertEqual(result['trends']['trend_direction'], "stable")
+        self.assertNotIn('error', result['detailed'])
+    
     @patch.object(ChatGPTAnalyzer, 'analyze_productivity_trends')
     def test_generate_comprehensive_insights_error(self, mock_analyze_productivity):
         """Test comprehensive insights generation with error."""
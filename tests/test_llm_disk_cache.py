@@ -0,0 +1,77 @@
+"""
+Unit tests for the on-disk AI analysis cache.
+
+Tests key construction, round-tripping, compression and expiry.
+"""
+
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from models.metrics import AnalysisReport
+from utils.llm_disk_cache import COMPRESS_THRESHOLD, LLMDiskCache, make_key
+
+
+class TestLLMDiskCache(unittest.TestCase):
+    """Test cases for LLMDiskCache class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = LLMDiskCache(Path(self.tmpdir.name) / "cache.sqlite3")
+        self.report = AnalysisReport(
+            generated_at=datetime(2024, 1, 1, 12, 0, 0),
+            summary="Steady progress",
+            key_insights=["Commits are regular"],
+            recommendations=["Keep PRs small"],
+            anomalies=[],
+            confidence_score=0.8
+        )
+
+    def tearDown(self):
+        """Close the database and remove the temporary directory."""
+        self.cache._conn.close()
+        self.tmpdir.cleanup()
+
+    def test_make_key_is_deterministic(self):
+        """Test keys depend on the parts, not their order."""
+        key = make_key(type="summary", period=[datetime(2024, 1, 1)], v=1)
+
+        self.assertEqual(key, make_key(v=1, period=[datetime(2024, 1, 1)], type="summary"))
+        self.assertNotEqual(key, make_key(type="detailed", period=[datetime(2024, 1, 1)], v=1))
+        self.assertEqual(len(key), 64)
+
+    def test_round_trip(self):
+        """Test stored reports are returned intact and can be deleted."""
+        self.assertIsNone(self.cache.get("missing"))
+
+        self.cache.set("report", self.report)
+        self.assertEqual(self.cache.get("report"), self.report)
+
+        self.cache.delete("report")
+        self.assertIsNone(self.cache.get("report"))
+
+    def test_large_payloads_are_compressed(self):
+        """Test payloads above the threshold are stored compressed."""
+        insights = {'recommendations': ["Review smaller batches"] * COMPRESS_THRESHOLD}
+        self.cache.set("insights", insights)
+
+        compressed, = self.cache._conn.execute(
+            "SELECT compressed FROM responses WHERE key = ?", ("insights",)
+        ).fetchone()
+        self.assertEqual(compressed, 1)
+        self.assertEqual(self.cache.get("insights"), insights)
+
+    def test_expired_entries_are_dropped(self):
+        """Test entries past their TTL read as missing."""
+        self.cache.set("stale", self.report, ttl_days=-1)
+
+        self.assertIsNone(self.cache.get("stale"))
+        self.assertIsNone(self.cache._conn.execute(
+            "SELECT 1 FROM responses WHERE key = ?", ("stale",)
+        ).fetchone())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,236 @@
+"""
+Unit tests for visualization components.
+
+Tests the array helpers and chart builders used by the analytics section.
+"""
+
+import hashlib
+import unittest
+from dataclasses import replace
+from datetime import datetime, timedelta, date
+from unittest.mock import patch
+
+import numpy as np
+
+from models.metrics import (
+    ProductivityMetrics, CommitMetrics, PRMetrics, ReviewMetrics, IssueMetrics, VelocityPoint
+)
+from components import _fastmath
+from components.visualizations import (
+    _metrics_fingerprint, _metrics_view, _metric_insights, _velocity_soa, _filter_velocity, _velocity_summary,
+    create_commit_frequency_chart, create_code_volume_chart, create_velocity_overview_chart
+)
+
+
+class TestVelocityArrays(unittest.TestCase):
+    """Test cases for the velocity struct-of-arrays helpers."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.base_time = datetime(2024, 1, 1, 12, 0, 0)
+
+        # Velocity points deliberately stored newest-first
+        velocity_trends = [
+            VelocityPoint(
+                timestamp=self.base_time + timedelta(days=i),
+                commits=i + 1,
+                additions=10 * i,
+                deletions=2 * i,
+                pull_requests=i % 2,
+                issues_closed=i % 3
+            )
+            for i in reversed(range(10))
+        ]
+
+        self.metrics = ProductivityMetrics(
+            period_start=self.base_time,
+            period_end=self.base_time + timedelta(days=10),
+            commit_metrics=CommitMetrics(
+                total_commits=55,
+                commit_frequency={"daily": 5.5},
+                average_additions=45.0,
+                average_deletions=9.0,
+                average_files_changed=2.0,
+                most_active_hours=[10],
+                commit_message_length_avg=40.0
+            ),
+            pr_metrics=PRMetrics(
+                total_prs=5, merged_prs=4, closed_prs=1, open_prs=0,
+                average_time_to_merge=12.0, average_additions=100.0,
+                average_deletions=20.0, average_commits_per_pr=2.0, merge_rate=80.0
+            ),
+            review_metrics=ReviewMetrics(
+                total_reviews_given=3, total_reviews_received=4, average_review_time=2.0,
+                approval_rate=75.0, change_request_rate=25.0, review_participation_rate=60.0
+            ),
+            issue_metrics=IssueMetrics(
+                total_issues=4, closed_issues=3, open_issues=1, average_time_to_close=24.0,
+                resolution_rate=75.0, issues_created=2, issues_assigned=2
+            ),
+            velocity_trends=velocity_trends
+        )
+
+    def test_velocity_soa_sorted_by_timestamp(self):
+        """Test that the arrays are sorted once by timestamp."""
+        soa = _velocity_soa(self.metrics)
+
+        self.assertEqual(len(soa['ts']), 10)
+        self.assertTrue(np.all(soa['ts'][:-1] <= soa['ts'][1:]))
+        np.testing.assert_array_equal(soa['commits'], np.arange(1, 11))
+        np.testing.assert_array_equal(soa['total'], soa['additions'] + soa['deletions'])
+
+    def test_filter_velocity_inclusive_range(self):
+        """Test date range filtering includes both end dates."""
+        soa = _velocity_soa(self.metrics)
+        filtered = _filter_velocity(soa, (date(2024, 1, 3), date(2024, 1, 5)))
+
+        np.testing.assert_array_equal(filtered['commits'], [3, 4, 5])
+        self.assertIs(_filter_velocity(soa, None), soa)
+
+        # Ranges outside the data produce empty slices
+        empty = _filter_velocity(soa, (date(2025, 1, 1), date(2025, 2, 1)))
+        self.assertEqual(len(empty['ts']), 0)
+        self.assertEqual(len(empty['commits']), 0)
+
+    def test_velocity_summary(self):
+        """Test summary statistics are reduced from the filtered arrays."""
+        soa = _velocity_soa(self.metrics)
+        stats = _velocity_summary(_filter_velocity(soa, (date(2024, 1, 1), date(2024, 1, 4))))
+
+        self.assertEqual(stats['commits_total'], 10)
+        self.assertAlmostEqual(stats['commits_mean'], 2.5)
+        self.assertEqual(stats['commits_max'], 4)
+        self.assertEqual(stats['additions_total'], 60)
+        self.assertEqual(stats['deletions_total'], 12)
+        self.assertEqual(stats['net_changes'], 48)
+        self.assertEqual(stats['changes_total'], 72)
+        self.assertEqual(stats['prs_total'], 2)
+        self.assertEqual(stats['issues_total'], 3)
+
+        empty = _filter_velocity(soa, (date(2025, 1, 1), date(2025, 2, 1)))
+        self.assertIsNone(_velocity_summary(empty))
+
+    def test_metrics_fingerprint_tracks_content(self):
+        """Test the cache fingerprint changes only when the metrics content changes."""
+        fingerprint = _metrics_fingerprint(self.metrics)
+        self.assertEqual(fingerprint, _metrics_fingerprint(ProductivityMetrics.from_dict(self.metrics.to_dict())))
+
+        changed = ProductivityMetrics.from_dict(self.metrics.to_dict())
+        changed.velocity_trends[0].commits += 1
+        self.assertNotEqual(fingerprint, _metrics_fingerprint(changed))
+
+    def test_metrics_fingerprint_computed_once_per_object(self):
+        """Test the fingerprint is hashed once per metrics object."""
+        with patch('components.visualizations.hashlib.blake2b', wraps=hashlib.blake2b) as mock_blake2b:
+            fingerprint = _metrics_fingerprint(self.metrics)
+            self.assertEqual(_metrics_fingerprint(self.metrics), fingerprint)
+
+        mock_blake2b.assert_called_once()
+
+    def test_metrics_view_reused_per_content(self):
+        """Test the derived view is built once per metrics content."""
+        view = _metrics_view(self.metrics)
+
+        self.assertIs(_metrics_view(self.metrics), view)
+        self.assertEqual(view.start_d, date(2024, 1, 1))
+        self.assertEqual(view.end_d, date(2024, 1, 11))
+        np.testing.assert_array_equal(view.velocity['commits'], np.arange(1, 11))
+
+        # An equal copy shares the view
+        other = ProductivityMetrics.from_dict(self.metrics.to_dict())
+        self.assertIs(_metrics_view(other), view)
+
+        # Different content gets its own view
+        changed = ProductivityMetrics.from_dict(self.metrics.to_dict())
+        changed.velocity_trends[0].commits += 1
+        refreshed = _metrics_view(changed)
+        self.assertIsNot(refreshed, view)
+        self.assertEqual(refreshed.velocity['commits'].sum(), view.velocity['commits'].sum() + 1)
+
+    def test_charts_use_sorted_arrays(self):
+        """Test chart builders plot the sorted, filtered series."""
+        date_range = (date(2024, 1, 2), date(2024, 1, 8))
+
+        commit_fig = create_commit_frequency_chart(self.metrics, date_range)
+        self.assertEqual(list(commit_fig.data[0].y), [2, 3, 4, 5, 6, 7, 8])
+
+        volume_fig = create_code_volume_chart(self.metrics, date_range)
+        self.assertEqual(list(volume_fig.data[2].y), [8 * i for i in range(1, 8)])
+
+        overview_fig = create_velocity_overview_chart(self.metrics, date_range)
+        self.assertEqual(len(overview_fig.data), 4)
+        self.assertEqual(list(overview_fig.data[3].y), [12 * i for i in range(1, 8)])
+
+    def test_long_series_use_webgl_traces(self):
+        """Test long series switch to Scattergl while short series stay SVG."""
+        self.assertEqual(create_commit_frequency_chart(self.metrics).data[0].type, 'scatter')
+
+        long_metrics = replace(self.metrics, velocity_trends=[
+            VelocityPoint(
+                timestamp=self.base_time + timedelta(hours=i),
+                commits=1, additions=1, deletions=1, pull_requests=0, issues_closed=0
+            )
+            for i in range(2500)
+        ])
+        self.assertTrue(all(trace.type == 'scattergl'
+                            for trace in create_velocity_overview_chart(long_metrics).data))
+
+    def test_empty_metrics_return_placeholder_figure(self):
+        """Test charts without velocity data show the shared placeholder figure."""
+        self.metrics.velocity_trends = []
+
+        fig = create_commit_frequency_chart(self.metrics)
+        self.assertEqual(len(fig.data), 0)
+        self.assertEqual(fig.layout.title.text, "Commit Frequency Trends")
+        self.assertEqual(fig.layout.annotations[0].text, "No velocity data available")
+
+    def test_commit_moving_average(self):
+        """Test the trend line uses a trailing window with partial windows at the start."""
+        fig = create_commit_frequency_chart(self.metrics)
+        moving_avg = fig.data[1].y
+
+        self.assertEqual(fig.data[1].name, '7-Day Average')
+        self.assertAlmostEqual(moving_avg[0], 1.0)
+        self.assertAlmostEqual(moving_avg[2], 2.0)
+        self.assertAlmostEqual(moving_avg[6], 4.0)
+        self.assertAlmostEqual(moving_avg[9], 7.0)
+
+    def test_metric_insights(self):
+        """Test insight rules fire above the high and below the low thresholds."""
+        # 55 commits over 5 PRs is above the 10 commits-per-PR threshold
+        self.assertEqual(len(_metric_insights(self.metrics)), 1)
+        self.assertIn("Large PRs", _metric_insights(self.metrics)[0])
+
+        self.metrics.pr_metrics.merge_rate = 90.0
+        self.metrics.review_metrics.review_participation_rate = 20.0
+        self.metrics.commit_metrics.total_commits = 0
+        insights = _metric_insights(self.metrics)
+
+        self.assertEqual(len(insights), 2)
+        self.assertIn("Excellent PR merge rate", insights[0])
+        self.assertIn("Low review participation", insights[1])
+
+
+class TestFastMath(unittest.TestCase):
+    """Test cases for the numeric chart kernels."""
+
+    def test_moving_average_partial_windows(self):
+        """Test the moving average uses partial windows at the start of the series."""
+        values = np.array([2, 4, 6, 8, 10], dtype=np.int64)
+        expected = [2.0, 3.0, 4.0, 6.0, 8.0]
+
+        np.testing.assert_allclose(_fastmath.moving_average(values, 3), expected)
+        np.testing.assert_allclose(_fastmath._moving_average_pandas(values, 3), expected)
+
+    def test_moving_average_matches_pandas_fallback(self):
+        """Test the compiled kernel (when available) matches the pandas fallback."""
+        values = np.random.default_rng(0).integers(0, 50, size=500)
+
+        np.testing.assert_allclose(
+            _fastmath.moving_average(values, 7),
+            _fastmath._moving_average_pandas(values, 7)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,19 +5,25 @@ This module provides AI-powered analysis and insights generation using OpenAI's
 It includes prompt management, productivity analysis, and user question answering functionality.
 """
 
+import asyncio
 import json
 import logging
+import threading
+import time
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import asdict
 
-from openai import OpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, OpenAI
 from openai.types.chat import ChatCompletion
 
 from models.config import OpenAICredentials
 from models.metrics import ProductivityMetrics, AnalysisReport, Anomaly
-from utils.error_handler import error_handler, with_error_handling, safe_execute
+from utils.error_handler import error_handler, safe_execute
 
+# Upper bound on analysis requests in flight at once on the async client
+MAX_CONCURRENT_REQUESTS = 4
 
 class PromptManager:
     """Manages structured prompts for productivity analysis."""
@@ -126,6 +132,22 @@ Format as JSON:
     "predictions": ["prediction 1", "prediction 2"],
     "confidence_score": 0.80
 }}
+"""
+    
+    @staticmethod
+    def get_combined_analysis_prompt(metrics: ProductivityMetrics) -> str:
+        """Generate one prompt covering the productivity and trend analyses."""
+        return f"""
+Answer both of the following analysis requests in a single response.
+
+REQUEST "summary":
+{PromptManager.get_productivity_analysis_prompt(metrics)}
+
+REQUEST "trends":
+{PromptManager.get_trend_analysis_prompt(metrics)}
+
+Format your response as one JSON object with exactly two keys, "summary" and "trends",
+each holding the JSON structure requested above.
 """
     
     @staticmethod
@@ -226,110 +248,212 @@ class ChatGPTAnalyzer:
         )
         self.prompt_manager = PromptManager()
         self.logger = logging.getLogger(__name__)
+        
+        # Async client and the event loop it lives on, created on first use
+        self._async_openai: Optional[AsyncOpenAI] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
+    def _completion_request(self, prompt: str) -> Dict[str, Any]:
+        """Build the chat completion arguments shared by the sync and async calls."""
+        return {
+            'model': self.credentials.model,
+            'messages': [
+                {
+                    "role": "system",
+                    "content": "You are a senior software engineering productivity analyst with expertise in GitHub metrics and developer performance analysis."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            'max_tokens': self.credentials.max_tokens,
+            'temperature': self.credentials.temperature,
+            'response_format': {"type": "json_object"}
+        }
+    
+    def _retry_delay(self, error: Exception, attempt: int, max_retries: int) -> float:
+        """
+        Decide how long to wait before retrying a failed API call.
+        
+        Args:
+            error: Exception raised by the attempt
+            attempt: Zero-based index of the failed attempt
+            max_retries: Total number of attempts allowed
+            
+        Returns:
+            Seconds to wait before the next attempt
+            
+        Raises:
+            Exception: The original error, when it should not be retried
+        """
+        self.logger.warning(f"API call attempt {attempt + 1} failed: {str(error)}")
+        
+        # Handle specific OpenAI errors
+        error_str = str(error).lower()
+        if 'rate limit' in error_str and attempt < max_retries - 1:
+            # Wait longer for rate limit errors
+            wait_time = (2 ** attempt) * 5  # 5, 10, 20 seconds
+            self.logger.info(f"Rate limit hit, waiting {wait_time} seconds...")
+            return wait_time
+        elif 'quota' in error_str or 'billing' in error_str or attempt == max_retries - 1:
+            # Don't retry quota/billing errors or the last attempt
+            error_handler.handle_openai_api_error(error, "api_call")
+            raise error
+        
+        # Wait before retry for other errors
+        return 2 ** attempt
     
     def _make_api_call(self, prompt: str, max_retries: int = 3) -> Optional[str]:
         """Make API call to ChatGPT with retry logic and enhanced error handling."""
         for attempt in range(max_retries):
             try:
                 response: ChatCompletion = self.client.chat.completions.create(
-                    model=self.credentials.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a senior software engineering productivity analyst with expertise in GitHub metrics and developer performance analysis."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    max_tokens=self.credentials.max_tokens,
-                    temperature=self.credentials.temperature,
-                    response_format={"type": "json_object"}
+                    **self._completion_request(prompt)
                 )
                 
                 return response.choices[0].message.content
                 
             except Exception as e:
-                self.logger.warning(f"API call attempt {attempt + 1} failed: {str(e)}")
+                time.sleep(self._retry_delay(e, attempt, max_retries))
+        
+        return None
+    
+    async def _make_api_call_async(self, prompt: str, max_retries: int = 3) -> Optional[str]:
+        """Async counterpart of _make_api_call, limited to MAX_CONCURRENT_REQUESTS in flight."""
+        client = self._async_client()
+        for attempt in range(max_retries):
+            try:
+                async with self._request_slots:
+                    response: ChatCompletion = await client.chat.completions.create(
+                        **self._completion_request(prompt)
+                    )
+                
+                return response.choices[0].message.content
                 
-                # Handle specific OpenAI errors
-                error_str = str(e).lower()
-                if 'rate limit' in error_str and attempt < max_retries - 1:
-                    # Wait longer for rate limit errors
-                    wait_time = (2 ** attempt) * 5  # 5, 10, 20 seconds
-                    self.logger.info(f"Rate limit hit, waiting {wait_time} seconds...")
-                    import time
-                    time.sleep(wait_time)
-                    continue
-                elif 'quota' in error_str or 'billing' in error_str:
-                    # Don't retry quota/billing errors
-                    error_handler.handle_openai_api_error(e, "api_call")
-                    raise
-                elif attempt == max_retries - 1:
-                    # Last attempt failed
-                    error_handler.handle_openai_api_error(e, "api_call")
-                    raise
-                else:
-                    # Wait before retry for other errors
-                    wait_time = 2 ** attempt
-                    import time
-                    time.sleep(wait_time)
+            except Exception as e:
+                # Back off without holding a request slot
+                await asyncio.sleep(self._retry_delay(e, attempt, max_retries))
         
         return None
     
-    @with_error_handling(context="ChatGPTAnalyzer.analyze_productivity_trends")
-    def analyze_productivity_trends(self, metrics: ProductivityMetrics) -> AnalysisReport:
-        """Generate comprehensive productivity analysis and insights."""
+    def analyze_productivity_trends(self, metrics: ProductivityMetrics, fallback: bool = True) -> AnalysisReport:
+        """
+        Generate comprehensive productivity analysis and insights.
+        
+        Args:
+            metrics: ProductivityMetrics to analyze
+            fallback: Return a basic report built from the metrics when the request
+                or parsing fails; when False the error is raised instead, so callers
+                that persist results never store a fallback
+            
+        Returns:
+            AnalysisReport from the model, or the fallback report
+        """
         try:
             prompt = self.prompt_manager.get_productivity_analysis_prompt(metrics)
-            response_text = self._make_api_call(prompt)
-            
-            if not response_text:
-                # Create fallback report
-                return self._create_fallback_analysis_report(metrics)
-            
-            # Parse JSON response
-            try:
-                response_data = json.loads(response_text)
-            except json.JSONDecodeError as e:
-                self.logger.error(f"Failed to parse ChatGPT response as JSON: {str(e)}")
-                return self._create_fallback_analysis_report(metrics)
-            
-            # Extract anomalies if present
-            anomalies = []
-            for anomaly_data in response_data.get('anomalies', []):
-                try:
-                    anomaly = Anomaly(
-                        metric_name=anomaly_data.get('metric_name', 'unknown'),
-                        timestamp=datetime.now(),  # Current time for analysis
-                        expected_value=0.0,  # Will be set by anomaly detection
-                        actual_value=0.0,   # Will be set by anomaly detection
-                        severity=anomaly_data.get('severity', 'LOW'),
-                        description=anomaly_data.get('description', 'No description available')
-                    )
-                    anomalies.append(anomaly)
-                except Exception as e:
-                    self.logger.warning(f"Failed to parse anomaly data: {str(e)}")
-                    continue
-            
-            # Create analysis report with validation
-            report = AnalysisReport(
-                generated_at=datetime.now(),
-                summary=response_data.get('summary', 'Analysis completed successfully'),
-                key_insights=response_data.get('key_insights', []),
-                recommendations=response_data.get('recommendations', []),
-                anomalies=anomalies,
-                confidence_score=max(0.0, min(1.0, response_data.get('confidence_score', 0.8)))
-            )
+            return self._parse_productivity_analysis(self._make_api_call(prompt))
             
-            self.logger.info("Successfully generated productivity analysis")
-            return report
+        except Exception as e:
+            if not fallback:
+                raise
+            error_handler.handle_openai_api_error(e, "analyze_productivity_trends")
+            return self._create_fallback_analysis_report(metrics)
+    
+    async def analyze_productivity_trends_async(self, metrics: ProductivityMetrics,
+                                                fallback: bool = True) -> AnalysisReport:
+        """Async counterpart of analyze_productivity_trends."""
+        try:
+            prompt = self.prompt_manager.get_productivity_analysis_prompt(metrics)
+            return self._parse_productivity_analysis(await self._make_api_call_async(prompt))
             
         except Exception as e:
+            if not fallback:
+                raise
             error_handler.handle_openai_api_error(e, "analyze_productivity_trends")
             return self._create_fallback_analysis_report(metrics)
     
+    def _parse_productivity_analysis(self, response_text: Optional[str]) -> AnalysisReport:
+        """Build the analysis report from a productivity analysis response."""
+        if not response_text:
+            raise ValueError("Failed to get response from ChatGPT API")
+        
+        # Parse JSON response
+        try:
+            response_data = json.loads(response_text)
+        except json.JSONDecodeError as e:
+            self.logger.error(f"Failed to parse ChatGPT response as JSON: {str(e)}")
+            raise
+        
+        report = self._build_analysis_report(response_data)
+        
+        self.logger.info("Successfully generated productivity analysis")
+        return report
+    
+    def _build_analysis_report(self, response_data: Dict[str, Any]) -> AnalysisReport:
+        """Create an analysis report from a parsed productivity analysis response."""
+        # Extract anomalies if present
+        anomalies = []
+        for anomaly_data in response_data.get('anomalies', []):
+            try:
+                anomaly = Anomaly(
+                    metric_name=anomaly_data.get('metric_name', 'unknown'),
+                    timestamp=datetime.now(),  # Current time for analysis
+                    expected_value=0.0,  # Will be set by anomaly detection
+                    actual_value=0.0,   # Will be set by anomaly detection
+                    severity=anomaly_data.get('severity', 'LOW'),
+                    description=anomaly_data.get('description', 'No description available')
+                )
+                anomalies.append(anomaly)
+            except Exception as e:
+                self.logger.warning(f"Failed to parse anomaly data: {str(e)}")
+                continue
+        
+        # Create analysis report with validation
+        return AnalysisReport(
+            generated_at=datetime.now(),
+            summary=response_data.get('summary', 'Analysis completed successfully'),
+            key_insights=response_data.get('key_insights', []),
+            recommendations=response_data.get('recommendations', []),
+            anomalies=anomalies,
+            confidence_score=max(0.0, min(1.0, response_data.get('confidence_score', 0.8)))
+        )
+    
+    def generate_combined_analysis(self, metrics: ProductivityMetrics) -> Tuple[AnalysisReport, Dict[str, Any]]:
+        """
+        Generate the productivity analysis and trend analysis with one API call.
+        
+        Both requests share the metrics context, so one completion replaces the
+        separate analyze_productivity_trends and analyze_trends round-trips.
+        
+        Args:
+            metrics: ProductivityMetrics to analyze
+            
+        Returns:
+            Tuple of the analysis report and the trend analysis dictionary
+        """
+        prompt = self.prompt_manager.get_combined_analysis_prompt(metrics)
+        return self._parse_combined_analysis(self._make_api_call(prompt))
+    
+    async def generate_combined_analysis_async(self, metrics: ProductivityMetrics) -> Tuple[AnalysisReport, Dict[str, Any]]:
+        """Async counterpart of generate_combined_analysis."""
+        prompt = self.prompt_manager.get_combined_analysis_prompt(metrics)
+        return self._parse_combined_analysis(await self._make_api_call_async(prompt))
+    
+    def _parse_combined_analysis(self, response_text: Optional[str]) -> Tuple[AnalysisReport, Dict[str, Any]]:
+        """Split a combined analysis response into the report and the trend analysis."""
+        if not response_text:
+            raise ValueError("Failed to get response from ChatGPT API")
+        
+        response_data = json.loads(response_text)
+        if not isinstance(response_data.get('summary'), dict) or not isinstance(response_data.get('trends'), dict):
+            raise ValueError("Combined analysis response is missing the summary or trends section")
+        
+        self.logger.info("Successfully generated combined productivity analysis")
+        return self._build_analysis_report(response_data['summary']), response_data['trends']
+    
     def _create_fallback_analysis_report(self, metrics: ProductivityMetrics) -> AnalysisReport:
         """Create a fallback analysis report when AI analysis fails."""
         # Generate basic insights based on metrics
@@ -373,40 +497,74 @@ class ChatGPTAnalyzer:
             confidence_score=0.6  # Lower confidence for fallback analysis
         )
     
-    def identify_anomalies(self, metrics: ProductivityMetrics) -> List[Anomaly]:
-        """Identify anomalies and unusual patterns in productivity data."""
+    def identify_anomalies(self, metrics: ProductivityMetrics, fallback: bool = True) -> List[Anomaly]:
+        """
+        Identify anomalies and unusual patterns in productivity data.
+        
+        Args:
+            metrics: ProductivityMetrics to analyze
+            fallback: Return an empty list when the request or parsing fails;
+                when False the error is raised instead
+            
+        Returns:
+            List of anomalies found by the model
+        """
         try:
             prompt = self.prompt_manager.get_anomaly_detection_prompt(metrics)
-            response_text = self._make_api_call(prompt)
-            
-            if not response_text:
-                raise ValueError("Failed to get response from ChatGPT API")
-            
-            response_data = json.loads(response_text)
-            anomalies = []
-            
-            for anomaly_data in response_data.get('anomalies', []):
-                anomaly = Anomaly(
-                    metric_name=anomaly_data['metric_name'],
-                    timestamp=datetime.fromisoformat(anomaly_data['date']) if 'date' in anomaly_data else datetime.now(),
-                    expected_value=anomaly_data.get('expected_value', 0.0),
-                    actual_value=anomaly_data.get('actual_value', 0.0),
-                    severity=anomaly_data['severity'],
-                    description=anomaly_data['description']
-                )
-                anomalies.append(anomaly)
+            return self._parse_anomalies(self._make_api_call(prompt))
             
-            self.logger.info(f"Identified {len(anomalies)} anomalies")
-            return anomalies
+        except json.JSONDecodeError as e:
+            self.logger.error(f"Failed to parse anomaly detection response: {str(e)}")
+            if not fallback:
+                raise
+            return []
+        
+        except Exception as e:
+            self.logger.error(f"Error in anomaly detection: {str(e)}")
+            if not fallback:
+                raise
+            return []
+    
+    async def identify_anomalies_async(self, metrics: ProductivityMetrics, fallback: bool = True) -> List[Anomaly]:
+        """Async counterpart of identify_anomalies."""
+        try:
+            prompt = self.prompt_manager.get_anomaly_detection_prompt(metrics)
+            return self._parse_anomalies(await self._make_api_call_async(prompt))
             
         except json.JSONDecodeError as e:
             self.logger.error(f"Failed to parse anomaly detection response: {str(e)}")
+            if not fallback:
+                raise
             return []
         
         except Exception as e:
             self.logger.error(f"Error in anomaly detection: {str(e)}")
+            if not fallback:
+                raise
             return []
     
+    def _parse_anomalies(self, response_text: Optional[str]) -> List[Anomaly]:
+        """Build the anomaly list from an anomaly detection response."""
+        if not response_text:
+            raise ValueError("Failed to get response from ChatGPT API")
+        
+        response_data = json.loads(response_text)
+        anomalies = []
+        
+        for anomaly_data in response_data.get('anomalies', []):
+            anomaly = Anomaly(
+                metric_name=anomaly_data['metric_name'],
+                timestamp=datetime.fromisoformat(anomaly_data['date']) if 'date' in anomaly_data else datetime.now(),
+                expected_value=anomaly_data.get('expected_value', 0.0),
+                actual_value=anomaly_data.get('actual_value', 0.0),
+                severity=anomaly_data['severity'],
+                description=anomaly_data['description']
+            )
+            anomalies.append(anomaly)
+        
+        self.logger.info(f"Identified {len(anomalies)} anomalies")
+        return anomalies
+    
     def generate_recommendations(self, metrics: ProductivityMetrics) -> List[str]:
         """Generate actionable recommendations for improving productivity."""
         try:
@@ -426,53 +584,199 @@ class ChatGPTAnalyzer:
         """Answer user questions about their productivity data."""
         try:
             prompt = self.prompt_manager.get_user_question_prompt(question, metrics)
-            response_text = self._make_api_call(prompt)
-            
-            if not response_text:
-                return "I'm sorry, I couldn't process your question at the moment. Please try again."
+            return self._parse_question_answer(self._make_api_call(prompt))
             
-            # For user questions, we expect a direct text response, not JSON
-            # But let's handle both cases
+        except Exception as e:
+            self.logger.error(f"Error answering user question: {str(e)}")
+            return f"I encountered an error while analyzing your question: {str(e)}"
+    
+    def _parse_question_answer(self, response_text: Optional[str]) -> str:
+        """Extract the answer text from a question response."""
+        if not response_text:
+            return "I'm sorry, I couldn't process your question at the moment. Please try again."
+        
+        # For user questions, we expect a direct text response, not JSON
+        # But let's handle both cases
+        try:
+            response_data = json.loads(response_text)
+            return response_data.get('answer', response_text)
+        except json.JSONDecodeError:
+            # Direct text response
+            return response_text
+    
+    def _async_client(self) -> AsyncOpenAI:
+        """Return the async client, created once on the analyzer's event loop."""
+        if self._async_openai is None:
             try:
-                response_data = json.loads(response_text)
-                return response_data.get('answer', response_text)
-            except json.JSONDecodeError:
-                # Direct text response
-                return response_text
+                # HTTP/2 multiplexes concurrent questions over one connection
+                http_client = DefaultAsyncHttpxClient(http2=True)
+            except ImportError:
+                # The h2 package is optional; fall back to HTTP/1.1 keep-alive
+                http_client = None
+            self._async_openai = AsyncOpenAI(
+                api_key=self.credentials.api_key,
+                organization=self.credentials.organization_id,
+                http_client=http_client
+            )
+        return self._async_openai
+    
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background event loop, starting its thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever, name="chatgpt-analyzer-loop", daemon=True
+                ).start()
+        return self._loop
+    
+    def submit_async(self, coroutine) -> Future:
+        """
+        Schedule a coroutine on the analyzer's event loop without waiting.
+        
+        Args:
+            coroutine: Coroutine from one of the *_async methods
             
+        Returns:
+            Future for the coroutine's result; cancelling it cancels the coroutine
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self._event_loop())
+    
+    def run_async(self, coroutine, timeout: float):
+        """
+        Run a coroutine on the analyzer's event loop and wait for the result.
+        
+        All async calls share one long-lived loop, so the async client keeps
+        its connections open between questions instead of reconnecting.
+        
+        Args:
+            coroutine: Coroutine from one of the *_async methods
+            timeout: Seconds to wait before the request is cancelled
+            
+        Returns:
+            The coroutine's result
+            
+        Raises:
+            TimeoutError: If no result arrived within the timeout
+        """
+        future = self.submit_async(coroutine)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"The AI service did not answer within {timeout:g} seconds")
+    
+    async def _request_answer_async(self, question: str, metrics: ProductivityMetrics) -> str:
+        """Request an answer without converting errors into answer text."""
+        prompt = self.prompt_manager.get_user_question_prompt(question, metrics)
+        return self._parse_question_answer(await self._make_api_call_async(prompt))
+    
+    async def answer_user_question_async(self, question: str, metrics: ProductivityMetrics) -> str:
+        """
+        Answer a user question without blocking the event loop.
+        
+        Args:
+            question: Question about the productivity data
+            metrics: ProductivityMetrics the question refers to
+            
+        Returns:
+            Answer text, or an error message if the request failed
+        """
+        try:
+            return await self._request_answer_async(question, metrics)
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             self.logger.error(f"Error answering user question: {str(e)}")
             return f"I encountered an error while analyzing your question: {str(e)}"
     
-    def analyze_trends(self, metrics: ProductivityMetrics) -> Dict[str, Any]:
-        """Analyze productivity trends over time."""
-        try:
-            prompt = self.prompt_manager.get_trend_analysis_prompt(metrics)
-            response_text = self._make_api_call(prompt)
+    async def answer_user_questions_async(self, questions: List[str],
+                                          metrics: ProductivityMetrics) -> Dict[str, str]:
+        """
+        Answer several user questions concurrently.
+        
+        Requests share the analyzer's request slots and retry policy, so at most
+        MAX_CONCURRENT_REQUESTS are in flight at once.
+        
+        Args:
+            questions: Questions about the productivity data
+            metrics: ProductivityMetrics the questions refer to
             
-            if not response_text:
-                raise ValueError("Failed to get response from ChatGPT API")
+        Returns:
+            Dictionary of question to answer; questions whose request failed
+            are left out so they can be asked again individually
+        """
+        results = await asyncio.gather(
+            *(self._request_answer_async(question, metrics) for question in questions),
+            return_exceptions=True
+        )
+        
+        answers = {}
+        for question, result in zip(questions, results):
+            if isinstance(result, Exception):
+                self.logger.warning(f"Failed to answer question '{question}': {str(result)}")
+            else:
+                answers[question] = result
+        return answers
+    
+    def analyze_trends(self, metrics: ProductivityMetrics, fallback: bool = True) -> Dict[str, Any]:
+        """
+        Analyze productivity trends over time.
+        
+        Args:
+            metrics: ProductivityMetrics to analyze
+            fallback: Return a placeholder analysis describing the error when the
+                request or parsing fails; when False the error is raised instead
             
-            response_data = json.loads(response_text)
+        Returns:
+            Trend analysis dictionary
+        """
+        try:
+            prompt = self.prompt_manager.get_trend_analysis_prompt(metrics)
+            return self._parse_trend_analysis(self._make_api_call(prompt))
             
-            self.logger.info("Successfully analyzed productivity trends")
-            return response_data
+        except Exception as e:
+            if not fallback:
+                raise
+            return self._trend_analysis_error(e)
+    
+    async def analyze_trends_async(self, metrics: ProductivityMetrics, fallback: bool = True) -> Dict[str, Any]:
+        """Async counterpart of analyze_trends."""
+        try:
+            prompt = self.prompt_manager.get_trend_analysis_prompt(metrics)
+            return self._parse_trend_analysis(await self._make_api_call_async(prompt))
             
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Failed to parse trend analysis response: {str(e)}")
+        except Exception as e:
+            if not fallback:
+                raise
+            return self._trend_analysis_error(e)
+    
+    def _parse_trend_analysis(self, response_text: Optional[str]) -> Dict[str, Any]:
+        """Parse a trend analysis response."""
+        if not response_text:
+            raise ValueError("Failed to get response from ChatGPT API")
+        
+        response_data = json.loads(response_text)
+        
+        self.logger.info("Successfully analyzed productivity trends")
+        return response_data
+    
+    def _trend_analysis_error(self, error: Exception) -> Dict[str, Any]:
+        """Build the trend analysis returned when the request or parsing failed."""
+        if isinstance(error, json.JSONDecodeError):
+            self.logger.error(f"Failed to parse trend analysis response: {str(error)}")
             return {
                 "trend_direction": "stable",
                 "key_patterns": ["Unable to analyze trends at this time"],
                 "confidence_score": 0.0
             }
         
-        except Exception as e:
-            self.logger.error(f"Error in trend analysis: {str(e)}")
-            return {
-                "trend_direction": "unknown",
-                "key_patterns": [f"Analysis error: {str(e)}"],
-                "confidence_score": 0.0
-            }
+        self.logger.error(f"Error in trend analysis: {str(error)}")
+        return {
+            "trend_direction": "unknown",
+            "key_patterns": [f"Analysis error: {str(error)}"],
+            "confidence_score": 0.0
+        }
     
     def validate_credentials(self) -> bool:
         """Validate OpenAI API credentials by making a test call."""
@@ -504,8 +808,25 @@ class ProductivityInsightGenerator:
         self.analyzer = analyzer
         self.logger = logging.getLogger(__name__)
     
-    def generate_comprehensive_insights(self, metrics: ProductivityMetrics) -> Dict[str, Any]:
-        """Generate comprehensive insights combining multiple analysis types."""
+    def generate_comprehensive_insights(self, metrics: ProductivityMetrics,
+                                        analysis_report: Optional[AnalysisReport] = None,
+                                        trend_analysis: Optional[Dict[str, Any]] = None,
+                                        fallback: bool = True) -> Dict[str, Any]:
+        """
+        Generate comprehensive insights combining multiple analysis types.
+        
+        Args:
+            metrics: ProductivityMetrics to analyze
+            analysis_report: Productivity analysis already generated for these
+                metrics; requested from the API when omitted
+            trend_analysis: Trend analysis already generated for these metrics;
+                requested from the API when omitted
+            fallback: Fill in fallbacks and record the error in the result when
+                an analysis fails; when False the error is raised instead
+            
+        Returns:
+            Dictionary of overview, trends, anomalies, recommendations and scores
+        """
         insights = {
             'overview': {},
             'trends': {},
@@ -517,7 +838,8 @@ class ProductivityInsightGenerator:
         
         try:
             # Get main analysis report
-            analysis_report = self.analyzer.analyze_productivity_trends(metrics)
+            if analysis_report is None:
+                analysis_report = self.analyzer.analyze_productivity_trends(metrics, fallback=fallback)
             insights['overview'] = {
                 'summary': analysis_report.summary,
                 'key_insights': analysis_report.key_insights,
@@ -527,7 +849,8 @@ class ProductivityInsightGenerator:
             insights['anomalies'] = [anomaly.to_dict() for anomaly in analysis_report.anomalies]
             
             # Get trend analysis
-            trend_analysis = self.analyzer.analyze_trends(metrics)
+            if trend_analysis is None:
+                trend_analysis = self.analyzer.analyze_trends(metrics, fallback=fallback)
             insights['trends'] = trend_analysis
             
             # Calculate performance score
@@ -541,10 +864,66 @@ class ProductivityInsightGenerator:
             
         except Exception as e:
             self.logger.error(f"Error generating comprehensive insights: {str(e)}")
+            if not fallback:
+                raise
             insights['error'] = str(e)
         
         return insights
     
+    async def generate_comprehensive_insights_async(self, metrics: ProductivityMetrics,
+                                                    fallback: bool = True) -> Dict[str, Any]:
+        """
+        Async counterpart of generate_comprehensive_insights.
+        
+        The productivity analysis and trend analysis are requested concurrently.
+        
+        Args:
+            metrics: ProductivityMetrics to analyze
+            fallback: Use fallbacks for failed analyses; when False the error is raised
+            
+        Returns:
+            Dictionary of overview, trends, anomalies, recommendations and scores
+        """
+        analysis_report, trend_analysis = await asyncio.gather(
+            self.analyzer.analyze_productivity_trends_async(metrics, fallback=fallback),
+            self.analyzer.analyze_trends_async(metrics, fallback=fallback)
+        )
+        return self.generate_comprehensive_insights(metrics, analysis_report, trend_analysis, fallback=fallback)
+    
+    async def generate_analysis_bundle_async(self, metrics: ProductivityMetrics,
+                                             fallback: bool = True) -> Dict[str, Any]:
+        """
+        Generate the summary, trend and detailed analyses from one combined request.
+        
+        If the combined response is unusable, the summary and trends are
+        requested separately so each keeps its own fallback.
+        
+        Args:
+            metrics: ProductivityMetrics to analyze
+            fallback: Use fallbacks for failed separate requests; when False
+                the error is raised instead
+            
+        Returns:
+            Dictionary with the 'summary' report, 'trends' analysis and
+            'detailed' comprehensive insights
+        """
+        try:
+            analysis_report, trend_analysis = await self.analyzer.generate_combined_analysis_async(metrics)
+        except Exception as e:
+            self.logger.warning(f"Combined analysis failed, requesting sections separately: {str(e)}")
+            analysis_report, trend_analysis = await asyncio.gather(
+                self.analyzer.analyze_productivity_trends_async(metrics, fallback=fallback),
+                self.analyzer.analyze_trends_async(metrics, fallback=fallback)
+            )
+        
+        return {
+            'summary': analysis_report,
+            'trends': trend_analysis,
+            'detailed': self.generate_comprehensive_insights(
+                metrics, analysis_report, trend_analysis, fallback=fallback
+            )
+        }
+    
     def _calculate_performance_score(self, metrics: ProductivityMetrics) -> float:
         """Calculate overall performance score based on multiple factors."""
         try:
@@ -748,7 +1127,44 @@ class ProductivityInsightGenerator:
     def generate_executive_summary(self, metrics: ProductivityMetrics) -> Dict[str, Any]:
         """Generate executive summary for management reporting."""
         try:
-            summary_prompt = f"""
+            response_text = self.analyzer._make_api_call(self._executive_summary_prompt(metrics))
+            if response_text:
+                return json.loads(response_text)
+            
+        except Exception as e:
+            self.logger.error(f"Error generating executive summary: {str(e)}")
+        
+        return self._fallback_executive_summary(metrics)
+    
+    async def generate_executive_summary_async(self, metrics: ProductivityMetrics,
+                                               fallback: bool = True) -> Dict[str, Any]:
+        """
+        Async counterpart of generate_executive_summary.
+        
+        Args:
+            metrics: ProductivityMetrics to summarize
+            fallback: Return a basic summary built from the metrics when the request
+                or parsing fails; when False the error is raised instead
+            
+        Returns:
+            Executive summary dictionary
+        """
+        try:
+            response_text = await self.analyzer._make_api_call_async(self._executive_summary_prompt(metrics))
+            if not response_text:
+                raise ValueError("Failed to get response from ChatGPT API")
+            return json.loads(response_text)
+            
+        except Exception as e:
+            self.logger.error(f"Error generating executive summary: {str(e)}")
+            if not fallback:
+                raise
+        
+        return self._fallback_executive_summary(metrics)
+    
+    def _executive_summary_prompt(self, metrics: ProductivityMetrics) -> str:
+        """Build the executive summary prompt."""
+        return f"""
 You are creating an executive summary for management about developer productivity. 
 
 METRICS SUMMARY:
@@ -774,15 +1190,9 @@ Format as JSON:
     "executive_summary": "2-3 sentence summary for executives"
 }}
 """
-            
-            response_text = self.analyzer._make_api_call(summary_prompt)
-            if response_text:
-                return json.loads(response_text)
-            
-        except Exception as e:
-            self.logger.error(f"Error generating executive summary: {str(e)}")
-        
-        # Fallback summary
+    
+    def _fallback_executive_summary(self, metrics: ProductivityMetrics) -> Dict[str, Any]:
+        """Build the executive summary used when the AI request fails."""
         return {
             "overall_assessment": "Satisfactory",
             "key_achievements": [f"Completed {metrics.commit_metrics.total_commits} commits"],
@@ -16,6 +16,31 @@ import pandas as pd
 from models.metrics import ProductivityMetrics, AnalysisReport
 from models.config import GitHubCredentials, OpenAICredentials
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps_export_json(data: Any) -> str:
+    """
+    Serialize export data as indented JSON.
+    
+    Uses orjson when it is installed and the standard library otherwise.
+    Datetimes and other non-JSON values are written with str() either way.
+    
+    Args:
+        data: JSON-compatible export structure
+        
+    Returns:
+        JSON text indented by two spaces
+    """
+    if ORJSON_AVAILABLE:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(data, default=str, option=options).decode('utf-8')
+    return json.dumps(data, indent=2, default=str)
+
 
 class CSVExporter:
     """Handles CSV export functionality for productivity metrics."""
@@ -48,7 +73,7 @@ class CSVExporter:
         
         # Export summary metrics
         output.write("## Summary Metrics\n")
-        writer = csv.writer(output)
+        writer = csv.writer(output, lineterminator='\n')
         
         # Write summary data
         summary_data = [
@@ -163,7 +188,7 @@ class CSVExporter:
             CSV content as string
         """
         output = io.StringIO()
-        writer = csv.writer(output)
+        writer = csv.writer(output, lineterminator='\n')
         
         # Write header
         output.write("# GitHub Productivity Dashboard - Velocity Trends Export\n")
@@ -212,7 +237,7 @@ class CSVExporter:
             CSV content as string
         """
         output = io.StringIO()
-        writer = csv.writer(output)
+        writer = csv.writer(output, lineterminator='\n')
         
         # Write header
         output.write("# GitHub Productivity Dashboard - Metrics Comparison\n")
@@ -646,8 +671,22 @@ class ExportManager:
         self.csv_exporter = CSVExporter()
         self.report_exporter = ReportExporter()
     
+    def export_filename_slug(self, metrics: ProductivityMetrics) -> str:
+        """
+        Create the period and timestamp part of export filenames.
+        
+        Computing it once lets every export offered together share one name stem.
+        
+        Args:
+            metrics: ProductivityMetrics for date range
+            
+        Returns:
+            Slug of the form <start>_<end>_<timestamp>
+        """
+        return f"{metrics.period_start:%Y%m%d}_{metrics.period_end:%Y%m%d}_{datetime.now():%Y%m%d_%H%M%S}"
+    
     def create_export_filename(self, export_type: str, metrics: ProductivityMetrics, 
-                             extension: str) -> str:
+                             extension: str, slug: Optional[str] = None) -> str:
         """
         Create standardized filename for exports.
         
@@ -655,15 +694,14 @@ class ExportManager:
             export_type: Type of export (metrics, analysis, etc.)
             metrics: ProductivityMetrics for date range
             extension: File extension
+            slug: Result of export_filename_slug() to reuse; computed when omitted
             
         Returns:
             Formatted filename
         """
-        start_date = metrics.period_start.strftime('%Y%m%d')
-        end_date = metrics.period_end.strftime('%Y%m%d')
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        slug = slug or self.export_filename_slug(metrics)
         
-        return f"github_productivity_{export_type}_{start_date}_{end_date}_{timestamp}.{extension}"
+        return f"github_productivity_{export_type}_{slug}.{extension}"
     
     def get_export_metadata(self, metrics: ProductivityMetrics, 
                           additional_info: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -1237,8 +1275,22 @@ class ExportManager:
         self.viz_exporter = VisualizationExporter()
         self.pdf_exporter = PDFExporter()
     
+    def export_filename_slug(self, metrics: ProductivityMetrics) -> str:
+        """
+        Create the period and timestamp part of export filenames.
+        
+        Computing it once lets every export offered together share one name stem.
+        
+        Args:
+            metrics: ProductivityMetrics for date range
+            
+        Returns:
+            Slug of the form <start>_<end>_<timestamp>
+        """
+        return f"{metrics.period_start:%Y%m%d}_{metrics.period_end:%Y%m%d}_{datetime.now():%Y%m%d_%H%M%S}"
+    
     def create_export_filename(self, export_type: str, metrics: ProductivityMetrics, 
-                             extension: str) -> str:
+                             extension: str, slug: Optional[str] = None) -> str:
         """
         Create standardized filename for exports.
         
@@ -1246,15 +1298,14 @@ class ExportManager:
             export_type: Type of export (metrics, analysis, etc.)
             metrics: ProductivityMetrics for date range
             extension: File extension
+            slug: Result of export_filename_slug() to reuse; computed when omitted
             
         Returns:
             Formatted filename
         """
-        start_date = metrics.period_start.strftime('%Y%m%d')
-        end_date = metrics.period_end.strftime('%Y%m%d')
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        slug = slug or self.export_filename_slug(metrics)
         
-        return f"github_productivity_{export_type}_{start_date}_{end_date}_{timestamp}.{extension}"
+        return f"github_productivity_{export_type}_{slug}.{extension}"
     
     def get_export_metadata(self, metrics: ProductivityMetrics, 
                           additional_info: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
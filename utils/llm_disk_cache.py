@@ -0,0 +1,129 @@
+"""
+Persistent cache for AI analysis results in GitHub Productivity Dashboard.
+
+This module stores generated analyses in a local SQLite database so that a
+new browser session asking for the same analysis reads it from disk instead
+of calling the OpenAI API again.
+"""
+
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Optional, Union
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / ".cache" / "llm_cache.sqlite3"
+
+# Payloads above this size are zlib-compressed before being stored
+COMPRESS_THRESHOLD = 4096
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL,
+    compressed INTEGER NOT NULL,
+    payload BLOB NOT NULL
+)
+"""
+
+
+def make_key(**parts: Any) -> str:
+    """
+    Build a deterministic cache key from named parts.
+
+    Args:
+        **parts: JSON-serializable values identifying the cached result;
+            dates and other objects are serialized with str()
+
+    Returns:
+        str: SHA256 hex digest of the parts
+    """
+    encoded = json.dumps(parts, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class LLMDiskCache:
+    """SQLite-backed key/value store for pickled AI analysis results."""
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_CACHE_PATH):
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            path: Location of the SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # One connection shared by all Streamlit sessions, serialized by a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            The stored value, or None if missing or expired
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires_at, compressed, payload FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        expires_at, compressed, payload = row
+        if expires_at < time.time():
+            self.delete(key)
+            return None
+
+        if compressed:
+            payload = zlib.decompress(payload)
+        try:
+            return pickle.loads(payload)
+        except Exception:
+            # Rows written by an incompatible version of the models are dropped
+            self.delete(key)
+            return None
+
+    def set(self, key: str, value: Any, ttl_days: float = 7) -> None:
+        """
+        Store a value, replacing any existing entry for the key.
+
+        Args:
+            key: Cache key from make_key()
+            value: Picklable value to store
+            ttl_days: Number of days before the entry expires
+        """
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        compressed = len(payload) > COMPRESS_THRESHOLD
+        if compressed:
+            payload = zlib.compress(payload)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, expires_at, compressed, payload) VALUES (?, ?, ?, ?)",
+                (key, time.time() + ttl_days * 86400, int(compressed), payload)
+            )
+
+    def delete(self, key: str) -> None:
+        """
+        Remove an entry if present.
+
+        Args:
+            key: Cache key from make_key()
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
@@ -162,15 +162,9 @@ class FeedbackManager:
             
             yield update_progress
             
-            # Success state
+            # Success state; callers report the outcome themselves, so the
+            # progress UI is cleared right away rather than held with a sleep
             self.set_loading_state(operation, LoadingState.SUCCESS, "Completed successfully")
-            if status_text:
-                status_text.text("✅ Completed successfully!")
-            if progress_bar:
-                progress_bar.progress(1.0)
-            
-            # Clean up UI elements after a brief delay
-            time.sleep(0.5)
             if progress_bar:
                 progress_bar.empty()
             if status_text: